@@ -0,0 +1,188 @@
+import argparse
+import multiprocessing
+import os
+import time
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+import librosa
+import numpy
+
+from realtime_voice_conversion.config import Config
+from realtime_voice_conversion.converter.yukarin_converter import YukarinConverter
+from realtime_voice_conversion.stream import EncodeStream, ConvertStream, DecodeStream
+from realtime_voice_conversion.yukarin_wrapper.vocoder import Vocoder
+from realtime_voice_conversion.yukarin_wrapper.voice_changer import VoiceChanger
+
+_models: Optional[Tuple[Vocoder, VoiceChanger]] = None
+
+
+def _initialize(config_path: Path):
+    """
+    load the models once per process.
+    """
+    global _models
+
+    config = Config.from_yaml(config_path)
+    converter = YukarinConverter.make_yukarin_converter(
+        input_statistics_path=config.input_statistics_path,
+        target_statistics_path=config.target_statistics_path,
+        stage1_model_path=config.stage1_model_path,
+        stage1_config_path=config.stage1_config_path,
+        stage2_model_path=config.stage2_model_path,
+        stage2_config_path=config.stage2_config_path,
+        gpu=config.gpu,
+        inference_backend=config.inference_backend,
+        stage1_onnx_path=config.stage1_onnx_path,
+        stage2_onnx_path=config.stage2_onnx_path,
+        model_cache_path=config.model_cache_path,
+    )
+    vocoder = Vocoder(
+        acoustic_param=converter.acoustic_converter.config.dataset.acoustic_param,
+        out_sampling_rate=config.output_rate,
+        extract_f0_mode=config.extract_f0_mode,
+    )
+    voice_changer = VoiceChanger(
+        acoustic_converter=converter.acoustic_converter,
+        super_resolution=converter.super_resolution,
+        threshold=config.input_silent_threshold,
+        output_sampling_rate=config.output_rate,
+    )
+    _models = (vocoder, voice_changer)
+
+
+def _create_streams():
+    """
+    fresh streams for each file, as every file starts at time 0.
+    """
+    assert _models is not None
+
+    vocoder, voice_changer = _models
+    return (
+        EncodeStream(vocoder=vocoder),
+        ConvertStream(voice_changer=voice_changer),
+        DecodeStream(vocoder=vocoder),
+    )
+
+
+def _convert(paths: Tuple[Path, Path]):
+    """
+    :return: input path, time length, process time, and the error message if the conversion failed.
+    """
+    input_path, output_path = paths
+    if output_path.exists():
+        return input_path, 0., 0., None  # resume
+
+    start = time.time()
+
+    streams = _create_streams()
+    encode_stream = streams[0]
+    time_length = 0.
+    try:
+        wave, _ = librosa.load(str(input_path), sr=encode_stream.in_segment_method.sampling_rate)
+        time_length = len(wave) / encode_stream.in_segment_method.sampling_rate
+
+        # join mode: the whole file is one segment of each stream
+        data: Any = wave  # wave, feature and wave again
+        for stream in streams:
+            stream.add(start_time=0, data=data)
+            data = stream.process(start_time=0, time_length=time_length, extra_time=0)
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = output_path.with_name(output_path.name + '.tmp')
+        librosa.output.write_wav(str(temp_path), data.astype(numpy.float32), streams[2].out_segment_method.sampling_rate)
+        os.replace(temp_path, output_path)
+    except Exception as e:
+        return input_path, time_length, time.time() - start, f'{type(e).__name__}: {e}'
+
+    return input_path, time_length, time.time() - start, None
+
+
+def _input_paths(input_path: Path, glob: str) -> Tuple[Path, List[Path]]:
+    """
+    :return: the root directory that the output directory mirrors, and the input paths.
+    """
+    if input_path.is_dir():
+        return input_path, sorted(input_path.glob(glob))
+    else:
+        paths = [Path(line) for line in input_path.read_text().splitlines() if len(line.strip()) > 0]
+        root = Path(os.path.commonpath([str(p.absolute().parent) for p in paths])) if len(paths) > 0 else Path()
+        return root, paths
+
+
+def _output_paths(root: Path, paths: List[Path], output_dir: Path) -> List[Path]:
+    """
+    mirror the relative paths of the inputs under the output directory, so files of the same name do not collide.
+    """
+    output_paths = [
+        output_dir / path.absolute().relative_to(root.absolute()).with_suffix('.wav')
+        for path in paths
+    ]
+
+    duplicates = sorted(set(p for p in output_paths if output_paths.count(p) > 1))
+    if len(duplicates) > 0:
+        raise ValueError(f'inputs are converted to the same output path: {", ".join(map(str, duplicates))}')
+    return output_paths
+
+
+def batch(
+        config_path: Path,
+        input_path: Path,
+        glob: str,
+        output_dir: Path,
+        num_process: int,
+):
+    root, paths = _input_paths(input_path, glob)
+    output_paths = _output_paths(root, paths, output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    start = time.time()
+    num_converted = 0
+    total_time_length = 0.
+    total_process_time = 0.
+    failed_paths: List[Path] = []
+    with multiprocessing.Pool(
+            processes=num_process,
+            initializer=_initialize,
+            initargs=(config_path,),
+    ) as pool:
+        results = pool.imap_unordered(_convert, zip(paths, output_paths))
+        for i, (path, time_length, process_time, error) in enumerate(results):
+            if error is not None:
+                failed_paths.append(path)
+                print(f'{i + 1}/{len(paths)}\t{path}\tfailed: {error}')
+                continue
+
+            if process_time > 0:
+                num_converted += 1
+                total_time_length += time_length
+                total_process_time += process_time
+            print(f'{i + 1}/{len(paths)}\t{path}\t{process_time:.2f}s')
+
+    elapsed = time.time() - start
+    num_skipped = len(paths) - num_converted - len(failed_paths)
+    print(f'converted: {num_converted}, skipped: {num_skipped}, failed: {len(failed_paths)}')
+    for path in failed_paths:
+        print(f'failed: {path}')
+    if num_converted > 0:
+        print(f'files/s: {num_converted / elapsed:.3f}')
+        print(f'rtf per process: {total_process_time / total_time_length:.3f}')
+        print(f'rtf overall: {elapsed / total_time_length:.3f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--config_path', type=Path, default=Path('./config.yaml'))
+    parser.add_argument('--input_path', type=Path, help='directory of input files, or text file listing input paths')
+    parser.add_argument('--glob', default='*.wav')
+    parser.add_argument('--output_dir', type=Path, default=Path('./output'))
+    parser.add_argument('--num_process', type=int, default=multiprocessing.cpu_count())
+    args = parser.parse_args()
+
+    batch(
+        config_path=args.config_path,
+        input_path=args.input_path,
+        glob=args.glob,
+        output_dir=args.output_dir,
+        num_process=args.num_process,
+    )
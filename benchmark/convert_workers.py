@@ -0,0 +1,152 @@
+import argparse
+import time
+from multiprocessing import Process, Lock, Queue
+from pathlib import Path
+from typing import Dict, List
+
+import librosa
+import numpy
+
+from realtime_voice_conversion.config import Config
+from realtime_voice_conversion.converter.yukarin_converter import YukarinConverter
+from realtime_voice_conversion.stream import EncodeStream, StreamWrapper
+from realtime_voice_conversion.worker import convert_worker
+from realtime_voice_conversion.worker.utility import Item, DispatchQueue, context_chunks
+from realtime_voice_conversion.yukarin_wrapper.vocoder import Vocoder
+
+
+def _encode(config: Config, vocoder: Vocoder, wave: numpy.ndarray):
+    """
+    features of each chunk, in the form the encode worker sends.
+    """
+    time_length = config.buffer_time
+    stream_wrapper = StreamWrapper(
+        stream=EncodeStream(vocoder=vocoder),
+        extra_time=config.encode_extra_time,
+        future_extra_time=config.encode_future_extra_time,
+    )
+    length = round(time_length * vocoder.acoustic_param.sampling_rate)
+    features = []
+    for i in range(len(wave) // length):
+        stream_wrapper.add(data=wave[i * length:(i + 1) * length], time_length=time_length)
+        features.append(stream_wrapper.process_next(time_length=time_length))
+    return features
+
+
+def benchmark(
+        config_path: Path,
+        input_path: Path,
+        num_workers: List[int],
+        speed: float,
+):
+    config = Config.from_yaml(config_path)
+    converter = YukarinConverter.make_yukarin_converter(
+        input_statistics_path=config.input_statistics_path,
+        target_statistics_path=config.target_statistics_path,
+        stage1_model_path=config.stage1_model_path,
+        stage1_config_path=config.stage1_config_path,
+        stage2_model_path=config.stage2_model_path,
+        stage2_config_path=config.stage2_config_path,
+        gpu=config.gpu,
+        inference_backend=config.inference_backend,
+        stage1_onnx_path=config.stage1_onnx_path,
+        stage2_onnx_path=config.stage2_onnx_path,
+    )
+    acoustic_param = converter.acoustic_converter.config.dataset.acoustic_param
+    vocoder = Vocoder(
+        acoustic_param=acoustic_param,
+        out_sampling_rate=config.output_rate,
+        extract_f0_mode=config.extract_f0_mode,
+    )
+    wave, _ = librosa.load(str(input_path), sr=acoustic_param.sampling_rate)
+    features = _encode(config, vocoder, wave)
+    total_time = len(features) * config.buffer_time
+
+    convert_future_extra_time = config.convert_future_extra_time
+    if convert_future_extra_time is None:
+        convert_future_extra_time = config.convert_extra_time
+    context = context_chunks(
+        time_length=config.buffer_time,
+        context_time=config.convert_extra_time + convert_future_extra_time,
+    )
+
+    print('workers\trtf\tmean (ms)\tp50 (ms)\tp95 (ms)\tmax (ms)')
+    for num_worker in num_workers:
+        queue_inputs: List[Queue] = [Queue() for _ in range(num_worker)]
+        queue_output: Queue = Queue()
+        locks = [Lock() for _ in range(num_worker)]
+
+        processes: List[Process] = []
+        for i, (queue_input, lock) in enumerate(zip(queue_inputs, locks)):
+            lock.acquire()
+            process = Process(target=convert_worker, kwargs=dict(
+                acoustic_converter=converter.acoustic_converter,
+                super_resolution=converter.super_resolution,
+                time_length=config.buffer_time,
+                extra_time=config.convert_extra_time,
+                future_extra_time=config.convert_future_extra_time,
+                auto_extra_time=config.convert_auto_extra_time,
+                ring_buffer_time=config.ring_buffer_time,
+                retention_time=config.retention_time,
+                feature_codec=None,
+                input_silent_threshold=config.input_silent_threshold,
+                queue_input=queue_input,
+                queue_output=queue_output,
+                acquired_lock=lock,
+                worker_id=i,
+                num_worker=num_worker,
+                max_batch=config.convert_max_batch,
+            ))
+            process.start()
+            processes.append(process)
+
+        for lock in locks:
+            with lock:
+                pass  # wait for the warm up
+
+        # send chunks at the pace of speed times real time, and record the time until each converted chunk returns
+        dispatch_queue = DispatchQueue(queues=queue_inputs, context=context)
+        interval = config.buffer_time / speed
+        sent: Dict[int, float] = {}
+        latencies: List[float] = []
+        start = time.perf_counter()
+        for i, feature in enumerate(features):
+            time.sleep(max(0., start + i * interval - time.perf_counter()))
+            sent[i] = time.perf_counter()
+            dispatch_queue.put(Item(item=feature, index=i))
+
+            while not queue_output.empty():
+                item: Item = queue_output.get()
+                latencies.append(time.perf_counter() - sent[item.index])
+
+        while len(latencies) < len(features):
+            item = queue_output.get()
+            latencies.append(time.perf_counter() - sent[item.index])
+        elapsed = time.perf_counter() - start
+
+        for process in processes:
+            process.terminate()
+
+        array = numpy.array(latencies) * 1000
+        print(
+            f'{num_worker}\t{elapsed / total_time:.3f}\t{array.mean():.1f}\t{numpy.percentile(array, 50):.1f}'
+            f'\t{numpy.percentile(array, 95):.1f}\t{array.max():.1f}'
+        )
+
+    print(f'input: {total_time:.1f}s, {len(features)} chunks')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--config_path', type=Path, default=Path('./config.yaml'))
+    parser.add_argument('--input_path', type=Path, required=True)
+    parser.add_argument('--num_workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--speed', type=float, default=1, help='pace of sending chunks relative to real time')
+    args = parser.parse_args()
+
+    benchmark(
+        config_path=args.config_path,
+        input_path=args.input_path,
+        num_workers=args.num_workers,
+        speed=args.speed,
+    )
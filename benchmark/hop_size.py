@@ -0,0 +1,97 @@
+import argparse
+import time
+from pathlib import Path
+from typing import List
+
+import librosa
+import numpy
+
+from realtime_voice_conversion.config import Config
+from realtime_voice_conversion.converter.yukarin_converter import YukarinConverter
+from realtime_voice_conversion.stream import EncodeStream, ConvertStream, DecodeStream, StreamWrapper
+from realtime_voice_conversion.yukarin_wrapper.vocoder import RealtimeVocoder
+from realtime_voice_conversion.yukarin_wrapper.voice_changer import VoiceChanger
+
+
+def benchmark(
+        config_path: Path,
+        input_path: Path,
+        hops: List[float],
+):
+    config = Config.from_yaml(config_path)
+    converter = YukarinConverter.make_yukarin_converter(
+        input_statistics_path=config.input_statistics_path,
+        target_statistics_path=config.target_statistics_path,
+        stage1_model_path=config.stage1_model_path,
+        stage1_config_path=config.stage1_config_path,
+        stage2_model_path=config.stage2_model_path,
+        stage2_config_path=config.stage2_config_path,
+    )
+    input_rate = converter.acoustic_converter.config.dataset.acoustic_param.sampling_rate
+    wave, _ = librosa.load(str(input_path), sr=input_rate)
+    total_time = len(wave) / input_rate
+
+    print('hop (s)\tencode rtf\tconvert rtf\tdecode rtf\ttotal rtf\tlatency (s)')
+    for hop in hops:
+        realtime_vocoder = RealtimeVocoder(
+            acoustic_param=converter.acoustic_converter.config.dataset.acoustic_param,
+            out_sampling_rate=config.output_rate,
+            extract_f0_mode=config.extract_f0_mode,
+        )
+        realtime_vocoder.create_synthesizer(buffer_size=config.vocoder_buffer_size, number_of_pointers=16)
+        voice_changer = VoiceChanger(
+            acoustic_converter=converter.acoustic_converter,
+            super_resolution=converter.super_resolution,
+            threshold=config.input_silent_threshold,
+        )
+
+        wrappers = [
+            StreamWrapper(
+                stream=EncodeStream(vocoder=realtime_vocoder),
+                extra_time=config.encode_extra_time,
+                future_extra_time=config.encode_future_extra_time,
+            ),
+            StreamWrapper(
+                stream=ConvertStream(voice_changer=voice_changer),
+                extra_time=config.convert_extra_time,
+                future_extra_time=config.convert_future_extra_time,
+            ),
+            StreamWrapper(
+                stream=DecodeStream(vocoder=realtime_vocoder),
+                extra_time=config.decode_extra_time,
+                future_extra_time=config.decode_future_extra_time,
+            ),
+        ]
+
+        length = round(hop * input_rate)
+        elapsed = numpy.zeros(len(wrappers))
+        for i in range(len(wave) // length):
+            data = wave[i * length:(i + 1) * length]
+            for j, wrapper in enumerate(wrappers):
+                start = time.perf_counter()
+                wrapper.add(data=data, time_length=hop)
+                data = wrapper.process_next(time_length=hop)
+                elapsed[j] += time.perf_counter() - start
+
+        num_hop = len(wave) // length
+        rtfs = elapsed / (num_hop * hop)
+
+        # capture of one hop, future overlap of every stage, and processing of one hop in each stage
+        latency = hop + sum(w.future_extra_time for w in wrappers) + elapsed.sum() / num_hop
+        print(f'{hop}\t{rtfs[0]:.3f}\t{rtfs[1]:.3f}\t{rtfs[2]:.3f}\t{rtfs.sum():.3f}\t{latency:.3f}')
+
+    print(f'input: {total_time:.1f}s')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--config_path', type=Path, default=Path('./config.yaml'))
+    parser.add_argument('--input_path', type=Path)
+    parser.add_argument('--hops', type=float, nargs='+', default=[0.1, 0.15, 0.2, 0.5, 1.0])
+    args = parser.parse_args()
+
+    benchmark(
+        config_path=args.config_path,
+        input_path=args.input_path,
+        hops=args.hops,
+    )
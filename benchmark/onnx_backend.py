@@ -0,0 +1,67 @@
+import argparse
+import time
+from pathlib import Path
+
+import chainer
+import librosa
+
+from realtime_voice_conversion.config import Config
+from realtime_voice_conversion.converter.onnx_export import record_inputs
+from realtime_voice_conversion.converter.onnx_predictor import OnnxPredictor
+from realtime_voice_conversion.converter.yukarin_converter import YukarinConverter
+
+
+def _time(predictor, x, iteration: int):
+    predictor(x)  # warm up
+    start = time.perf_counter()
+    for _ in range(iteration):
+        predictor(x)
+    return (time.perf_counter() - start) / iteration
+
+
+def benchmark(
+        config_path: Path,
+        input_path: Path,
+        time_length: float,
+        iteration: int,
+):
+    config = Config.from_yaml(config_path)
+    converter = YukarinConverter.make_yukarin_converter(
+        input_statistics_path=config.input_statistics_path,
+        target_statistics_path=config.target_statistics_path,
+        stage1_model_path=config.stage1_model_path,
+        stage1_config_path=config.stage1_config_path,
+        stage2_model_path=config.stage2_model_path,
+        stage2_config_path=config.stage2_config_path,
+        gpu=None,
+    )
+    chainer.global_config.enable_backprop = False
+    chainer.global_config.train = False
+
+    wave, _ = librosa.load(str(input_path), sr=config.input_rate)
+    stage1_inputs, stage2_inputs = record_inputs(converter, config, wave, time_lengths=(time_length,))
+
+    print('model\tinput\tchainer cpu (ms)\tonnx runtime cpu (ms)')
+    for name, predictor, onnx_path, x in (
+            ('stage1', converter.acoustic_converter.model, config.stage1_onnx_path, stage1_inputs[0]),
+            ('stage2', converter.super_resolution.model, config.stage2_onnx_path, stage2_inputs[0]),
+    ):
+        time_chainer = _time(predictor, x, iteration)
+        time_onnx = _time(OnnxPredictor(onnx_path), x, iteration)
+        print(f'{name}\t{x.shape}\t{time_chainer * 1000:.1f}\t{time_onnx * 1000:.1f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--config_path', type=Path, default=Path('./config.yaml'))
+    parser.add_argument('--input_path', type=Path, help='voice file for example inputs')
+    parser.add_argument('--time_length', type=float, default=1)
+    parser.add_argument('--iteration', type=int, default=20)
+    args = parser.parse_args()
+
+    benchmark(
+        config_path=args.config_path,
+        input_path=args.input_path,
+        time_length=args.time_length,
+        iteration=args.iteration,
+    )
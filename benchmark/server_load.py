@@ -0,0 +1,125 @@
+import argparse
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import librosa
+import numpy
+
+from realtime_voice_conversion.server.protocol import receive_info, send_chunk, receive_chunk
+
+
+def _connect(host: str, port: int, unix_path: Optional[Path]):
+    if unix_path is not None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(str(unix_path))
+    else:
+        sock = socket.create_connection((host, port))
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+def _session(
+        host: str,
+        port: int,
+        unix_path: Optional[Path],
+        input_path: Optional[Path],
+        time_length: float,
+        latencies: List[float],
+):
+    """
+    send chunks at the real-time pace, and record the time until each converted chunk returns.
+    """
+    sock = _connect(host, port, unix_path)
+    info = receive_info(sock)
+    if info is None:
+        print('the server closed the connection before sending the session info')
+        sock.close()
+        return
+
+    chunk_time = info.in_audio_chunk / info.input_rate
+    num_chunk = round(time_length / chunk_time)
+
+    if input_path is not None:
+        wave, _ = librosa.load(str(input_path), sr=info.input_rate)
+        wave = numpy.resize(wave, num_chunk * info.in_audio_chunk)
+    else:
+        wave = numpy.random.RandomState().randn(num_chunk * info.in_audio_chunk) * 0.1
+    wave = wave.astype(numpy.float32)
+
+    sent: Dict[int, float] = {}
+
+    def _send():
+        start = time.perf_counter()
+        for i in range(num_chunk):
+            time.sleep(max(0., start + i * chunk_time - time.perf_counter()))
+            sent[i] = time.perf_counter()
+            send_chunk(sock, i, wave[i * info.in_audio_chunk:(i + 1) * info.in_audio_chunk])
+
+    sender = threading.Thread(target=_send)
+    sender.start()
+    for _ in range(num_chunk):
+        received = receive_chunk(sock, chunk_length=info.out_audio_chunk)
+        if received is None:
+            break
+        index, _ = received
+        latencies.append(time.perf_counter() - sent[index])
+    sender.join()
+    sock.close()
+
+
+def benchmark(
+        host: str,
+        port: int,
+        unix_path: Optional[Path],
+        input_path: Optional[Path],
+        num_sessions: List[int],
+        time_length: float,
+):
+    print('sessions\tmean (ms)\tp50 (ms)\tp95 (ms)\tmax (ms)')
+    for num_session in num_sessions:
+        latencies_list: List[List[float]] = [[] for _ in range(num_session)]
+        threads = [
+            threading.Thread(target=_session, kwargs=dict(
+                host=host,
+                port=port,
+                unix_path=unix_path,
+                input_path=input_path,
+                time_length=time_length,
+                latencies=latencies,
+            ))
+            for latencies in latencies_list
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # the first chunks include the setup of the session
+        latencies = numpy.array(sum((latencies[1:] for latencies in latencies_list), [])) * 1000
+        print(
+            f'{num_session}\t{latencies.mean():.1f}\t{numpy.percentile(latencies, 50):.1f}'
+            f'\t{numpy.percentile(latencies, 95):.1f}\t{latencies.max():.1f}'
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix_path', type=Path)
+    parser.add_argument('--input_path', type=Path, help='voice file sent by every session, noise if not given')
+    parser.add_argument('--num_sessions', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--time_length', type=float, default=10)
+    args = parser.parse_args()
+
+    benchmark(
+        host=args.host,
+        port=args.port,
+        unix_path=args.unix_path,
+        input_path=args.input_path,
+        num_sessions=args.num_sessions,
+        time_length=args.time_length,
+    )
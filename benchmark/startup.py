@@ -0,0 +1,85 @@
+import argparse
+import pickle
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from realtime_voice_conversion.config import Config
+
+_modules = [
+    'numpy',
+    'yaml',
+    'pyworld',
+    'librosa',
+    'chainer',
+    'yukarin',
+    'become_yukarin',
+    'world4py.native.apidefinitions',
+    'pyaudio',
+    'realtime_voice_conversion.worker',
+]
+
+
+def _import_time(module: str):
+    """
+    import time in a fresh interpreter, including the modules imported by the module.
+    """
+    code = f'import time; s = time.perf_counter(); import {module}; print(time.perf_counter() - s)'
+    result = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE, check=True)
+    return float(result.stdout)
+
+
+def benchmark(
+        config_path: Path,
+):
+    print('phase\ttime (s)')
+    for module in _modules:
+        print(f'import {module}\t{_import_time(module):.3f}')
+
+    start = time.perf_counter()
+    config = Config.from_yaml(config_path)
+    print(f'parse config\t{time.perf_counter() - start:.3f}')
+
+    from realtime_voice_conversion.converter.yukarin_converter import YukarinConverter
+    make_kwargs = dict(
+        input_statistics_path=config.input_statistics_path,
+        target_statistics_path=config.target_statistics_path,
+        stage1_model_path=config.stage1_model_path,
+        stage1_config_path=config.stage1_config_path,
+        stage2_model_path=config.stage2_model_path,
+        stage2_config_path=config.stage2_config_path,
+        gpu=None,
+    )
+
+    start = time.perf_counter()
+    converter = YukarinConverter.make_yukarin_converter(**make_kwargs)
+    print(f'load models from npz\t{time.perf_counter() - start:.3f}')
+
+    # what passing the models to a worker process started with spawn costs
+    start = time.perf_counter()
+    data = pickle.dumps((converter.acoustic_converter, converter.super_resolution))
+    pickle.loads(data)
+    print(f'pickle models for a worker ({len(data) / 1024 ** 2:.1f} MB)\t{time.perf_counter() - start:.3f}')
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache_path = Path(directory) / 'model.cache'
+
+        start = time.perf_counter()
+        YukarinConverter.make_yukarin_converter(**make_kwargs, model_cache_path=cache_path)
+        print(f'load models from npz and save cache\t{time.perf_counter() - start:.3f}')
+
+        start = time.perf_counter()
+        YukarinConverter.make_yukarin_converter(**make_kwargs, model_cache_path=cache_path)
+        print(f'load models from cache\t{time.perf_counter() - start:.3f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--config_path', type=Path, default=Path('./config.yaml'))
+    args = parser.parse_args()
+
+    benchmark(
+        config_path=args.config_path,
+    )
@@ -0,0 +1,77 @@
+import argparse
+import time
+from typing import List, Optional
+
+import numpy
+
+from realtime_voice_conversion.segment.wave_segment import WaveSegmentMethod
+from realtime_voice_conversion.stream.base_stream import BaseStream
+
+
+class Stream(BaseStream):
+    def process(
+            self,
+            start_time: float,
+            time_length: float,
+            extra_time: float,
+            future_extra_time: Optional[float] = None,
+    ):
+        return self.fetch(
+            start_time=start_time,
+            time_length=time_length,
+            extra_time=extra_time,
+            future_extra_time=future_extra_time,
+        )
+
+
+def benchmark(
+        num_segments: List[int],
+        sampling_rate: int,
+        time_length: float,
+        extra_time: float,
+        iteration: int,
+):
+    print('segments\tadd (us)\tfetch (us)\tremove (us)')
+    for num_segment in num_segments:
+        method = WaveSegmentMethod(sampling_rate=sampling_rate)
+        stream = Stream(in_segment_method=method, out_segment_method=method)
+        data = numpy.zeros(round(time_length * sampling_rate), dtype=numpy.float32)
+
+        start = time.perf_counter()
+        for i in range(num_segment):
+            stream.add(start_time=i * time_length, data=data)
+        time_add = (time.perf_counter() - start) / num_segment
+
+        start = time.perf_counter()
+        for i in range(iteration):
+            stream.fetch(
+                start_time=(num_segment - 2 - i % 2) * time_length,
+                time_length=time_length,
+                extra_time=extra_time,
+            )
+        time_fetch = (time.perf_counter() - start) / iteration
+
+        start = time.perf_counter()
+        for i in range(iteration):
+            stream.remove(end_time=i * time_length)
+        time_remove = (time.perf_counter() - start) / iteration
+
+        print(f'{num_segment}\t{time_add * 1e6:.2f}\t{time_fetch * 1e6:.2f}\t{time_remove * 1e6:.2f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--num_segments', type=int, nargs='+', default=[100, 1000, 10000, 100000])
+    parser.add_argument('--sampling_rate', type=int, default=200)
+    parser.add_argument('--time_length', type=float, default=1)
+    parser.add_argument('--extra_time', type=float, default=0.5)
+    parser.add_argument('--iteration', type=int, default=1000)
+    args = parser.parse_args()
+
+    benchmark(
+        num_segments=args.num_segments,
+        sampling_rate=args.sampling_rate,
+        time_length=args.time_length,
+        extra_time=args.extra_time,
+        iteration=args.iteration,
+    )
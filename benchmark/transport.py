@@ -0,0 +1,73 @@
+import argparse
+import time
+from multiprocessing import Process, Queue
+from typing import Tuple
+
+import numpy
+
+from realtime_voice_conversion.worker.shared_memory_queue import SharedMemoryQueue
+from realtime_voice_conversion.worker.utility import Item
+
+
+def _consume(queue_input, queue_result, num_item: int):
+    latencies = []
+    start = time.process_time()
+    for _ in range(num_item):
+        item: Item = queue_input.get()
+        latencies.append(time.perf_counter() - item.item['sent'])
+    queue_result.put((numpy.mean(latencies), (time.process_time() - start) / num_item))
+
+
+def benchmark_queue(queue, frame_length: int, num_bin: int, num_item: int):
+    queue_result: Queue[Tuple[float, float]] = Queue()
+    process = Process(target=_consume, kwargs=dict(queue_input=queue, queue_result=queue_result, num_item=num_item))
+    process.start()
+
+    sp = numpy.random.rand(frame_length, num_bin)
+    ap = numpy.random.rand(frame_length, num_bin)
+    start = time.process_time()
+    for i in range(num_item):
+        queue.put(Item(item=dict(sp=sp, ap=ap, sent=time.perf_counter()), index=i))
+        time.sleep(0.01)
+    cpu_put = (time.process_time() - start) / num_item
+
+    latency, cpu_get = queue_result.get()
+    process.join()
+    return latency, cpu_put, cpu_get
+
+
+def benchmark(
+        time_length: float,
+        frame_period: float,
+        num_bin: int,
+        num_item: int,
+):
+    frame_length = round(time_length * 1000 / frame_period)
+    size = frame_length * num_bin * 8 * 2
+
+    print(f'item size: {size / 1024 ** 2:.2f} MB')
+    print('transport\tlatency (us)\tput cpu (us)\tget cpu (us)')
+
+    latency, cpu_put, cpu_get = benchmark_queue(Queue(), frame_length, num_bin, num_item)
+    print(f'queue\t{latency * 1e6:.1f}\t{cpu_put * 1e6:.1f}\t{cpu_get * 1e6:.1f}')
+
+    queue = SharedMemoryQueue(slot_size=size * 2)
+    latency, cpu_put, cpu_get = benchmark_queue(queue, frame_length, num_bin, num_item)
+    print(f'shared memory\t{latency * 1e6:.1f}\t{cpu_put * 1e6:.1f}\t{cpu_get * 1e6:.1f}')
+    queue.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--time_length', type=float, default=0.5)
+    parser.add_argument('--frame_period', type=float, default=5)
+    parser.add_argument('--num_bin', type=int, default=513)
+    parser.add_argument('--num_item', type=int, default=200)
+    args = parser.parse_args()
+
+    benchmark(
+        time_length=args.time_length,
+        frame_period=args.frame_period,
+        num_bin=args.num_bin,
+        num_item=args.num_item,
+    )
@@ -0,0 +1,51 @@
+import argparse
+import time
+
+import librosa
+import numpy
+
+from realtime_voice_conversion.vad.voice_activity_detector import VoiceActivityDetector
+
+
+def stft_power(wave: numpy.ndarray):
+    return librosa.core.power_to_db(numpy.abs(librosa.stft(wave)) ** 2).mean()
+
+
+def benchmark(
+        sampling_rate: int,
+        time_length: float,
+        threshold: float,
+        iteration: int,
+):
+    wave = numpy.random.RandomState(0).randn(round(sampling_rate * time_length)).astype(numpy.float32) * 0.01
+
+    start = time.perf_counter()
+    for _ in range(iteration):
+        stft_power(wave) < -threshold
+    time_stft = (time.perf_counter() - start) / iteration
+
+    detector = VoiceActivityDetector(threshold=-threshold)
+    start = time.perf_counter()
+    for _ in range(iteration):
+        detector.process(wave)
+    time_vad = (time.perf_counter() - start) / iteration
+
+    print('method\tper chunk (us)')
+    print(f'stft\t{time_stft * 1e6:.2f}')
+    print(f'vad\t{time_vad * 1e6:.2f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sampling_rate', type=int, default=24000)
+    parser.add_argument('--time_length', type=float, default=0.5)
+    parser.add_argument('--threshold', type=float, default=80)
+    parser.add_argument('--iteration', type=int, default=200)
+    args = parser.parse_args()
+
+    benchmark(
+        sampling_rate=args.sampling_rate,
+        time_length=args.time_length,
+        threshold=args.threshold,
+        iteration=args.iteration,
+    )
@@ -0,0 +1,73 @@
+import argparse
+from pathlib import Path
+
+import chainer
+import librosa
+
+from realtime_voice_conversion.config import Config
+from realtime_voice_conversion.converter.onnx_export import export_predictor, parity_error, record_inputs
+from realtime_voice_conversion.converter.onnx_predictor import OnnxPredictor
+from realtime_voice_conversion.converter.yukarin_converter import YukarinConverter
+
+
+def export_onnx(
+        config_path: Path,
+        input_path: Path,
+        output_dir: Path,
+        time_length: float,
+        opset_version: int,
+):
+    """
+    export the predictors of stage 1 and stage 2 with example inputs recorded from converting the voice,
+    and check the onnx models on inputs of another length.
+    """
+    config = Config.from_yaml(config_path)
+    converter = YukarinConverter.make_yukarin_converter(
+        input_statistics_path=config.input_statistics_path,
+        target_statistics_path=config.target_statistics_path,
+        stage1_model_path=config.stage1_model_path,
+        stage1_config_path=config.stage1_config_path,
+        stage2_model_path=config.stage2_model_path,
+        stage2_config_path=config.stage2_config_path,
+        gpu=None,
+    )
+    chainer.global_config.enable_backprop = False
+    chainer.global_config.train = False
+
+    wave, _ = librosa.load(str(input_path), sr=config.input_rate)
+    # the second length is for checking the symbolic time axis
+    stage1_inputs, stage2_inputs = record_inputs(converter, config, wave, time_lengths=(time_length, time_length * 2))
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for name, predictor, inputs in (
+            ('stage1', converter.acoustic_converter.model, stage1_inputs),
+            ('stage2', converter.super_resolution.model, stage2_inputs),
+    ):
+        if len(inputs) == 0:
+            raise ValueError(f'{name} is not called, the input voice may be silent')
+
+        path = output_dir / f'{name}.onnx'
+        export_predictor(predictor, inputs[0], path, opset_version=opset_version)
+
+        onnx_predictor = OnnxPredictor(path)
+        for x in inputs:
+            error = parity_error(predictor, onnx_predictor, x)
+            print(f'{path}\tinput {x.shape}\tmax abs error {error:.3e}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--config_path', type=Path, default=Path('./config.yaml'))
+    parser.add_argument('--input_path', type=Path, help='voice file for example inputs')
+    parser.add_argument('--output_dir', type=Path, default=Path('./sample/onnx'))
+    parser.add_argument('--time_length', type=float, default=1)
+    parser.add_argument('--opset_version', type=int, default=11)
+    args = parser.parse_args()
+
+    export_onnx(
+        config_path=args.config_path,
+        input_path=args.input_path,
+        output_dir=args.output_dir,
+        time_length=args.time_length,
+        opset_version=args.opset_version,
+    )
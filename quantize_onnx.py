@@ -0,0 +1,145 @@
+import argparse
+import time
+from pathlib import Path
+
+import chainer
+import librosa
+import numpy
+
+from realtime_voice_conversion.config import Config
+from realtime_voice_conversion.converter.onnx_predictor import OnnxPredictor, PredictorRecorder
+from realtime_voice_conversion.converter.onnx_quantize import encode_chunks, convert_chunks, quantize_predictor, \
+    log_spectral_distance
+from realtime_voice_conversion.converter.yukarin_converter import YukarinConverter
+from realtime_voice_conversion.yukarin_wrapper.vocoder import Vocoder
+from realtime_voice_conversion.yukarin_wrapper.voice_changer import VoiceChanger
+
+
+def quantize_onnx(
+        config_path: Path,
+        input_path: Path,
+        calibration_time: float,
+        output_dir: Path,
+        per_channel: bool,
+):
+    """
+    quantize the onnx models of `stage1_onnx_path` and `stage2_onnx_path` in the config,
+    calibrated on the chunks of the head of the voice file converted as in the realtime conversion,
+    and report the speed and the spectral error on the rest of the voice file.
+    """
+    config = Config.from_yaml(config_path)
+    stage1_onnx_path = config.stage1_onnx_path
+    stage2_onnx_path = config.stage2_onnx_path
+    if stage1_onnx_path is None or stage2_onnx_path is None:
+        raise ValueError('stage1_onnx_path and stage2_onnx_path must be set in the config')
+
+    converter = YukarinConverter.make_yukarin_converter(
+        input_statistics_path=config.input_statistics_path,
+        target_statistics_path=config.target_statistics_path,
+        stage1_model_path=config.stage1_model_path,
+        stage1_config_path=config.stage1_config_path,
+        stage2_model_path=config.stage2_model_path,
+        stage2_config_path=config.stage2_config_path,
+        gpu=None,
+    )
+    chainer.global_config.enable_backprop = False
+    chainer.global_config.train = False
+
+    acoustic_converter = converter.acoustic_converter
+    super_resolution = converter.super_resolution
+    vocoder = Vocoder(
+        acoustic_param=acoustic_converter.config.dataset.acoustic_param,
+        out_sampling_rate=config.output_rate,
+        extract_f0_mode=config.extract_f0_mode,
+    )
+    voice_changer = VoiceChanger(
+        acoustic_converter=acoustic_converter,
+        super_resolution=super_resolution,
+        threshold=config.input_silent_threshold,
+        output_sampling_rate=config.output_rate,
+    )
+
+    wave, _ = librosa.load(str(input_path), sr=config.input_rate)
+    features = encode_chunks(
+        vocoder,
+        wave,
+        time_length=config.buffer_time,
+        extra_time=config.encode_extra_time,
+        future_extra_time=config.encode_future_extra_time,
+        ring_buffer_time=config.ring_buffer_time,
+    )
+    num_calibration = round(calibration_time / config.buffer_time)
+    if not 0 < num_calibration < len(features):
+        raise ValueError('the voice file must be longer than calibration_time')
+
+    def _convert(_stage1_predictor, _stage2_predictor, _features):
+        stage1_recorder = PredictorRecorder(_stage1_predictor)
+        stage2_recorder = PredictorRecorder(_stage2_predictor)
+        acoustic_converter.model = stage1_recorder
+        super_resolution.model = stage2_recorder
+
+        start = time.perf_counter()
+        out_features = convert_chunks(
+            voice_changer,
+            _features,
+            time_length=config.buffer_time,
+            extra_time=config.convert_extra_time,
+            future_extra_time=config.convert_future_extra_time,
+            ring_buffer_time=config.ring_buffer_time,
+        )
+        elapsed = (time.perf_counter() - start) / len(_features)
+        return out_features, elapsed, stage1_recorder.inputs, stage2_recorder.inputs
+
+    float_predictors = [OnnxPredictor(stage1_onnx_path), OnnxPredictor(stage2_onnx_path)]
+    _, _, stage1_inputs, stage2_inputs = _convert(float_predictors[0], float_predictors[1], features[:num_calibration])
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    quantized_predictors = []
+    for float_path, inputs in ((stage1_onnx_path, stage1_inputs), (stage2_onnx_path, stage2_inputs)):
+        quantized_path = output_dir / (float_path.stem + '.int8.onnx')
+        quantize_predictor(float_path, quantized_path, inputs, per_channel=per_channel)
+        quantized_predictors.append(OnnxPredictor(quantized_path))
+        print(f'quantized: {quantized_path}')
+
+    # report on the chunks not used for calibration
+    validation_features = features[num_calibration:]
+    float_features, float_time, stage1_inputs, stage2_inputs = _convert(
+        float_predictors[0], float_predictors[1], validation_features,
+    )
+    quantized_features, quantized_time, _, _ = _convert(
+        quantized_predictors[0], quantized_predictors[1], validation_features,
+    )
+
+    print('model\tfloat (ms)\tint8 (ms)\tspeedup')
+    for name, float_predictor, quantized_predictor, inputs in zip(
+            ('stage1', 'stage2'), float_predictors, quantized_predictors, (stage1_inputs, stage2_inputs),
+    ):
+        times = []
+        for predictor in (float_predictor, quantized_predictor):
+            start = time.perf_counter()
+            for x in inputs:
+                predictor(x)
+            times.append((time.perf_counter() - start) / max(len(inputs), 1))
+        print(f'{name}\t{times[0] * 1000:.1f}\t{times[1] * 1000:.1f}\t{times[0] / times[1]:.2f}')
+    print(f'chunk\t{float_time * 1000:.1f}\t{quantized_time * 1000:.1f}\t{float_time / quantized_time:.2f}')
+
+    distances = [log_spectral_distance(a.sp, b.sp) for a, b in zip(float_features, quantized_features)]
+    print(f'log spectral distance (db): mean {numpy.mean(distances):.3f}, max {numpy.max(distances):.3f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--config_path', type=Path, default=Path('./config.yaml'))
+    parser.add_argument('--input_path', type=Path, required=True, help='voice file for calibration and report')
+    parser.add_argument('--calibration_time', type=float, default=30)
+    parser.add_argument('--output_dir', type=Path, default=Path('./sample/onnx'))
+    parser.add_argument('--per_channel', action='store_true', help='needs the models of opset 13 or later')
+    args = parser.parse_args()
+
+    quantize_onnx(
+        config_path=args.config_path,
+        input_path=args.input_path,
+        calibration_time=args.calibration_time,
+        output_dir=args.output_dir,
+        per_channel=args.per_channel,
+    )
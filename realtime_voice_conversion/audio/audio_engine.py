@@ -0,0 +1,135 @@
+import threading
+from collections import deque
+from typing import Deque, Optional
+
+import numpy
+
+
+class SampleQueue(object):
+    """
+    single producer and single consumer queue of samples.
+    deque.append and deque.popleft are atomic, so neither side takes a lock.
+    """
+
+    def __init__(self):
+        self._chunks: Deque[numpy.ndarray] = deque()
+        self._head = numpy.empty(0, dtype=numpy.float32)  # owned by the consumer
+        self._pushed = 0  # written only by the producer
+        self._popped = 0  # written only by the consumer
+
+    def __len__(self):
+        return self._pushed - self._popped
+
+    def push(self, wave: numpy.ndarray):
+        self._chunks.append(wave)
+        self._pushed += len(wave)
+
+    def pop(self, length: int) -> Optional[numpy.ndarray]:
+        if len(self) < length:
+            return None
+
+        out = numpy.empty(length, dtype=numpy.float32)
+        offset = 0
+        while offset < length:
+            if len(self._head) == 0:
+                self._head = self._chunks.popleft()
+            n = min(length - offset, len(self._head))
+            out[offset:offset + n] = self._head[:n]
+            self._head = self._head[n:]
+            offset += n
+
+        self._popped += length
+        return out
+
+
+class AudioEngine(object):
+    """
+    audio input and output in PyAudio callback mode.
+    the device callbacks only move samples through lock-free queues, so they never wait for the pipeline.
+    backend is a pyaudio.PyAudio, or any object having the same open method.
+    """
+
+    def __init__(
+            self,
+            backend,
+            input_rate: int,
+            output_rate: int,
+            input_frames: int,
+            output_frames: int,
+            input_device_index: Optional[int] = None,
+            output_device_index: Optional[int] = None,
+    ):
+        self.backend = backend
+        self.input_rate = input_rate
+        self.output_rate = output_rate
+        self.input_frames = input_frames
+        self.output_frames = output_frames
+        self.input_device_index = input_device_index
+        self.output_device_index = output_device_index
+
+        self.input_queue = SampleQueue()
+        self.output_queue = SampleQueue()
+        self._input_ready = threading.Event()
+
+        self._input_stream = None
+        self._output_stream = None
+        self._continue_flag = None
+
+        self.underrun = 0
+
+    def start(self):
+        import pyaudio  # imported here, not to load PortAudio in the processes that only import this module
+        self._continue_flag = pyaudio.paContinue
+
+        self._input_stream = self.backend.open(
+            format=pyaudio.paFloat32,
+            channels=1,
+            rate=self.input_rate,
+            frames_per_buffer=self.input_frames,
+            input=True,
+            input_device_index=self.input_device_index,
+            stream_callback=self._input_callback,
+        )
+        self._output_stream = self.backend.open(
+            format=pyaudio.paFloat32,
+            channels=1,
+            rate=self.output_rate,
+            frames_per_buffer=self.output_frames,
+            output=True,
+            output_device_index=self.output_device_index,
+            stream_callback=self._output_callback,
+        )
+        self._input_stream.start_stream()
+        self._output_stream.start_stream()
+
+    def stop(self):
+        for stream in (self._input_stream, self._output_stream):
+            if stream is not None:
+                stream.stop_stream()
+                stream.close()
+        self._input_stream = self._output_stream = None
+
+    def _input_callback(self, in_data, frame_count, time_info, status):
+        self.input_queue.push(numpy.frombuffer(in_data, dtype=numpy.float32))
+        self._input_ready.set()
+        return None, self._continue_flag
+
+    def _output_callback(self, in_data, frame_count, time_info, status):
+        wave = self.output_queue.pop(frame_count)
+        if wave is None:
+            self.underrun += 1
+            wave = numpy.zeros(frame_count, dtype=numpy.float32)
+        return wave.tobytes(), self._continue_flag
+
+    def read(self, length: int, timeout: Optional[float] = None) -> Optional[numpy.ndarray]:
+        """
+        wait for length input samples. returns None on timeout.
+        """
+        while len(self.input_queue) < length:
+            if not self._input_ready.wait(timeout):
+                return None
+            self._input_ready.clear()
+        return self.input_queue.pop(length)
+
+    def write(self, wave: numpy.ndarray):
+        self.output_queue.push(wave.astype(numpy.float32))
@@ -0,0 +1,91 @@
+from typing import Dict, Optional
+
+import numpy
+
+
+class JitterBuffer(object):
+    """
+    reorders output waves by index and decides what to play on each playout tick.
+    playout starts when target_delay items are buffered.
+    a missing item is waited for while at most target_delay items are buffered, then it is concealed and skipped.
+    an item arriving after its index was played or skipped is dropped as late.
+    a silent item (None) is skipped without taking a tick when the buffer is deeper than target_delay.
+    concealment repeats the last played wave, attenuated by conceal_decay for each concealed tick (0 is silence).
+    """
+
+    def __init__(self, target_delay: int = 0, conceal_decay: float = 0):
+        self.target_delay = target_delay
+        self.conceal_decay = conceal_decay
+
+        self.items: Dict[int, Optional[numpy.ndarray]] = {}
+        self.next_index = 0
+        self.started = False
+        self.played_index: Optional[int] = None  # index of the wave returned by the last pop
+
+        self._last_wave: Optional[numpy.ndarray] = None
+        self._conceal_gain = 1.
+
+        self.late = 0
+        self.concealed = 0
+        self.skipped_silent = 0
+        self.played = 0
+
+    @property
+    def depth(self):
+        return len(self.items)
+
+    @property
+    def stats(self):
+        return dict(
+            depth=self.depth,
+            late=self.late,
+            concealed=self.concealed,
+            skipped_silent=self.skipped_silent,
+            played=self.played,
+        )
+
+    def put(self, index: int, wave: Optional[numpy.ndarray]):
+        if index < self.next_index:
+            self.late += 1
+            return
+        self.items[index] = wave
+
+    def _conceal(self):
+        self.concealed += 1
+        if self._last_wave is None or self.conceal_decay == 0:
+            return None
+
+        self._conceal_gain *= self.conceal_decay
+        return self._last_wave * self._conceal_gain
+
+    def pop(self) -> Optional[numpy.ndarray]:
+        """
+        wave to play on this tick, or None for silence.
+        """
+        self.played_index = None
+        if not self.started:
+            if self.depth < max(self.target_delay, 1):
+                return None
+            self.started = True
+
+        while True:
+            if self.next_index not in self.items:
+                if self.depth > self.target_delay:
+                    self.next_index = min(self.items)  # give up the missing items
+                return self._conceal()
+
+            wave = self.items.pop(self.next_index)
+            self.next_index += 1
+
+            if wave is None:
+                if self.depth > self.target_delay and self.next_index in self.items:
+                    self.skipped_silent += 1
+                    continue
+                self._last_wave = None
+                return None
+
+            self.played += 1
+            self.played_index = self.next_index - 1
+            self._last_wave = wave
+            self._conceal_gain = 1.
+            return wave
@@ -0,0 +1,94 @@
+from typing import Tuple
+
+import numpy
+
+from ..buffer.base_buffer import BaseBuffer
+
+
+class ArrayRingBuffer(BaseBuffer[numpy.ndarray]):
+    """
+    fixed capacity circular buffer indexed by absolute position along the first axis.
+    positions out of [begin, end) are read as fill_value.
+    a read that neither wraps nor needs padding returns a view, valid until the buffer wraps over it.
+    """
+
+    def __init__(
+            self,
+            capacity: int,
+            shape: Tuple[int, ...] = (),
+            dtype=numpy.float32,
+            fill_value=0,
+    ):
+        super().__init__(capacity=capacity)
+        self.shape = shape
+        self.dtype = dtype
+        self.fill_value = fill_value
+
+        self.buffer = numpy.full((capacity,) + shape, fill_value, dtype=dtype)
+        self.begin = 0
+        self.end = 0
+
+    @property
+    def length(self):
+        return self.end - self.begin
+
+    @property
+    def nbytes(self):
+        return self.buffer.nbytes
+
+    def _slices(self, first: int, last: int):
+        i = first % self.capacity
+        length = last - first
+        if i + length <= self.capacity:
+            return [slice(i, i + length)]
+        else:
+            return [slice(i, self.capacity), slice(0, i + length - self.capacity)]
+
+    def _fill(self, first: int, last: int):
+        for s in self._slices(max(first, last - self.capacity), last):
+            self.buffer[s] = self.fill_value
+
+    def write(self, start: int, data: numpy.ndarray):
+        if self.begin == self.end:
+            self.begin = self.end = start
+
+        end = start + len(data)
+        new_end = max(self.end, end)
+        lowest = new_end - self.capacity
+        if start < lowest:
+            data = data[lowest - start:]
+            start = lowest
+        if start >= end:
+            return
+
+        if start > self.end:
+            self._fill(max(self.end, lowest), start)
+        elif end < self.begin:
+            self._fill(end, self.begin)
+
+        offset = 0
+        for s in self._slices(start, end):
+            length = s.stop - s.start
+            self.buffer[s] = data[offset:offset + length]
+            offset += length
+
+        self.end = new_end
+        self.begin = max(min(self.begin, start), lowest)
+
+    def read(self, start: int, length: int):
+        end = start + length
+        if self.begin <= start and end <= self.end:
+            i = start % self.capacity
+            if i + length <= self.capacity:
+                return self.buffer[i:i + length]
+
+        out = numpy.full((length,) + self.shape, self.fill_value, dtype=self.dtype)
+        first = max(start, self.begin)
+        last = min(end, self.end)
+        if first < last:
+            offset = first - start
+            for s in self._slices(first, last):
+                length = s.stop - s.start
+                out[offset:offset + length] = self.buffer[s]
+                offset += length
+        return out
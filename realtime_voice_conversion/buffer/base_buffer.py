@@ -0,0 +1,27 @@
+from abc import abstractmethod
+from typing import TypeVar, Generic
+
+T = TypeVar('T')
+
+
+class BaseBuffer(Generic[T]):
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+
+    @abstractmethod
+    def write(self, start: int, data: T):
+        raise NotImplementedError()
+
+    @abstractmethod
+    def read(self, start: int, length: int) -> T:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def length(self) -> int:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def nbytes(self) -> int:
+        raise NotImplementedError()
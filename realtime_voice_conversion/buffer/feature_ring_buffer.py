@@ -0,0 +1,98 @@
+from typing import Dict, Union
+
+import numpy
+from yukarin.acoustic_feature import AcousticFeature
+from yukarin.wave import Wave
+
+from ..buffer.array_ring_buffer import ArrayRingBuffer
+from ..buffer.base_buffer import BaseBuffer
+from ..segment.feature_segment import FeatureSegmentMethod
+from ..segment.feature_wrapper_segment import FeatureWrapperSegmentMethod
+from ..yukarin_wrapper.acoustic_feature_wrapper import AcousticFeatureWrapper
+
+
+class FeatureRingBuffer(BaseBuffer[AcousticFeature]):
+    """
+    one ring per feature key, indexed by frame.
+    rings are allocated on the first write of each key, and unwritten frames are read as the silent feature.
+    """
+
+    def __init__(
+            self,
+            capacity: int,
+            segment_method: Union[FeatureSegmentMethod, FeatureWrapperSegmentMethod],
+    ):
+        super().__init__(capacity=capacity)
+        self.segment_method = segment_method
+
+        self.rings: Dict[str, ArrayRingBuffer] = {}
+
+    @property
+    def length(self):
+        return max((ring.length for ring in self.rings.values()), default=0)
+
+    @property
+    def nbytes(self):
+        return sum(ring.nbytes for ring in self.rings.values())
+
+    def _ring(self, key: str, array: numpy.ndarray):
+        if key not in self.rings:
+            silent = getattr(self.segment_method.pad(1), key)
+            self.rings[key] = ArrayRingBuffer(
+                capacity=self.capacity,
+                shape=array.shape[1:],
+                dtype=array.dtype,
+                fill_value=silent[0],
+            )
+        return self.rings[key]
+
+    def write(self, start: int, data: AcousticFeature):
+        for key in self.segment_method.keys:
+            array = getattr(data, key)
+            self._ring(key, array).write(start=start, data=array)
+
+    def _read_arrays(self, start: int, length: int):
+        silent = None
+        arrays: Dict[str, numpy.ndarray] = {}
+        for key in self.segment_method.keys:
+            if key in self.rings:
+                arrays[key] = self.rings[key].read(start=start, length=length)
+            else:
+                if silent is None:
+                    silent = self.segment_method.pad(length)
+                arrays[key] = getattr(silent, key)
+        return arrays
+
+    def read(self, start: int, length: int):
+        return AcousticFeature(**self._read_arrays(start=start, length=length))
+
+
+class FeatureWrapperRingBuffer(FeatureRingBuffer):
+    """
+    also keeps the attached wave in a ring at the wave sampling rate.
+    """
+
+    def __init__(self, capacity: int, segment_method: FeatureWrapperSegmentMethod):
+        super().__init__(capacity=capacity, segment_method=segment_method)
+        self.frame_period = segment_method.frame_period
+        self.wave_rate = segment_method.wave_sampling_rate
+        self.wave_ring = ArrayRingBuffer(capacity=self._wave_index(capacity))
+
+    @property
+    def nbytes(self):
+        return super().nbytes + self.wave_ring.nbytes
+
+    def _wave_index(self, index: int):
+        return round(index * self.frame_period / 1000 * self.wave_rate)
+
+    def write(self, start: int, data: AcousticFeatureWrapper):
+        super().write(start=start, data=data)
+        self.wave_ring.write(start=self._wave_index(start), data=data.wave.wave)
+
+    def read(self, start: int, length: int):
+        first = self._wave_index(start)
+        last = self._wave_index(start + length)
+        return AcousticFeatureWrapper(
+            wave=Wave(wave=self.wave_ring.read(start=first, length=last - first), sampling_rate=self.wave_rate),
+            **self._read_arrays(start=start, length=length),
+        )
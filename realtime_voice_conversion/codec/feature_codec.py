@@ -0,0 +1,82 @@
+from typing import NamedTuple
+
+import numpy
+import pyworld
+from yukarin.acoustic_feature import AcousticFeature
+
+from ..config import FeatureCodecMode
+
+
+class EncodedFeature(NamedTuple):
+    f0: numpy.ndarray
+    sp: numpy.ndarray
+    ap: numpy.ndarray
+    voiced: numpy.ndarray
+
+    @property
+    def nbytes(self):
+        return sum(v.nbytes for v in self)
+
+
+class FeatureCodec(object):
+    """
+    compact format of acoustic features passed from convert to decode.
+    float32: sp and ap as float32.
+    float16: log sp and ap as float16.
+    coded: sp and ap coded by WORLD (mel-cepstrum like coded spectral envelope and band aperiodicity) as float32.
+    """
+
+    def __init__(
+            self,
+            mode: FeatureCodecMode,
+            sampling_rate: int,
+            sp_dimension: int = 80,
+    ):
+        self.mode = mode
+        self.sampling_rate = sampling_rate
+        self.sp_dimension = sp_dimension
+        self.fft_size = pyworld.get_cheaptrick_fft_size(sampling_rate)
+
+    def encode(self, feature: AcousticFeature):
+        f0 = feature.f0.astype(numpy.float32)
+        if self.mode == FeatureCodecMode.FLOAT32:
+            sp = feature.sp.astype(numpy.float32)
+            ap = feature.ap.astype(numpy.float32)
+        elif self.mode == FeatureCodecMode.FLOAT16:
+            sp = numpy.log(feature.sp).astype(numpy.float16)
+            ap = feature.ap.astype(numpy.float16)
+        elif self.mode == FeatureCodecMode.CODED:
+            sp = pyworld.code_spectral_envelope(
+                numpy.ascontiguousarray(feature.sp, dtype=numpy.float64),
+                self.sampling_rate,
+                self.sp_dimension,
+            ).astype(numpy.float32)
+            ap = pyworld.code_aperiodicity(
+                numpy.ascontiguousarray(feature.ap, dtype=numpy.float64),
+                self.sampling_rate,
+            ).astype(numpy.float32)
+        else:
+            raise ValueError(self.mode)
+        return EncodedFeature(f0=f0, sp=sp, ap=ap, voiced=feature.voiced)
+
+    def decode(self, encoded: EncodedFeature):
+        if self.mode == FeatureCodecMode.FLOAT32:
+            sp = encoded.sp.astype(numpy.float64)
+            ap = encoded.ap.astype(numpy.float64)
+        elif self.mode == FeatureCodecMode.FLOAT16:
+            sp = numpy.exp(encoded.sp.astype(numpy.float64))
+            ap = encoded.ap.astype(numpy.float64)
+        elif self.mode == FeatureCodecMode.CODED:
+            sp = pyworld.decode_spectral_envelope(
+                numpy.ascontiguousarray(encoded.sp, dtype=numpy.float64),
+                self.sampling_rate,
+                self.fft_size,
+            )
+            ap = pyworld.decode_aperiodicity(
+                numpy.ascontiguousarray(encoded.ap, dtype=numpy.float64),
+                self.sampling_rate,
+                self.fft_size,
+            )
+        else:
+            raise ValueError(self.mode)
+        return AcousticFeature(f0=encoded.f0, sp=sp, ap=ap, voiced=encoded.voiced)
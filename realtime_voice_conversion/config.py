@@ -1,6 +1,6 @@
 from enum import Enum
 from pathlib import Path
-from typing import NamedTuple, Dict, Any
+from typing import NamedTuple, Dict, Any, Optional
 
 import yaml
 
@@ -10,6 +10,17 @@ class VocodeMode(Enum):
     CREPE = 'crepe'
 
 
+class FeatureCodecMode(Enum):
+    FLOAT32 = 'float32'
+    FLOAT16 = 'float16'
+    CODED = 'coded'
+
+
+class InferenceBackend(Enum):
+    CHAINER = 'chainer'
+    ONNX = 'onnx'
+
+
 class Config(NamedTuple):
     input_device_name: str
     output_device_name: str
@@ -17,15 +28,34 @@ class Config(NamedTuple):
     output_rate: int
     frame_period: float
     buffer_time: float
+    device_buffer_time: Optional[float]
     extract_f0_mode: VocodeMode
     vocoder_buffer_size: int
     input_scale: float
     output_scale: float
     input_silent_threshold: float
     output_silent_threshold: float
+    input_gate_threshold: Optional[float]
     encode_extra_time: float
     convert_extra_time: float
     decode_extra_time: float
+    encode_future_extra_time: Optional[float]
+    convert_future_extra_time: Optional[float]
+    decode_future_extra_time: Optional[float]
+    encode_incremental: bool
+    convert_auto_extra_time: bool
+    num_convert_worker: int
+    convert_max_batch: int
+    ring_buffer_time: Optional[float]
+    retention_time: Optional[float]
+    shared_memory_transport: bool
+    feature_codec: Optional[FeatureCodecMode]
+    jitter_buffer_delay: int
+    jitter_buffer_conceal_decay: float
+    latency_log_path: Optional[Path]
+    latency_log_interval: float
+    inference_backend: InferenceBackend
+    gpu: Optional[int]
 
     input_statistics_path: Path
     target_statistics_path: Path
@@ -33,6 +63,9 @@ class Config(NamedTuple):
     stage1_config_path: Path
     stage2_model_path: Path
     stage2_config_path: Path
+    stage1_onnx_path: Optional[Path]
+    stage2_onnx_path: Optional[Path]
+    model_cache_path: Optional[Path]
 
     @property
     def in_audio_chunk(self):
@@ -42,6 +75,18 @@ class Config(NamedTuple):
     def out_audio_chunk(self):
         return round(self.output_rate * self.buffer_time)
 
+    @property
+    def in_device_chunk(self):
+        if self.device_buffer_time is None:
+            return self.in_audio_chunk
+        return round(self.input_rate * self.device_buffer_time)
+
+    @property
+    def out_device_chunk(self):
+        if self.device_buffer_time is None:
+            return self.out_audio_chunk
+        return round(self.output_rate * self.device_buffer_time)
+
     @staticmethod
     def from_yaml(path: Path):
         d: Dict[str, Any] = yaml.safe_load(path.open())
@@ -52,15 +97,34 @@ class Config(NamedTuple):
             output_rate=d['output_rate'],
             frame_period=d['frame_period'],
             buffer_time=d['buffer_time'],
+            device_buffer_time=d.get('device_buffer_time'),
             extract_f0_mode=VocodeMode(d['extract_f0_mode']),
             vocoder_buffer_size=d['vocoder_buffer_size'],
             input_scale=d['input_scale'],
             output_scale=d['output_scale'],
             input_silent_threshold=d['input_silent_threshold'],
             output_silent_threshold=d['output_silent_threshold'],
+            input_gate_threshold=d.get('input_gate_threshold'),
             encode_extra_time=d['encode_extra_time'],
             convert_extra_time=d['convert_extra_time'],
             decode_extra_time=d['decode_extra_time'],
+            encode_future_extra_time=d.get('encode_future_extra_time'),
+            convert_future_extra_time=d.get('convert_future_extra_time'),
+            decode_future_extra_time=d.get('decode_future_extra_time'),
+            encode_incremental=d.get('encode_incremental', False),
+            convert_auto_extra_time=d.get('convert_auto_extra_time', False),
+            num_convert_worker=d.get('num_convert_worker', 1),
+            convert_max_batch=d.get('convert_max_batch', 4),
+            ring_buffer_time=d.get('ring_buffer_time'),
+            retention_time=d.get('retention_time'),
+            shared_memory_transport=d.get('shared_memory_transport', False),
+            feature_codec=FeatureCodecMode(d['feature_codec']) if d.get('feature_codec') is not None else None,
+            jitter_buffer_delay=d.get('jitter_buffer_delay', 0),
+            jitter_buffer_conceal_decay=d.get('jitter_buffer_conceal_decay', 0),
+            latency_log_path=Path(d['latency_log_path']) if d.get('latency_log_path') is not None else None,
+            latency_log_interval=d.get('latency_log_interval', 10),
+            inference_backend=InferenceBackend(d.get('inference_backend', 'chainer')),
+            gpu=d.get('gpu', 0),
 
             input_statistics_path=Path(d['input_statistics_path']),
             target_statistics_path=Path(d['target_statistics_path']),
@@ -68,4 +132,7 @@ class Config(NamedTuple):
             stage1_config_path=Path(d['stage1_config_path']),
             stage2_model_path=Path(d['stage2_model_path']),
             stage2_config_path=Path(d['stage2_config_path']),
+            stage1_onnx_path=Path(d['stage1_onnx_path']) if d.get('stage1_onnx_path') is not None else None,
+            stage2_onnx_path=Path(d['stage2_onnx_path']) if d.get('stage2_onnx_path') is not None else None,
+            model_cache_path=Path(d['model_cache_path']) if d.get('model_cache_path') is not None else None,
         )
@@ -0,0 +1,78 @@
+import hashlib
+import json
+import os
+import pickle
+import struct
+from pathlib import Path
+from typing import Any, Iterable, List, Optional
+
+import numpy
+
+_magic = b'RVCCACHE'
+_header_struct = struct.Struct('<Q')  # length of the json header
+_alignment = 64
+
+
+def model_cache_key(paths: Iterable[Path]):
+    """
+    key of the source files, changed when any of them is modified.
+    """
+    h = hashlib.sha1()
+    for path in paths:
+        stat = os.stat(path)
+        h.update(f'{Path(path).resolve()}:{stat.st_size}:{stat.st_mtime_ns};'.encode())
+    return h.hexdigest()
+
+
+def _aligned(offset: int):
+    return (offset + _alignment - 1) // _alignment * _alignment
+
+
+def save_model_cache(path: Path, key: str, obj: Any):
+    """
+    pickle the object with protocol 5, and write the arrays out-of-band in the same file, aligned for memory mapping.
+    the file is written to a temporary path and renamed, so a reader never sees a partial cache.
+    """
+    buffers: List[pickle.PickleBuffer] = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    raws = [b.raw() for b in buffers]
+
+    offset = 0
+    ranges = []
+    for raw in raws:
+        offset = _aligned(offset)
+        ranges.append((offset, raw.nbytes))
+        offset += raw.nbytes
+    header = json.dumps(dict(key=key, pickle_length=len(data), buffers=ranges)).encode()
+
+    data_start = _aligned(len(_magic) + _header_struct.size + len(header) + len(data))
+    temp_path = path.with_name(path.name + '.tmp')
+    with temp_path.open('wb') as f:
+        f.write(_magic + _header_struct.pack(len(header)) + header + data)
+        for raw, (start, _) in zip(raws, ranges):
+            f.seek(data_start + start)
+            f.write(raw)
+    os.replace(temp_path, path)
+
+
+def load_model_cache(path: Path, key: str) -> Optional[Any]:
+    """
+    return None if the cache does not exist or its key is different.
+    the arrays are copy-on-write memory maps of the file, so processes loading the same cache share their pages.
+    """
+    if not path.exists():
+        return None
+
+    with path.open('rb') as f:
+        if f.read(len(_magic)) != _magic:
+            return None
+        header_length, = _header_struct.unpack(f.read(_header_struct.size))
+        header = json.loads(f.read(header_length))
+        if header['key'] != key:
+            return None
+        data = f.read(header['pickle_length'])
+
+    data_start = _aligned(len(_magic) + _header_struct.size + header_length + header['pickle_length'])
+    mapped = numpy.memmap(path, dtype=numpy.uint8, mode='c')
+    buffers = [mapped[data_start + start:data_start + start + length] for start, length in header['buffers']]
+    return pickle.loads(data, buffers=buffers)
@@ -0,0 +1,94 @@
+from pathlib import Path
+from typing import Optional, Iterable, Tuple, List
+
+import numpy
+
+from ..config import Config
+from ..converter.onnx_predictor import PredictorRecorder
+from ..converter.yukarin_converter import YukarinConverter
+
+
+def make_time_dynamic(model, axis: int = 2, name: str = 'time'):
+    """
+    replace the static time length of the inputs and outputs with a symbolic one.
+    the time axis is 2 for both predictors, (batch, channel, time) and (batch, channel, time, frequency).
+    """
+    initializers = {initializer.name for initializer in model.graph.initializer}
+    for value in list(model.graph.input) + list(model.graph.output):
+        if value.name in initializers:
+            continue
+
+        dims = value.type.tensor_type.shape.dim
+        if len(dims) > axis:
+            dims[axis].Clear()
+            dims[axis].dim_param = name
+
+    del model.graph.value_info[:]  # intermediate shapes inferred for the example length
+    return model
+
+
+def export_predictor(predictor, x: numpy.ndarray, path: Path, opset_version: Optional[int] = None):
+    import onnx
+    import onnx_chainer
+
+    model = onnx_chainer.export(predictor, x, opset_version=opset_version)
+    make_time_dynamic(model)
+    onnx.save(model, str(path))
+
+
+def parity_error(predictor, onnx_predictor, x: numpy.ndarray):
+    """
+    maximum absolute difference between the outputs of the chainer predictor and the onnx one.
+    """
+    import chainer
+
+    with chainer.using_config('train', False), chainer.using_config('enable_backprop', False):
+        expected = predictor(x).data
+    actual = onnx_predictor(x).data
+    return float(numpy.abs(expected - actual).max())
+
+
+def record_inputs(
+        converter: YukarinConverter,
+        config: Config,
+        wave: numpy.ndarray,
+        time_lengths: Iterable[float],
+) -> Tuple[List[numpy.ndarray], List[numpy.ndarray]]:
+    """
+    inputs of the stage 1 and stage 2 predictors while converting the head of the wave for each time length.
+    the converter must be on cpu.
+    """
+    from yukarin import Wave
+
+    from ..yukarin_wrapper.vocoder import Vocoder
+    from ..yukarin_wrapper.voice_changer import VoiceChanger
+
+    acoustic_converter = converter.acoustic_converter
+    super_resolution = converter.super_resolution
+    stage1_recorder = PredictorRecorder(acoustic_converter.model)
+    stage2_recorder = PredictorRecorder(super_resolution.model)
+
+    vocoder = Vocoder(
+        acoustic_param=acoustic_converter.config.dataset.acoustic_param,
+        out_sampling_rate=config.output_rate,
+        extract_f0_mode=config.extract_f0_mode,
+    )
+    voice_changer = VoiceChanger(
+        acoustic_converter=acoustic_converter,
+        super_resolution=super_resolution,
+        threshold=config.input_silent_threshold,
+        output_sampling_rate=config.output_rate,
+    )
+
+    acoustic_converter.model = stage1_recorder
+    super_resolution.model = stage2_recorder
+    try:
+        rate = config.input_rate
+        for time_length in time_lengths:
+            w = Wave(wave=wave[:round(time_length * rate)], sampling_rate=rate)
+            voice_changer.convert_from_acoustic_feature(vocoder.encode(w))
+    finally:
+        acoustic_converter.model = stage1_recorder.predictor
+        super_resolution.model = stage2_recorder.predictor
+
+    return stage1_recorder.inputs, stage2_recorder.inputs
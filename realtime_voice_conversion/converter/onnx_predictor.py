@@ -0,0 +1,61 @@
+from pathlib import Path
+from typing import NamedTuple, List, Optional
+
+import numpy
+
+
+class PredictorOutput(NamedTuple):
+    data: numpy.ndarray
+
+
+class OnnxPredictor(object):
+    """
+    onnx runtime session in place of a chainer predictor, called as `predictor(x).data` like the chainer one.
+    the session is created again after unpickling, so it can be passed to worker processes.
+    """
+
+    def __init__(self, path: Path, use_gpu: bool = False, num_threads: Optional[int] = None):
+        self.path = path
+        self.use_gpu = use_gpu
+        self.num_threads = num_threads
+        self._create_session()
+
+    def _create_session(self):
+        import onnxruntime
+
+        options = onnxruntime.SessionOptions()
+        if self.num_threads is not None:
+            options.intra_op_num_threads = self.num_threads
+
+        providers = ['CPUExecutionProvider']
+        if self.use_gpu:
+            providers.insert(0, 'CUDAExecutionProvider')
+
+        self.session = onnxruntime.InferenceSession(str(self.path), options, providers=providers)
+        self.input_name = self.session.get_inputs()[0].name
+
+    def __getstate__(self):
+        return dict(path=self.path, use_gpu=self.use_gpu, num_threads=self.num_threads)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._create_session()
+
+    def __call__(self, x):
+        x = numpy.asarray(x, dtype=numpy.float32)
+        out, = self.session.run(None, {self.input_name: x})
+        return PredictorOutput(data=out)
+
+
+class PredictorRecorder(object):
+    """
+    predictor wrapper keeping the inputs, to get example inputs of the shape the converter actually uses.
+    """
+
+    def __init__(self, predictor):
+        self.predictor = predictor
+        self.inputs: List[numpy.ndarray] = []
+
+    def __call__(self, x):
+        self.inputs.append(numpy.array(x))
+        return self.predictor(x)
@@ -0,0 +1,93 @@
+from pathlib import Path
+from typing import List, Optional
+
+import numpy
+from yukarin.acoustic_feature import AcousticFeature
+
+from ..stream import EncodeStream, ConvertStream, StreamWrapper
+from ..yukarin_wrapper.acoustic_feature_wrapper import AcousticFeatureWrapper
+from ..yukarin_wrapper.vocoder import Vocoder
+from ..yukarin_wrapper.voice_changer import VoiceChanger
+
+
+def encode_chunks(
+        vocoder: Vocoder,
+        wave: numpy.ndarray,
+        time_length: float,
+        extra_time: float,
+        future_extra_time: Optional[float] = None,
+        ring_buffer_time: Optional[float] = None,
+):
+    """
+    features of the chunks of the wave, produced by EncodeStream as in the realtime conversion.
+    """
+    stream = EncodeStream(vocoder=vocoder, ring_buffer_time=ring_buffer_time)
+    stream_wrapper = StreamWrapper(stream=stream, extra_time=extra_time, future_extra_time=future_extra_time)
+
+    length = stream.to_index(time_length)
+    features: List[AcousticFeatureWrapper] = []
+    for i in range(len(wave) // length):
+        stream_wrapper.add(data=wave[i * length:(i + 1) * length], time_length=time_length)
+        features.append(stream_wrapper.process_next(time_length=time_length))
+    return features
+
+
+def convert_chunks(
+        voice_changer: VoiceChanger,
+        features: List[AcousticFeatureWrapper],
+        time_length: float,
+        extra_time: float,
+        future_extra_time: Optional[float] = None,
+        ring_buffer_time: Optional[float] = None,
+):
+    stream_wrapper = StreamWrapper(
+        stream=ConvertStream(voice_changer=voice_changer, ring_buffer_time=ring_buffer_time),
+        extra_time=extra_time,
+        future_extra_time=future_extra_time,
+    )
+
+    out_features: List[AcousticFeature] = []
+    for feature in features:
+        stream_wrapper.add(data=feature, time_length=time_length)
+        out_features.append(stream_wrapper.process_next(time_length=time_length))
+    return out_features
+
+
+def quantize_predictor(float_path: Path, quantized_path: Path, inputs: List[numpy.ndarray], per_channel: bool = False):
+    """
+    int8 static quantization of the onnx model, with the activation ranges calibrated on the inputs.
+    per channel quantization needs the model of opset 13 or later.
+    """
+    from onnxruntime.quantization import quantize_static, CalibrationDataReader, QuantFormat, QuantType
+
+    class InputsDataReader(CalibrationDataReader):
+        def __init__(self, input_name: str):
+            self.iterator = iter(inputs)
+            self.input_name = input_name
+
+        def get_next(self):
+            x = next(self.iterator, None)
+            if x is None:
+                return None
+            return {self.input_name: x.astype(numpy.float32)}
+
+    import onnx
+    input_name = onnx.load(str(float_path)).graph.input[0].name
+
+    quantize_static(
+        model_input=str(float_path),
+        model_output=str(quantized_path),
+        calibration_data_reader=InputsDataReader(input_name),
+        quant_format=QuantFormat.QDQ,
+        activation_type=QuantType.QInt8,
+        weight_type=QuantType.QInt8,
+        per_channel=per_channel,
+    )
+
+
+def log_spectral_distance(a: numpy.ndarray, b: numpy.ndarray, eps: float = 1e-16):
+    """
+    root mean square of the difference of the spectral envelopes in db, averaged over the frames.
+    """
+    diff = 10 * (numpy.log10(a + eps) - numpy.log10(b + eps))
+    return float(numpy.sqrt((diff ** 2).mean(axis=1)).mean())
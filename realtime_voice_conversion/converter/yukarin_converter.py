@@ -1,5 +1,6 @@
 import logging
 from pathlib import Path
+from typing import Optional
 
 from become_yukarin import SuperResolution
 from become_yukarin.config.sr_config import create_from_json as create_sr_config
@@ -7,6 +8,9 @@ from yukarin import AcousticConverter
 from yukarin.config import create_from_json as create_config
 from yukarin.f0_converter import F0Converter
 
+from realtime_voice_conversion.config import InferenceBackend
+from realtime_voice_conversion.converter.model_cache import model_cache_key, load_model_cache, save_model_cache
+from realtime_voice_conversion.converter.onnx_predictor import OnnxPredictor
 from realtime_voice_conversion.worker.utility import init_logger
 
 
@@ -19,6 +23,30 @@ class YukarinConverter(object):
         self.acoustic_converter = acoustic_converter
         self.super_resolution = super_resolution
 
+    def setup_inference(
+            self,
+            gpu: Optional[int],
+            inference_backend: InferenceBackend,
+            stage1_onnx_path: Optional[Path],
+            stage2_onnx_path: Optional[Path],
+    ):
+        """
+        move the models loaded on cpu to the gpu,
+        or replace the predictors with onnx runtime sessions, on the gpu if gpu is not None.
+        """
+        if inference_backend == InferenceBackend.ONNX:
+            if stage1_onnx_path is None or stage2_onnx_path is None:
+                raise ValueError('stage1_onnx_path and stage2_onnx_path are needed for the onnx backend')
+            self.acoustic_converter.model = OnnxPredictor(stage1_onnx_path, use_gpu=gpu is not None)
+            self.super_resolution.model = OnnxPredictor(stage2_onnx_path, use_gpu=gpu is not None)
+        elif gpu is not None:
+            from chainer import cuda
+
+            for model_converter in (self.acoustic_converter, self.super_resolution):
+                model_converter.model.to_gpu(gpu)
+                model_converter.gpu = gpu
+            cuda.get_device_from_id(gpu).use()
+
     @staticmethod
     def make_yukarin_converter(
             input_statistics_path: Path,
@@ -27,11 +55,65 @@ class YukarinConverter(object):
             stage1_config_path: Path,
             stage2_model_path: Path,
             stage2_config_path: Path,
+            gpu: Optional[int] = 0,
+            inference_backend: InferenceBackend = InferenceBackend.CHAINER,
+            stage1_onnx_path: Optional[Path] = None,
+            stage2_onnx_path: Optional[Path] = None,
+            model_cache_path: Optional[Path] = None,
     ):
+        """
+        the models are loaded on cpu, from the model cache if it is given and up to date, then set up for inference.
+        """
         logger = logging.getLogger('encode')
         init_logger(logger)
         logger.info('make_yukarin_converter')
 
+        converter: Optional[YukarinConverter] = None
+        if model_cache_path is not None:
+            key = model_cache_key([
+                input_statistics_path,
+                target_statistics_path,
+                stage1_model_path,
+                stage1_config_path,
+                stage2_model_path,
+                stage2_config_path,
+            ])
+            converter = load_model_cache(model_cache_path, key=key)
+            if converter is not None:
+                logger.info('models loaded from cache!')
+
+        if converter is None:
+            converter = YukarinConverter._load_models(
+                input_statistics_path=input_statistics_path,
+                target_statistics_path=target_statistics_path,
+                stage1_model_path=stage1_model_path,
+                stage1_config_path=stage1_config_path,
+                stage2_model_path=stage2_model_path,
+                stage2_config_path=stage2_config_path,
+            )
+            if model_cache_path is not None:
+                save_model_cache(model_cache_path, key=key, obj=converter)
+                logger.info('model cache saved!')
+
+        converter.setup_inference(
+            gpu=gpu,
+            inference_backend=inference_backend,
+            stage1_onnx_path=stage1_onnx_path,
+            stage2_onnx_path=stage2_onnx_path,
+        )
+        return converter
+
+    @staticmethod
+    def _load_models(
+            input_statistics_path: Path,
+            target_statistics_path: Path,
+            stage1_model_path: Path,
+            stage1_config_path: Path,
+            stage2_model_path: Path,
+            stage2_config_path: Path,
+    ):
+        logger = logging.getLogger('encode')
+
         f0_converter = F0Converter(
             input_statistics=input_statistics_path,
             target_statistics=target_statistics_path,
@@ -41,7 +123,7 @@ class YukarinConverter(object):
         acoustic_converter = AcousticConverter(
             config=config,
             model_path=stage1_model_path,
-            gpu=0,
+            gpu=None,
             f0_converter=f0_converter,
             out_sampling_rate=24000,
         )
@@ -51,9 +133,10 @@ class YukarinConverter(object):
         super_resolution = SuperResolution(
             config=sr_config,
             model_path=stage2_model_path,
-            gpu=0,
+            gpu=None,
         )
         logger.info('model 2 loaded!')
+
         return YukarinConverter(
             acoustic_converter=acoustic_converter,
             super_resolution=super_resolution,
@@ -1,5 +1,6 @@
-from typing import Iterable
+from typing import Iterable, Optional
 
+import numpy
 from yukarin.acoustic_feature import AcousticFeature
 
 from ..segment.segment import BaseSegmentMethod
@@ -18,13 +19,21 @@ class FeatureSegmentMethod(BaseSegmentMethod[AcousticFeature]):
         self.order = order
 
         self._keys = ['f0', 'ap', 'sp', 'voiced']
+        self._silent: Optional[AcousticFeature] = None
+
+    @property
+    def keys(self):
+        return self._keys
 
     def length(self, data: AcousticFeature) -> int:
         return len(data.f0)
 
     def pad(self, width: int):
-        sizes = AcousticFeature.get_sizes(sampling_rate=self.wave_sampling_rate, order=self.order)
-        return AcousticFeature.silent(width, sizes=sizes, keys=self._keys)
+        if self._silent is None or self.length(self._silent) < width:
+            length = width if self._silent is None else max(width, self.length(self._silent) * 2)
+            sizes = AcousticFeature.get_sizes(sampling_rate=self.wave_sampling_rate, order=self.order)
+            self._silent = AcousticFeature.silent(length, sizes=sizes, keys=self._keys)
+        return self._silent.pick(0, width, keys=self._keys)
 
     def pick(self, data: AcousticFeatureWrapper, first: int, last: int):
         """
@@ -35,3 +44,6 @@ class FeatureSegmentMethod(BaseSegmentMethod[AcousticFeature]):
 
     def concat(self, datas: Iterable[AcousticFeatureWrapper]):
         return AcousticFeature.concatenate(list(datas), keys=self._keys)
+
+    def nbytes(self, data: AcousticFeature):
+        return sum(v.nbytes for v in data.__dict__.values() if isinstance(v, numpy.ndarray))
@@ -1,4 +1,4 @@
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 import numpy
 from yukarin.acoustic_feature import AcousticFeature
@@ -22,20 +22,28 @@ class FeatureWrapperSegmentMethod(BaseSegmentMethod[AcousticFeatureWrapper]):
         self.frame_period = frame_period
 
         self._keys = ['f0', 'ap', 'mc', 'voiced'] if keys is None else keys
+        self._silent: Optional[AcousticFeatureWrapper] = None
+
+    @property
+    def keys(self):
+        return self._keys
 
     def length(self, data: AcousticFeatureWrapper) -> int:
         return len(data.f0)
 
     def pad(self, width: int):
-        sizes = AcousticFeature.get_sizes(sampling_rate=self.wave_sampling_rate, order=self.order)
-        return AcousticFeatureWrapper.silent_wrapper(
-            width,
-            sizes=sizes,
-            keys=self._keys,
-            frame_period=self.frame_period,
-            sampling_rate=self.wave_sampling_rate,
-            wave_dtype=numpy.float32,
-        ).astype_only_float_wrapper(numpy.float32)
+        if self._silent is None or self.length(self._silent) < width:
+            length = width if self._silent is None else max(width, self.length(self._silent) * 2)
+            sizes = AcousticFeature.get_sizes(sampling_rate=self.wave_sampling_rate, order=self.order)
+            self._silent = AcousticFeatureWrapper.silent_wrapper(
+                length,
+                sizes=sizes,
+                keys=self._keys,
+                frame_period=self.frame_period,
+                sampling_rate=self.wave_sampling_rate,
+                wave_dtype=numpy.float32,
+            ).astype_only_float_wrapper(numpy.float32)
+        return self.pick(self._silent, 0, width)
 
     def pick(self, data: AcousticFeatureWrapper, first: int, last: int):
         return data.pick_wrapper(
@@ -47,3 +55,6 @@ class FeatureWrapperSegmentMethod(BaseSegmentMethod[AcousticFeatureWrapper]):
 
     def concat(self, datas: Iterable[AcousticFeatureWrapper]):
         return AcousticFeatureWrapper.concatenate_wrapper(list(datas), keys=self._keys)
+
+    def nbytes(self, data: AcousticFeatureWrapper):
+        return sum(v.nbytes for v in data.__dict__.values() if isinstance(v, numpy.ndarray)) + data.wave.wave.nbytes
@@ -24,23 +24,23 @@ class BaseSegmentMethod(Generic[T]):
     def concat(self, datas: Iterable[T]) -> T:
         raise NotImplementedError()
 
+    def nbytes(self, data: T) -> int:
+        raise NotImplementedError()
+
 
-class Segment(tuple, Generic[T]):
-    start_time: float
-    data: T
-    method: BaseSegmentMethod[T]
+class Segment(Generic[T]):
+    __slots__ = ('start', 'end', 'data', 'method')
 
-    def __new__(
-            cls,
-            start_time: float,
+    def __init__(
+            self,
+            start: int,
             data: T,
             method: BaseSegmentMethod[T],
     ):
-        self = tuple.__new__(Segment, (start_time, data, method))
-        self.start_time = start_time
+        self.start = start
+        self.end = start + method.length(data)
         self.data = data
         self.method = method
-        return self
 
     @property
     def sampling_rate(self) -> int:
@@ -48,7 +48,11 @@ class Segment(tuple, Generic[T]):
 
     @property
     def length(self) -> int:
-        return self.method.length(self.data)
+        return self.end - self.start
+
+    @property
+    def start_time(self) -> float:
+        return self.start / self.sampling_rate
 
     @property
     def time_length(self) -> float:
@@ -56,4 +60,4 @@ class Segment(tuple, Generic[T]):
 
     @property
     def end_time(self) -> float:
-        return self.time_length + self.start_time
+        return self.end / self.sampling_rate
@@ -0,0 +1,63 @@
+import bisect
+from typing import Generic, Iterator, List, TypeVar
+
+from ..segment.segment import Segment
+
+T = TypeVar('T')
+
+
+class SegmentIndex(Generic[T]):
+    def __init__(self):
+        self._segments: List[Segment[T]] = []  # sorted by start
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._max_ends: List[int] = []  # running maximum of ends, monotonic so it can be bisected
+        self._head = 0  # removed segments before head are compacted lazily
+
+    def __len__(self):
+        return len(self._segments) - self._head
+
+    def __iter__(self) -> Iterator[Segment[T]]:
+        return iter(self._segments[self._head:])
+
+    def add(self, segment: Segment[T]):
+        start = segment.start
+        end = segment.end
+
+        i = bisect.bisect_right(self._starts, start, lo=self._head)
+        self._segments.insert(i, segment)
+        self._starts.insert(i, start)
+        self._ends.insert(i, end)
+        self._max_ends.insert(i, max(self._max_ends[i - 1], end) if i > self._head else end)
+
+        for j in range(i + 1, len(self._max_ends)):
+            if self._max_ends[j] >= end:
+                break
+            self._max_ends[j] = end
+
+    def remove(self, end: int):
+        first = bisect.bisect_right(self._max_ends, end, lo=self._head)
+        last = bisect.bisect_right(self._starts, end, lo=first)
+
+        removes = [i for i in range(first, last) if self._ends[i] <= end]
+        for i in reversed(removes):
+            del self._segments[i]
+            del self._starts[i]
+            del self._ends[i]
+            del self._max_ends[i]
+
+        self._head = first
+
+        if self._head > len(self._segments) // 2:
+            del self._segments[:self._head]
+            del self._starts[:self._head]
+            del self._ends[:self._head]
+            del self._max_ends[:self._head]
+            self._head = 0
+
+    def overlap(self, start: int, end: int) -> Iterator[Segment[T]]:
+        first = bisect.bisect_right(self._max_ends, start, lo=self._head)
+        last = bisect.bisect_left(self._starts, end, lo=first)
+        for i in range(first, last):
+            if self._ends[i] > start:
+                yield self._segments[i]
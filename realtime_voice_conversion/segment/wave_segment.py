@@ -17,3 +17,6 @@ class WaveSegmentMethod(BaseSegmentMethod[numpy.ndarray]):
 
     def concat(self, datas: Iterable[numpy.ndarray]):
         return numpy.concatenate(datas)
+
+    def nbytes(self, data: numpy.ndarray):
+        return data.nbytes
@@ -0,0 +1,69 @@
+import socket
+import struct
+from typing import NamedTuple, Optional, Tuple
+
+import numpy
+
+_info_struct = struct.Struct('<IIII')  # input rate, output rate, input chunk, output chunk
+_chunk_struct = struct.Struct('<qI')  # index, number of samples
+
+
+class SessionInfo(NamedTuple):
+    input_rate: int
+    output_rate: int
+    in_audio_chunk: int
+    out_audio_chunk: int
+
+
+def _receive_exactly(sock: socket.socket, size: int) -> Optional[bytes]:
+    data = bytearray()
+    while len(data) < size:
+        received = sock.recv(size - len(data))
+        if len(received) == 0:
+            return None  # closed
+        data += received
+    return bytes(data)
+
+
+def send_info(sock: socket.socket, info: SessionInfo):
+    sock.sendall(_info_struct.pack(*info))
+
+
+def receive_info(sock: socket.socket) -> Optional[SessionInfo]:
+    data = _receive_exactly(sock, _info_struct.size)
+    if data is None:
+        return None
+    return SessionInfo(*_info_struct.unpack(data))
+
+
+def send_chunk(sock: socket.socket, index: int, wave: Optional[numpy.ndarray]):
+    """
+    the wave is sent as float32 samples. None is sent as no samples, meaning silence.
+    """
+    if wave is None:
+        sock.sendall(_chunk_struct.pack(index, 0))
+        return
+
+    payload = numpy.ascontiguousarray(wave, dtype=numpy.float32).tobytes()
+    sock.sendall(_chunk_struct.pack(index, len(wave)) + payload)
+
+
+def receive_chunk(sock: socket.socket, chunk_length: int) -> Optional[Tuple[int, Optional[numpy.ndarray]]]:
+    """
+    return None if the connection is closed.
+    raise ValueError if the number of samples is neither chunk_length nor 0, before receiving the samples.
+    """
+    header = _receive_exactly(sock, _chunk_struct.size)
+    if header is None:
+        return None
+
+    index, length = _chunk_struct.unpack(header)
+    if length == 0:
+        return index, None
+    if length != chunk_length:
+        raise ValueError(f'chunk {index} has {length} samples, expected {chunk_length}')
+
+    payload = _receive_exactly(sock, length * 4)
+    if payload is None:
+        return None
+    return index, numpy.frombuffer(payload, dtype=numpy.float32).copy()
@@ -0,0 +1,138 @@
+import threading
+from typing import Optional
+
+import numpy
+from become_yukarin import SuperResolution
+from yukarin import AcousticConverter
+
+from realtime_voice_conversion.buffer.array_ring_buffer import ArrayRingBuffer
+from realtime_voice_conversion.config import Config
+from realtime_voice_conversion.stream import EncodeStream, ConvertStream, DecodeStream
+from realtime_voice_conversion.stream import StreamWrapper
+from realtime_voice_conversion.vad.voice_activity_detector import VoiceActivityDetector
+from realtime_voice_conversion.worker.utility import SilenceGate
+from realtime_voice_conversion.yukarin_wrapper.vocoder import RealtimeVocoder
+from realtime_voice_conversion.yukarin_wrapper.voice_changer import VoiceChanger
+
+
+class Session(object):
+    """
+    conversion state of one client, processing its chunks in order in the calling thread.
+    each session has its own streams and its own synthesizer,
+    and the models are shared between sessions, used while holding model_lock.
+    silent spans are skipped in each stage as the workers do, so they do not wait for the models.
+    """
+
+    def __init__(
+            self,
+            config: Config,
+            acoustic_converter: AcousticConverter,
+            super_resolution: SuperResolution,
+            model_lock: threading.Lock,
+    ):
+        self.config = config
+        self.model_lock = model_lock
+
+        self.realtime_vocoder = RealtimeVocoder(
+            acoustic_param=acoustic_converter.config.dataset.acoustic_param,
+            out_sampling_rate=config.output_rate,
+            extract_f0_mode=config.extract_f0_mode,
+        )
+        self.realtime_vocoder.create_synthesizer(
+            buffer_size=config.vocoder_buffer_size,
+            number_of_pointers=16,
+        )
+
+        self.encode_stream_wrapper = StreamWrapper(
+            stream=EncodeStream(vocoder=self.realtime_vocoder, ring_buffer_time=config.ring_buffer_time),
+            extra_time=config.encode_extra_time,
+            future_extra_time=config.encode_future_extra_time,
+            retention_time=config.retention_time,
+        )
+        self.convert_stream_wrapper = StreamWrapper(
+            stream=ConvertStream(
+                voice_changer=VoiceChanger(
+                    super_resolution=super_resolution,
+                    acoustic_converter=acoustic_converter,
+                    threshold=config.input_silent_threshold,
+                ),
+                ring_buffer_time=config.ring_buffer_time,
+            ),
+            extra_time=config.convert_extra_time,
+            future_extra_time=config.convert_future_extra_time,
+            retention_time=config.retention_time,
+        )
+        self.decode_stream_wrapper = StreamWrapper(
+            stream=DecodeStream(vocoder=self.realtime_vocoder, ring_buffer_time=config.ring_buffer_time),
+            extra_time=config.decode_extra_time,
+            future_extra_time=config.decode_future_extra_time,
+            retention_time=config.retention_time,
+        )
+
+        if config.input_gate_threshold is not None:
+            self.input_voice_activity_detector: Optional[VoiceActivityDetector] = \
+                VoiceActivityDetector(threshold=-config.input_gate_threshold)
+        else:
+            self.input_voice_activity_detector = None
+        self.encode_silence_gate = self._create_silence_gate(self.encode_stream_wrapper)
+        self.convert_silence_gate = self._create_silence_gate(self.convert_stream_wrapper)
+        self.decode_silence_gate = self._create_silence_gate(self.decode_stream_wrapper)
+        self.index = 0
+
+        self.voice_activity_detector = VoiceActivityDetector(threshold=-config.output_silent_threshold)
+        self.wave_fragment = ArrayRingBuffer(capacity=config.out_audio_chunk * 4)
+        self.fragment_start = 0
+
+    def _create_silence_gate(self, stream_wrapper: StreamWrapper):
+        return SilenceGate(time_length=self.config.buffer_time, context_time=stream_wrapper.context_time)
+
+    @property
+    def silent_length(self):
+        stream = self.decode_stream_wrapper.stream
+        return round(self.config.buffer_time * stream.out_segment_method.sampling_rate)
+
+    def process(self, wave: numpy.ndarray) -> Optional[numpy.ndarray]:
+        """
+        convert one input chunk, and return one output chunk or None for silence.
+        """
+        time_length = self.config.buffer_time
+        index = self.index
+        self.index += 1
+
+        self.encode_stream_wrapper.add(data=wave, time_length=time_length)
+        detector = self.input_voice_activity_detector
+        voiced = detector is None or detector.process(wave)
+        if self.encode_silence_gate.update(index=index, voiced=voiced):
+            self.encode_stream_wrapper.skip_next(time_length=time_length)
+            feature = None  # silent span
+        else:
+            feature = self.encode_stream_wrapper.process_next(time_length=time_length)
+
+        self.convert_stream_wrapper.add(data=feature, time_length=time_length)
+        if self.convert_silence_gate.update(index=index, voiced=feature is not None):
+            self.convert_stream_wrapper.skip_next(time_length=time_length)
+            feature = None
+        else:
+            with self.model_lock:
+                feature = self.convert_stream_wrapper.process_next(time_length=time_length)
+
+        self.decode_stream_wrapper.add(data=feature, time_length=time_length)
+        if self.decode_silence_gate.update(index=index, voiced=feature is not None):
+            self.decode_stream_wrapper.skip_next(time_length=time_length)
+            out_wave = numpy.zeros(self.silent_length, dtype=numpy.float32)
+        else:
+            out_wave = self.decode_stream_wrapper.process_next(time_length=time_length)
+
+        out_audio_chunk = self.config.out_audio_chunk
+        self.wave_fragment.write(start=self.wave_fragment.end, data=out_wave)
+        if self.wave_fragment.end - self.fragment_start < out_audio_chunk:
+            return None
+
+        out_wave = self.wave_fragment.read(start=self.fragment_start, length=out_audio_chunk)
+        self.fragment_start += out_audio_chunk
+        if not self.voice_activity_detector.process(out_wave):
+            return None
+        return out_wave
+
+    def close(self):
+        self.realtime_vocoder.destroy_synthesizer()
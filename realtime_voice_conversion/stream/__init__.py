@@ -1,4 +1,5 @@
 from .convert_stream import ConvertStream
 from .decode_stream import DecodeStream
 from .encode_stream import EncodeStream
+from .incremental_encode_stream import IncrementalEncodeStream
 from .stream_wrapper import StreamWrapper
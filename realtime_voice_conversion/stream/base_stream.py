@@ -1,7 +1,9 @@
 from abc import abstractmethod
-from typing import List, TypeVar, Generic
+from typing import List, TypeVar, Generic, Optional
 
+from realtime_voice_conversion.buffer.base_buffer import BaseBuffer
 from realtime_voice_conversion.segment.segment import BaseSegmentMethod, Segment
+from realtime_voice_conversion.segment.segment_index import SegmentIndex
 
 T_IN = TypeVar('T_IN')
 T_OUT = TypeVar('T_OUT')
@@ -12,72 +14,106 @@ class BaseStream(Generic[T_IN, T_OUT]):
             self,
             in_segment_method: BaseSegmentMethod[T_IN],
             out_segment_method: BaseSegmentMethod[T_OUT],
+            buffer: Optional[BaseBuffer[T_IN]] = None,
     ):
         self.in_segment_method = in_segment_method
         self.out_segment_method = out_segment_method
+        self.buffer = buffer
 
-        self.stream: List[Segment[T_IN]] = []
+        self.stream: SegmentIndex[T_IN] = SegmentIndex()
+
+    @property
+    def buffered_time(self) -> float:
+        if self.buffer is not None:
+            length = self.buffer.length
+        else:
+            length = sum(segment.length for segment in self.stream)
+        return length / self.in_segment_method.sampling_rate
+
+    @property
+    def buffered_nbytes(self) -> int:
+        if self.buffer is not None:
+            return self.buffer.nbytes
+        else:
+            return sum(self.in_segment_method.nbytes(segment.data) for segment in self.stream)
+
+    def lookback_time(self, extra_time: float) -> float:
+        return extra_time
+
+    def to_index(self, time: float) -> int:
+        return round(time * self.in_segment_method.sampling_rate)
 
     def add(self, start_time: float, data: T_IN):
+        self.add_index(start=self.to_index(start_time), data=data)
+
+    def add_index(self, start: int, data: T_IN):
+        if self.buffer is not None:
+            self.buffer.write(start=start, data=data)
+            return
+
         segment = Segment(
-            start_time=start_time,
+            start=start,
             data=data,
             method=self.in_segment_method,
         )
-        self.stream.append(segment)
+        self.stream.add(segment)
 
     def remove(self, end_time: float):
-        self.stream = list(filter(lambda s: s.end_time > end_time, self.stream))
+        if self.buffer is not None:
+            return  # old data is overwritten by the ring buffer
+
+        self.stream.remove(end=self.to_index(end_time))
 
     def fetch(
             self,
             start_time: float,
             time_length: float,
             extra_time: float,
+            future_extra_time: Optional[float] = None,
     ) -> T_IN:
-        rate = self.in_segment_method.sampling_rate
-        start_time -= extra_time
-        time_length += extra_time * 2
+        if future_extra_time is None:
+            future_extra_time = extra_time
 
-        end_time = start_time + time_length
-        stream = filter(lambda s: not (end_time < s.start_time or s.end_time < start_time), self.stream)
+        return self.fetch_index(
+            start=self.to_index(start_time - extra_time),
+            end=self.to_index(start_time + time_length + future_extra_time),
+        )
 
-        start_time_buffer = start_time
-        remaining_time = time_length
+    def fetch_index(self, start: int, end: int) -> T_IN:
+        if self.buffer is not None:
+            return self.buffer.read(start=start, length=end - start)
+
+        position = start
         buffer_list: List[T_IN] = []
-        for segment in stream:
+        for segment in self.stream.overlap(start=start, end=end):
             # padding
-            if segment.start_time > start_time_buffer:
-                length = round((segment.start_time - start_time_buffer) * rate)
-                pad = self.in_segment_method.pad(length)
-                buffer_list.append(pad)
-                remaining_time -= segment.start_time - start_time_buffer
-                start_time_buffer = segment.start_time
-
-            if remaining_time > segment.end_time - start_time_buffer:
-                one_time_length = segment.end_time - start_time_buffer
-            else:
-                one_time_length = remaining_time
-
-            first_index = round((start_time_buffer - segment.start_time) * rate)
-            last_index = round(first_index + one_time_length * rate)
-            one_buffer = self.in_segment_method.pick(segment.data, first_index, last_index)
-            buffer_list.append(one_buffer)
-
-            start_time_buffer += one_time_length
-            remaining_time -= one_time_length
-
-            if start_time_buffer >= end_time:
-                break
-        else:
-            # last padding
-            length = round((end_time - start_time_buffer) * rate)
-            pad = self.in_segment_method.pad(length)
-            buffer_list.append(pad)
+            if segment.start > position:
+                buffer_list.append(self.in_segment_method.pad(segment.start - position))
+                position = segment.start
+
+            last = min(segment.end, end)
+            if last <= position:
+                continue
+
+            buffer_list.append(self.in_segment_method.pick(segment.data, position - segment.start, last - segment.start))
+            position = last
+
+        # last padding
+        if position < end or len(buffer_list) == 0:
+            buffer_list.append(self.in_segment_method.pad(end - position))
 
         buffer = self.in_segment_method.concat(buffer_list)
         return buffer
 
     @abstractmethod
-    def process(self, start_time: float, time_length: float, extra_time: float) -> T_OUT:
+    def process(
+            self,
+            start_time: float,
+            time_length: float,
+            extra_time: float,
+            future_extra_time: Optional[float] = None,
+    ) -> T_OUT:
+        """
+        extra_time is the past context, and future_extra_time is the future context (same as extra_time if None).
+        """
         raise NotImplementedError()
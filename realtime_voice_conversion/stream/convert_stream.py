@@ -1,5 +1,8 @@
+from typing import Optional
+
 from yukarin.acoustic_feature import AcousticFeature
 
+from ..buffer.feature_ring_buffer import FeatureWrapperRingBuffer
 from ..segment.feature_segment import FeatureSegmentMethod
 from ..segment.feature_wrapper_segment import FeatureWrapperSegmentMethod
 from ..stream.base_stream import BaseStream
@@ -11,34 +14,59 @@ class ConvertStream(BaseStream[AcousticFeatureWrapper, AcousticFeature]):
     def __init__(
             self,
             voice_changer: VoiceChanger,
+            ring_buffer_time: Optional[float] = None,
     ):
         acoustic_converter_acoustic_param = voice_changer.acoustic_converter.config.dataset.acoustic_param
         super_resolution_acoustic_param = voice_changer.super_resolution.config.dataset.param.acoustic_feature_param
+        in_segment_method = FeatureWrapperSegmentMethod(
+            sampling_rate=1000 // acoustic_converter_acoustic_param.frame_period,
+            wave_sampling_rate=acoustic_converter_acoustic_param.sampling_rate,
+            order=acoustic_converter_acoustic_param.order,
+            frame_period=acoustic_converter_acoustic_param.frame_period,
+        )
+
+        if ring_buffer_time is not None:
+            buffer = FeatureWrapperRingBuffer(
+                capacity=round(ring_buffer_time * in_segment_method.sampling_rate),
+                segment_method=in_segment_method,
+            )
+        else:
+            buffer = None
+
         super().__init__(
-            in_segment_method=FeatureWrapperSegmentMethod(
-                sampling_rate=1000 // acoustic_converter_acoustic_param.frame_period,
-                wave_sampling_rate=acoustic_converter_acoustic_param.sampling_rate,
-                order=acoustic_converter_acoustic_param.order,
-                frame_period=acoustic_converter_acoustic_param.frame_period,
-            ),
+            in_segment_method=in_segment_method,
             out_segment_method=FeatureSegmentMethod(
                 sampling_rate=1000 // super_resolution_acoustic_param.frame_period,
                 wave_sampling_rate=voice_changer.output_sampling_rate,
                 order=super_resolution_acoustic_param.order,
             ),
+            buffer=buffer,
         )
         self.voice_changer = voice_changer
 
-    def process(self, start_time: float, time_length: float, extra_time: float) -> AcousticFeature:
+    def process(
+            self,
+            start_time: float,
+            time_length: float,
+            extra_time: float,
+            future_extra_time: Optional[float] = None,
+    ) -> AcousticFeature:
+        if future_extra_time is None:
+            future_extra_time = extra_time
+
         in_feature = self.fetch(
             start_time=start_time,
             time_length=time_length,
             extra_time=extra_time,
+            future_extra_time=future_extra_time,
         )
         out_feature = self.voice_changer.convert_from_acoustic_feature(in_feature)
 
-        pad = round(extra_time * self.in_segment_method.sampling_rate)
-        if pad > 0:
-            out_feature = self.out_segment_method.pick(out_feature, pad, -pad)
+        rate = self.in_segment_method.sampling_rate
+        pad = round(extra_time * rate)
+        future_pad = round(future_extra_time * rate)
+        if pad > 0 or future_pad > 0:
+            length = self.out_segment_method.length(out_feature)
+            out_feature = self.out_segment_method.pick(out_feature, pad, length - future_pad)
 
         return out_feature
@@ -1,6 +1,9 @@
+from typing import Optional
+
 import numpy
 from yukarin.acoustic_feature import AcousticFeature
 
+from ..buffer.feature_ring_buffer import FeatureRingBuffer
 from ..segment.feature_segment import FeatureSegmentMethod
 from ..segment.wave_segment import WaveSegmentMethod
 from ..stream.base_stream import BaseStream
@@ -11,24 +14,43 @@ class DecodeStream(BaseStream[AcousticFeature, numpy.ndarray]):
     def __init__(
             self,
             vocoder: Vocoder,
+            ring_buffer_time: Optional[float] = None,
     ):
+        in_segment_method = FeatureSegmentMethod(
+            sampling_rate=1000 // vocoder.acoustic_param.frame_period,
+            wave_sampling_rate=vocoder.out_sampling_rate,
+            order=vocoder.acoustic_param.order,
+        )
+
+        if ring_buffer_time is not None:
+            buffer = FeatureRingBuffer(
+                capacity=round(ring_buffer_time * in_segment_method.sampling_rate),
+                segment_method=in_segment_method,
+            )
+        else:
+            buffer = None
+
         super().__init__(
-            in_segment_method=FeatureSegmentMethod(
-                sampling_rate=1000 // vocoder.acoustic_param.frame_period,
-                wave_sampling_rate=vocoder.out_sampling_rate,
-                order=vocoder.acoustic_param.order,
-            ),
+            in_segment_method=in_segment_method,
             out_segment_method=WaveSegmentMethod(
                 sampling_rate=vocoder.out_sampling_rate,
             ),
+            buffer=buffer,
         )
         self.vocoder = vocoder
 
-    def process(self, start_time: float, time_length: float, extra_time: float) -> numpy.ndarray:
+    def process(
+            self,
+            start_time: float,
+            time_length: float,
+            extra_time: float,
+            future_extra_time: Optional[float] = None,
+    ) -> numpy.ndarray:
         out_feature = self.fetch(
             start_time=start_time,
             time_length=time_length,
             extra_time=extra_time,
+            future_extra_time=future_extra_time,
         )
 
         wave = self.vocoder.decode(
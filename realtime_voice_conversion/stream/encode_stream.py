@@ -1,6 +1,9 @@
+from typing import Optional
+
 import numpy
 from yukarin.wave import Wave
 
+from ..buffer.array_ring_buffer import ArrayRingBuffer
 from ..segment.feature_wrapper_segment import FeatureWrapperSegmentMethod
 from ..segment.wave_segment import WaveSegmentMethod
 from ..stream.base_stream import BaseStream
@@ -12,7 +15,13 @@ class EncodeStream(BaseStream[numpy.ndarray, AcousticFeatureWrapper]):
     def __init__(
             self,
             vocoder: Vocoder,
+            ring_buffer_time: Optional[float] = None,
     ):
+        if ring_buffer_time is not None:
+            buffer = ArrayRingBuffer(capacity=round(ring_buffer_time * vocoder.acoustic_param.sampling_rate))
+        else:
+            buffer = None
+
         super().__init__(
             in_segment_method=WaveSegmentMethod(
                 sampling_rate=vocoder.acoustic_param.sampling_rate,
@@ -23,20 +32,34 @@ class EncodeStream(BaseStream[numpy.ndarray, AcousticFeatureWrapper]):
                 order=vocoder.acoustic_param.order,
                 frame_period=vocoder.acoustic_param.frame_period,
             ),
+            buffer=buffer,
         )
         self.vocoder = vocoder
 
-    def process(self, start_time: float, time_length: float, extra_time: float) -> AcousticFeatureWrapper:
+    def process(
+            self,
+            start_time: float,
+            time_length: float,
+            extra_time: float,
+            future_extra_time: Optional[float] = None,
+    ) -> AcousticFeatureWrapper:
+        if future_extra_time is None:
+            future_extra_time = extra_time
+
         wave = self.fetch(
             start_time=start_time,
             time_length=time_length,
             extra_time=extra_time,
+            future_extra_time=future_extra_time,
         )
         wave = Wave(wave=wave, sampling_rate=self.in_segment_method.sampling_rate)
         feature_wrapper = self.vocoder.encode(wave)
 
-        pad = round(extra_time * self.out_segment_method.sampling_rate)
-        if pad > 0:
-            feature_wrapper = self.out_segment_method.pick(feature_wrapper, pad, -pad)
+        rate = self.out_segment_method.sampling_rate
+        pad = round(extra_time * rate)
+        future_pad = round(future_extra_time * rate)
+        if pad > 0 or future_pad > 0:
+            length = self.out_segment_method.length(feature_wrapper)
+            feature_wrapper = self.out_segment_method.pick(feature_wrapper, pad, length - future_pad)
 
         return feature_wrapper
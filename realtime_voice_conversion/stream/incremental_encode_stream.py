@@ -0,0 +1,83 @@
+from typing import Optional
+
+from yukarin.wave import Wave
+
+from ..stream.encode_stream import EncodeStream
+from ..yukarin_wrapper.vocoder import Vocoder
+from ..yukarin_wrapper.voice_changer import AcousticFeatureWrapper
+
+
+class IncrementalEncodeStream(EncodeStream):
+    """
+    keeps the frames analyzed by the previous call and analyzes only the new frames.
+    past context is limited to margin_time, which covers the analysis windows of F0 estimation and CheapTrick.
+    so extra_time only sets the future context when future_extra_time is not given.
+    """
+
+    def __init__(
+            self,
+            vocoder: Vocoder,
+            ring_buffer_time: Optional[float] = None,
+            margin_time: Optional[float] = None,
+    ):
+        super().__init__(vocoder=vocoder, ring_buffer_time=ring_buffer_time)
+
+        if margin_time is None:
+            margin_time = 4 / vocoder.acoustic_param.f0_floor
+        self.margin_time = margin_time
+
+        self._cache: Optional[AcousticFeatureWrapper] = None
+        self._cache_start = 0
+        self._cache_end = 0
+
+    def lookback_time(self, extra_time: float):
+        return self.margin_time
+
+    def process(
+            self,
+            start_time: float,
+            time_length: float,
+            extra_time: float,
+            future_extra_time: Optional[float] = None,
+    ) -> AcousticFeatureWrapper:
+        if future_extra_time is None:
+            future_extra_time = extra_time
+
+        rate = self.out_segment_method.sampling_rate
+        start = round(start_time * rate)
+        end = round((start_time + time_length) * rate)
+        extra = round(future_extra_time * rate)
+        margin = round(self.margin_time * rate)
+
+        if self._cache is not None and self._cache_start <= start <= self._cache_end:
+            if end < self._cache_end:
+                return self.out_segment_method.pick(self._cache, start - self._cache_start, end - self._cache_start)
+            new_start = self._cache_end
+        else:
+            new_start = start
+
+        first = new_start - margin
+        wave = self.fetch(
+            start_time=first / rate,
+            time_length=(end + extra - first) / rate,
+            extra_time=0,
+        )
+        wave = Wave(wave=wave, sampling_rate=self.in_segment_method.sampling_rate)
+        feature_wrapper = self.vocoder.encode(wave)
+        feature_wrapper = self.out_segment_method.pick(
+            feature_wrapper,
+            new_start - first,
+            self.out_segment_method.length(feature_wrapper) - extra,
+        )
+
+        if new_start > start:
+            assert self._cache is not None  # only when continuing the cache
+            feature_wrapper = self.out_segment_method.concat([
+                self.out_segment_method.pick(self._cache, start - self._cache_start, new_start - self._cache_start),
+                feature_wrapper,
+            ])
+
+        self._cache = feature_wrapper
+        self._cache_start = start
+        self._cache_end = start + self.out_segment_method.length(feature_wrapper)
+        return feature_wrapper
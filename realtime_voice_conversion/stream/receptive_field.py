@@ -0,0 +1,92 @@
+from typing import Optional
+
+import numpy
+from yukarin.acoustic_feature import AcousticFeature
+
+from ..segment.feature_segment import FeatureSegmentMethod
+from ..segment.feature_wrapper_segment import FeatureWrapperSegmentMethod
+from ..stream.convert_stream import ConvertStream
+from ..yukarin_wrapper.voice_changer import AcousticFeatureWrapper
+
+
+def _changed_radius(base: numpy.ndarray, perturbed: numpy.ndarray, center: int, tolerance: float):
+    diff = numpy.abs(perturbed - base).reshape(len(base), -1).max(axis=1)
+    if diff.max() == 0:
+        return 0
+    changed = numpy.nonzero(diff > diff.max() * tolerance)[0]
+    return int(numpy.abs(changed - center).max())
+
+
+def acoustic_converter_radius(stream: ConvertStream, length: int, tolerance: float):
+    method = stream.in_segment_method
+    assert isinstance(method, FeatureWrapperSegmentMethod)
+    sizes = AcousticFeature.get_sizes(sampling_rate=method.wave_sampling_rate, order=method.order)
+    mc = numpy.random.RandomState(0).normal(scale=0.1, size=(length, sizes['mc'])).astype(numpy.float32)
+
+    def _feature(shift: float):
+        feature = AcousticFeature.silent(length, sizes=sizes, keys=method.keys).astype_only_float(numpy.float32)
+        feature.f0[:] = 200
+        feature.voiced[:] = True
+        feature.mc[:] = mc
+        feature.mc[length // 2] += shift
+        return feature
+
+    base = stream.voice_changer.acoustic_converter.convert(_feature(0))
+    perturbed = stream.voice_changer.acoustic_converter.convert(_feature(1))
+    return _changed_radius(base.mc, perturbed.mc, center=length // 2, tolerance=tolerance)
+
+
+def super_resolution_radius(stream: ConvertStream, length: int, tolerance: float):
+    method = stream.out_segment_method
+    assert isinstance(method, FeatureSegmentMethod)
+    sizes = AcousticFeature.get_sizes(sampling_rate=method.wave_sampling_rate, order=method.order)
+
+    sp = numpy.exp(numpy.random.RandomState(0).normal(size=(length, sizes['sp']))).astype(numpy.float32)
+    base = stream.voice_changer.super_resolution.convert(sp.copy())
+    sp[length // 2] *= 10
+    perturbed = stream.voice_changer.super_resolution.convert(sp)
+    return _changed_radius(base, perturbed, center=length // 2, tolerance=tolerance)
+
+
+def receptive_field_time(stream: ConvertStream, probe_time: float = 4, tolerance: float = 1e-3) -> Optional[float]:
+    """
+    measure how far an input frame affects the output of stage 1 and stage 2, by perturbing one frame.
+    returns None when the influence reaches the end of the probe.
+    """
+    in_rate = stream.in_segment_method.sampling_rate
+    out_rate = stream.out_segment_method.sampling_rate
+
+    in_length = round(probe_time * in_rate)
+    in_radius = acoustic_converter_radius(stream, length=in_length, tolerance=tolerance)
+    out_length = round(probe_time * out_rate)
+    out_radius = super_resolution_radius(stream, length=out_length, tolerance=tolerance)
+
+    if in_radius >= in_length // 2 - 1 or out_radius >= out_length // 2 - 1:
+        return None
+    return in_radius / in_rate + out_radius / out_rate
+
+
+def context_error(
+        stream: ConvertStream,
+        feature: AcousticFeatureWrapper,
+        time_length: float,
+        extra_time: float,
+        full_extra_time: float,
+):
+    """
+    max absolute error of log spectrogram between the outputs with extra_time and with full_extra_time.
+    """
+    stream.add(start_time=0, data=feature)
+    total_time = stream.in_segment_method.length(feature) / stream.in_segment_method.sampling_rate
+
+    error = 0.
+    start_time = 0.
+    while start_time + time_length <= total_time:
+        output = stream.process(start_time=start_time, time_length=time_length, extra_time=extra_time)
+        target = stream.process(start_time=start_time, time_length=time_length, extra_time=full_extra_time)
+        diff = numpy.log(numpy.maximum(output.sp, 1e-16)) - numpy.log(numpy.maximum(target.sp, 1e-16))
+        error = max(error, float(numpy.abs(diff).max()))
+        start_time += time_length
+
+    stream.remove(end_time=total_time)
+    return error
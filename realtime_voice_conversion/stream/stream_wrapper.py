@@ -1,18 +1,89 @@
+from typing import Optional
+
 from ..stream.base_stream import BaseStream
 
 
 class StreamWrapper(object):
-    def __init__(self, stream: BaseStream, extra_time: float):
+    def __init__(
+            self,
+            stream: BaseStream,
+            extra_time: float,
+            retention_time: Optional[float] = None,
+            future_extra_time: Optional[float] = None,
+    ):
+        """
+        extra_time is the past context, and future_extra_time is the future context (same as extra_time if None).
+        only the future context delays the output, because added data is scheduled ahead by it.
+        """
+        if future_extra_time is None:
+            future_extra_time = extra_time
+
         self.stream = stream
         self.extra_time = extra_time
+        self.future_extra_time = future_extra_time
+        self.retention_time = retention_time
+
+        self._current_index = 0
+        self._add_index = stream.to_index(future_extra_time)
+
+    @property
+    def current_time(self):
+        return self._current_index / self.stream.in_segment_method.sampling_rate
+
+    @property
+    def horizon_time(self):
+        lookback_time = self.stream.lookback_time(self.extra_time)
+        if self.retention_time is None:
+            return lookback_time
+        return max(lookback_time, self.retention_time)
+
+    @property
+    def context_time(self):
+        return self.stream.lookback_time(self.extra_time) + self.future_extra_time
 
-        self._current_time = 0.
+    def add(self, data, time_length: float):
+        """
+        data can be None for a silent span, then only the time advances.
+        """
+        if data is not None:
+            self.stream.add_index(start=self._add_index, data=data)
+        self._add_index += self.stream.to_index(time_length)
+
+    def add_at(self, position: int, data, time_length: float):
+        """
+        add the data of the position-th chunk, for a stream receiving only some of the chunks.
+        """
+        self._add_index = self.stream.to_index(self.future_extra_time) + position * self.stream.to_index(time_length)
+        self.add(data=data, time_length=time_length)
+
+    def process_at(self, position: int, time_length: float):
+        self._current_index = position * self.stream.to_index(time_length)
+        return self.process_next(time_length=time_length)
+
+    def process_span(self, position: int, count: int, time_length: float):
+        """
+        process count chunks from the position-th chunk in one call, and split the output per chunk.
+        """
+        self._current_index = position * self.stream.to_index(time_length)
+        data = self.process_next(time_length=time_length * count)
+
+        method = self.stream.out_segment_method
+        length = round(time_length * method.sampling_rate)
+        return [method.pick(data, i * length, (i + 1) * length) for i in range(count)]
 
     def process_next(self, time_length: float):
+        length = self.stream.to_index(time_length)
         data = self.stream.process(
-            start_time=self._current_time,
-            time_length=time_length,
+            start_time=self.current_time,
+            time_length=length / self.stream.in_segment_method.sampling_rate,
             extra_time=self.extra_time,
+            future_extra_time=self.future_extra_time,
         )
-        self._current_time += time_length
+        self._current_index += length
+
+        self.stream.remove(end_time=self.current_time - self.horizon_time)
         return data
+
+    def skip_next(self, time_length: float):
+        self._current_index += self.stream.to_index(time_length)
+        self.stream.remove(end_time=self.current_time - self.horizon_time)
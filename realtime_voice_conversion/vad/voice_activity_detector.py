@@ -0,0 +1,71 @@
+import numpy
+
+# power of a hann-windowed 2048-point STFT bin relative to the mean square of the samples,
+# so that levels are on the scale of librosa.stft power used for the silence thresholds.
+STFT_POWER_OFFSET = 10 * numpy.log10(2048 * 0.375)
+
+
+class VoiceActivityDetector(object):
+    """
+    streaming voice activity detection by frame energy.
+    a frame becomes active above threshold, and inactive below threshold - hysteresis.
+    activity is held for hangover frames after the last active frame.
+    samples not filling a frame are kept for the next call.
+    """
+
+    def __init__(
+            self,
+            threshold: float,
+            frame_length: int = 512,
+            hysteresis: float = 6,
+            hangover: int = 4,
+            min_level: float = -100,
+    ):
+        self.threshold = threshold
+        self.frame_length = frame_length
+        self.hysteresis = hysteresis
+        self.hangover = hangover
+        self.min_level = min_level
+
+        self._rest = numpy.empty(0, dtype=numpy.float32)
+        self._state = False
+        self._since_active = hangover + 1
+
+    def reset(self):
+        self._rest = numpy.empty(0, dtype=numpy.float32)
+        self._state = False
+        self._since_active = self.hangover + 1
+
+    def levels(self, wave: numpy.ndarray):
+        wave = numpy.concatenate([self._rest, wave])
+        num = len(wave) // self.frame_length
+        self._rest = wave[num * self.frame_length:]
+
+        frames = wave[:num * self.frame_length].reshape(num, self.frame_length)
+        power = numpy.einsum('ij,ij->i', frames, frames) / self.frame_length
+        return numpy.maximum(10 * numpy.log10(numpy.maximum(power, 1e-20)) + STFT_POWER_OFFSET, self.min_level)
+
+    def activities(self, wave: numpy.ndarray):
+        levels = self.levels(wave)
+        num = len(levels)
+        if num == 0:
+            return numpy.empty(0, dtype=bool)
+
+        # hysteresis: each frame takes the state of the last frame crossing either threshold
+        event = numpy.zeros(num, dtype=numpy.int8)
+        event[levels < self.threshold - self.hysteresis] = -1
+        event[levels > self.threshold] = 1
+        index = numpy.maximum.accumulate(numpy.where(event != 0, numpy.arange(num), -1))
+        state = numpy.where(index >= 0, event[index] > 0, self._state)
+
+        # hangover
+        index = numpy.arange(num)
+        last = numpy.maximum.accumulate(numpy.where(state, index, -self._since_active - 1))
+        active = index - last <= self.hangover
+
+        self._state = bool(state[-1])
+        self._since_active = min(int(num - 1 - last[-1]), self.hangover + 1)
+        return active
+
+    def process(self, wave: numpy.ndarray) -> bool:
+        return bool(self.activities(wave).any())
@@ -1,16 +1,25 @@
 import logging
+import math
+import queue
 import time
 from multiprocessing import Queue
 from multiprocessing.synchronize import Lock
+from typing import Callable, List, Optional
 
 import chainer
 from become_yukarin import SuperResolution
 from yukarin import AcousticConverter
+from yukarin.wave import Wave
 
+from realtime_voice_conversion.codec.feature_codec import FeatureCodec
+from realtime_voice_conversion.config import VocodeMode
 from realtime_voice_conversion.stream import ConvertStream
 from realtime_voice_conversion.stream import StreamWrapper
-from realtime_voice_conversion.worker.utility import init_logger, Item
+from realtime_voice_conversion.stream.receptive_field import receptive_field_time
+from realtime_voice_conversion.worker.utility import init_logger, Item, SilenceGate, context_chunks
+from realtime_voice_conversion.worker.warm_up import synthetic_voice, warm_up_stream
 from realtime_voice_conversion.yukarin_wrapper.acoustic_feature_wrapper import AcousticFeatureWrapper
+from realtime_voice_conversion.yukarin_wrapper.vocoder import Vocoder
 from realtime_voice_conversion.yukarin_wrapper.voice_changer import VoiceChanger
 
 
@@ -19,41 +28,137 @@ def convert_worker(
         super_resolution: SuperResolution,
         time_length: float,
         extra_time: float,
+        future_extra_time: Optional[float],
+        auto_extra_time: bool,
+        ring_buffer_time: Optional[float],
+        retention_time: Optional[float],
+        feature_codec: Optional[FeatureCodec],
         input_silent_threshold: float,
         queue_input: Queue,
         queue_output: Queue,
         acquired_lock: Lock,
+        worker_id: int = 0,
+        num_worker: int = 1,
+        max_batch: int = 1,
+        make_converter: Optional[Callable] = None,
 ):
     logger = logging.getLogger('convert')
     init_logger(logger)
-    logging.info('convert worker')
+    logging.info(f'convert worker {worker_id}')
 
     chainer.global_config.enable_backprop = False
     chainer.global_config.train = False
 
-    stream = ConvertStream(
-        voice_changer=VoiceChanger(
-            super_resolution=super_resolution,
-            acoustic_converter=acoustic_converter,
-            threshold=input_silent_threshold,
+    if make_converter is not None:
+        start = time.time()
+        converter = make_converter()  # mapped from the model cache instead of pickled models
+        acoustic_converter = converter.acoustic_converter
+        super_resolution = converter.super_resolution
+        logger.info(f'model loaded: {time.time() - start:.2f}s')
+
+    voice_changer = VoiceChanger(
+        super_resolution=super_resolution,
+        acoustic_converter=acoustic_converter,
+        threshold=input_silent_threshold,
+    )
+    stream = ConvertStream(voice_changer=voice_changer, ring_buffer_time=ring_buffer_time)
+    if auto_extra_time:
+        receptive_time = receptive_field_time(stream)
+        if future_extra_time is None:
+            future_extra_time = extra_time
+        if receptive_time is not None:
+            rate = stream.in_segment_method.sampling_rate
+            receptive_time = math.ceil(receptive_time * rate) / rate
+            extra_time = min(extra_time, receptive_time)
+            future_extra_time = min(future_extra_time, receptive_time)
+        logger.info(f'receptive field: {receptive_time}, extra time: {extra_time}, {future_extra_time}')
+
+    def _create_stream_wrapper():
+        return StreamWrapper(
+            stream=ConvertStream(voice_changer=voice_changer, ring_buffer_time=ring_buffer_time),
+            extra_time=extra_time,
+            future_extra_time=future_extra_time,
+            retention_time=retention_time,
         )
+
+    # warm up with synthetic voice, then start again from an empty stream
+    start = time.time()
+    stream_wrapper = _create_stream_wrapper()
+    num_chunk = context_chunks(time_length, stream_wrapper.context_time) + 2
+    acoustic_param = acoustic_converter.config.dataset.acoustic_param
+    vocoder = Vocoder(
+        acoustic_param=acoustic_param,
+        out_sampling_rate=acoustic_param.sampling_rate,
+        extract_f0_mode=VocodeMode.WORLD,
     )
-    stream_wrapper = StreamWrapper(stream=stream, extra_time=extra_time)
+    wave = Wave(
+        wave=synthetic_voice(sampling_rate=acoustic_param.sampling_rate, time_length=time_length * num_chunk),
+        sampling_rate=acoustic_param.sampling_rate,
+    )
+    warm_up_stream(stream_wrapper, vocoder.encode(wave), time_length=time_length, num_chunk=num_chunk)
+    stream_wrapper = _create_stream_wrapper()
+    stream = stream_wrapper.stream
+    logger.info(f'warm up: {time.time() - start:.2f}s')
+    silence_gate = SilenceGate(time_length=time_length, context_time=stream_wrapper.context_time)
+
+    if ring_buffer_time is not None:
+        # the merged span and its context must fit in the ring buffer
+        max_batch = min(max_batch, int((ring_buffer_time - stream_wrapper.context_time) // time_length))
+    max_batch = max(max_batch, 1)
+
+    def _put(_item: Item, _out_feature):
+        if _out_feature is not None and feature_codec is not None:
+            _out_feature = feature_codec.encode(_out_feature)
+        _item.item = _out_feature
+        _item.stamp('convert_put')
+        queue_output.put(_item)
+
+    def _convert(_items: List[Item]):
+        if len(_items) == 0:
+            return
 
-    acquired_lock.release()
-    start_time = extra_time
-    while True:
-        item: Item = queue_input.get()
         start = time.time()
-        in_feature: AcousticFeatureWrapper = item.item
-        stream.add(
-            start_time=start_time,
-            data=in_feature,
+        out_features = stream_wrapper.process_span(
+            position=_items[0].index,
+            count=len(_items),
+            time_length=time_length,
         )
-        start_time += time_length
+        for _item, _out_feature in zip(_items, out_features):
+            _put(_item, _out_feature)
+
+        logger.debug(f'{_items[0].index}-{_items[-1].index}: {time.time() - start}')
+        logger.debug(f'{_items[-1].index}: buffered {stream.buffered_time}s, {stream.buffered_nbytes} bytes')
+
+    acquired_lock.release()
+    while True:
+        # under backlog, drain the waiting items and convert consecutive windows in one call
+        items: List[Item] = [queue_input.get()]
+        try:
+            while len(items) < max_batch:
+                items.append(queue_input.get_nowait())
+        except queue.Empty:
+            pass
+
+        span: List[Item] = []
+        for item in items:
+            item.stamp('convert_get')
+            in_feature: Optional[AcousticFeatureWrapper] = item.item
+            stream_wrapper.add_at(
+                position=item.index,
+                data=in_feature,
+                time_length=time_length,
+            )
+
+            silent = silence_gate.update(index=item.index, voiced=in_feature is not None)
+            if item.index % num_worker != worker_id:
+                continue  # only the context of windows of other workers
 
-        out_feature = stream_wrapper.process_next(time_length=time_length)
-        item.item = out_feature
-        queue_output.put(item)
+            if silent or (len(span) > 0 and item.index != span[-1].index + 1):
+                _convert(span)
+                span = []
 
-        logger.debug(f'{item.index}: {time.time() - start}')
+            if silent:
+                _put(item, None)  # silent span
+            else:
+                span.append(item)
+        _convert(span)
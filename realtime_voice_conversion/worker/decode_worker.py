@@ -2,14 +2,18 @@ import logging
 import time
 from multiprocessing import Queue
 from multiprocessing.synchronize import Lock
+from typing import Optional
 
-import librosa
 import numpy
 from yukarin.acoustic_feature import AcousticFeature
 
+from realtime_voice_conversion.buffer.array_ring_buffer import ArrayRingBuffer
+from realtime_voice_conversion.codec.feature_codec import FeatureCodec
 from realtime_voice_conversion.stream import DecodeStream
 from realtime_voice_conversion.stream import StreamWrapper
-from realtime_voice_conversion.worker.utility import init_logger, Item
+from realtime_voice_conversion.vad.voice_activity_detector import VoiceActivityDetector
+from realtime_voice_conversion.worker.utility import init_logger, Item, SilenceGate, Resequencer, context_chunks
+from realtime_voice_conversion.worker.warm_up import synthetic_feature, warm_up_stream
 from realtime_voice_conversion.yukarin_wrapper.vocoder import RealtimeVocoder
 
 
@@ -17,6 +21,10 @@ def decode_worker(
         realtime_vocoder: RealtimeVocoder,
         time_length: float,
         extra_time: float,
+        future_extra_time: Optional[float],
+        ring_buffer_time: Optional[float],
+        retention_time: Optional[float],
+        feature_codec: Optional[FeatureCodec],
         vocoder_buffer_size: int,
         out_audio_chunk: int,
         output_silent_threshold: float,
@@ -32,35 +40,69 @@ def decode_worker(
         buffer_size=vocoder_buffer_size,
         number_of_pointers=16,
     )
-    stream = DecodeStream(vocoder=realtime_vocoder)
-    stream_wrapper = StreamWrapper(stream=stream, extra_time=extra_time)
+
+    def _create_stream_wrapper():
+        return StreamWrapper(
+            stream=DecodeStream(vocoder=realtime_vocoder, ring_buffer_time=ring_buffer_time),
+            extra_time=extra_time,
+            future_extra_time=future_extra_time,
+            retention_time=retention_time,
+        )
+
+    # warm up with synthetic voice, then start again from an empty stream and synthesizer
+    start = time.time()
+    stream_wrapper = _create_stream_wrapper()
+    num_chunk = context_chunks(time_length, stream_wrapper.context_time) + 2
+    warm_up_feature = synthetic_feature(
+        sampling_rate=realtime_vocoder.out_sampling_rate,
+        time_length=time_length * num_chunk,
+        frame_period=realtime_vocoder.acoustic_param.frame_period,
+    )
+    warm_up_stream(stream_wrapper, warm_up_feature, time_length=time_length, num_chunk=num_chunk)
+    stream_wrapper = _create_stream_wrapper()
+    stream = stream_wrapper.stream
+    realtime_vocoder.reset_synthesizer()
+    logger.info(f'warm up: {time.time() - start:.2f}s')
+
+    voice_activity_detector = VoiceActivityDetector(threshold=-output_silent_threshold)
+    silence_gate = SilenceGate(time_length=time_length, context_time=stream_wrapper.context_time)
+    silent_length = round(time_length * stream.out_segment_method.sampling_rate)
 
     acquired_lock.release()
-    start_time = extra_time
-    wave_fragment = numpy.empty(0)
+    wave_fragment = ArrayRingBuffer(capacity=out_audio_chunk * 4)
+    fragment_start = 0
+    resequencer = Resequencer()
     while True:
-        item: Item = queue_input.get()
-        start = time.time()
-        feature: AcousticFeature = item.item
-        stream.add(
-            start_time=start_time,
-            data=feature,
-        )
-        start_time += time_length
+        resequencer.put(queue_input.get())
+        for item in resequencer.pop_ready():
+            item.stamp('decode_get')
+            start = time.time()
+            feature: Optional[AcousticFeature] = item.item
+            if feature is not None and feature_codec is not None:
+                feature = feature_codec.decode(feature)
+            stream_wrapper.add(
+                data=feature,
+                time_length=time_length,
+            )
 
-        wave = stream_wrapper.process_next(time_length=time_length)
+            if silence_gate.update(index=item.index, voiced=feature is not None):
+                stream_wrapper.skip_next(time_length=time_length)
+                wave = numpy.zeros(silent_length, dtype=numpy.float32)
+            else:
+                wave = stream_wrapper.process_next(time_length=time_length)
 
-        wave_fragment = numpy.concatenate([wave_fragment, wave])
-        if len(wave_fragment) >= out_audio_chunk:
-            wave, wave_fragment = wave_fragment[:out_audio_chunk], wave_fragment[out_audio_chunk:]
+            wave_fragment.write(start=wave_fragment.end, data=wave)
+            out_wave: Optional[numpy.ndarray] = None
+            if wave_fragment.end - fragment_start >= out_audio_chunk:
+                out_wave = wave_fragment.read(start=fragment_start, length=out_audio_chunk)
+                fragment_start += out_audio_chunk
 
-            power = librosa.core.power_to_db(numpy.abs(librosa.stft(wave)) ** 2).mean()
-            if power < - output_silent_threshold:
-                wave = None  # pass
-        else:
-            wave = None
+                if not voice_activity_detector.process(out_wave):
+                    out_wave = None  # pass
 
-        item.item = wave
-        queue_output.put(item)
+            item.item = out_wave
+            item.stamp('decode_put')
+            queue_output.put(item)
 
-        logger.debug(f'{item.index}: {time.time() - start}')
+            logger.debug(f'{item.index}: {time.time() - start}')
+            logger.debug(f'{item.index}: buffered {stream.buffered_time}s, {stream.buffered_nbytes} bytes')
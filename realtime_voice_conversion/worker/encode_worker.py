@@ -2,12 +2,16 @@ import logging
 import time
 from multiprocessing import Queue
 from multiprocessing.synchronize import Lock
+from typing import Optional
 
 import numpy
 
 from realtime_voice_conversion.stream import EncodeStream
+from realtime_voice_conversion.stream import IncrementalEncodeStream
 from realtime_voice_conversion.stream import StreamWrapper
-from realtime_voice_conversion.worker.utility import init_logger, Item
+from realtime_voice_conversion.vad.voice_activity_detector import VoiceActivityDetector
+from realtime_voice_conversion.worker.utility import init_logger, Item, SilenceGate, context_chunks
+from realtime_voice_conversion.worker.warm_up import synthetic_voice, warm_up_stream
 from realtime_voice_conversion.yukarin_wrapper.acoustic_feature_wrapper import AcousticFeatureWrapper
 from realtime_voice_conversion.yukarin_wrapper.vocoder import RealtimeVocoder
 
@@ -16,6 +20,11 @@ def encode_worker(
         realtime_vocoder: RealtimeVocoder,
         time_length: float,
         extra_time: float,
+        future_extra_time: Optional[float],
+        incremental: bool,
+        gate_threshold: Optional[float],
+        ring_buffer_time: Optional[float],
+        retention_time: Optional[float],
         queue_input: Queue,
         queue_output: Queue,
         acquired_lock: Lock,
@@ -24,21 +33,56 @@ def encode_worker(
     init_logger(logger)
     logger.info('encode worker')
 
-    stream = EncodeStream(vocoder=realtime_vocoder)
-    stream_wrapper = StreamWrapper(stream=stream, extra_time=extra_time)
+    def _create_stream_wrapper():
+        if incremental:
+            _stream = IncrementalEncodeStream(vocoder=realtime_vocoder, ring_buffer_time=ring_buffer_time)
+        else:
+            _stream = EncodeStream(vocoder=realtime_vocoder, ring_buffer_time=ring_buffer_time)
+        return StreamWrapper(
+            stream=_stream,
+            extra_time=extra_time,
+            future_extra_time=future_extra_time,
+            retention_time=retention_time,
+        )
+
+    # warm up with synthetic voice, then start again from empty streams
+    start = time.time()
+    stream_wrapper = _create_stream_wrapper()
+    num_chunk = context_chunks(time_length, stream_wrapper.context_time) + 2
+    warm_up_stream(
+        stream_wrapper,
+        synthetic_voice(sampling_rate=realtime_vocoder.acoustic_param.sampling_rate, time_length=time_length * num_chunk),
+        time_length=time_length,
+        num_chunk=num_chunk,
+    )
+    stream_wrapper = _create_stream_wrapper()
+    stream = stream_wrapper.stream
+    logger.info(f'warm up: {time.time() - start:.2f}s')
+
+    if gate_threshold is not None:
+        voice_activity_detector = VoiceActivityDetector(threshold=-gate_threshold)
+    else:
+        voice_activity_detector = None
+    silence_gate = SilenceGate(time_length=time_length, context_time=stream_wrapper.context_time)
 
     acquired_lock.release()
-    start_time = extra_time
     while True:
         item: Item = queue_input.get()
+        item.stamp('encode_get')
         start = time.time()
         wave: numpy.ndarray = item.item
 
-        stream.add(start_time=start_time, data=wave)
-        start_time += time_length
+        stream_wrapper.add(data=wave, time_length=time_length)
 
-        feature_wrapper: AcousticFeatureWrapper = stream_wrapper.process_next(time_length=time_length)
+        voiced = voice_activity_detector is None or voice_activity_detector.process(wave)
+        if silence_gate.update(index=item.index, voiced=voiced):
+            stream_wrapper.skip_next(time_length=time_length)
+            feature_wrapper: Optional[AcousticFeatureWrapper] = None  # silent span
+        else:
+            feature_wrapper = stream_wrapper.process_next(time_length=time_length)
         item.item = feature_wrapper
+        item.stamp('encode_put')
         queue_output.put(item)
 
         logger.debug(f'{item.index}: {time.time() - start}')
+        logger.debug(f'{item.index}: buffered {stream.buffered_time}s, {stream.buffered_nbytes} bytes')
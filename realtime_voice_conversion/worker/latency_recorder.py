@@ -0,0 +1,91 @@
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+import numpy
+
+STAMPS = (
+    'capture',
+    'encode_get',
+    'encode_put',
+    'convert_get',
+    'convert_put',
+    'decode_get',
+    'decode_put',
+    'receive',
+    'playout',
+)
+
+BINS = (0, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5)
+
+
+class LatencyRecorder(object):
+    """
+    aggregates the timestamps of items into histograms of the intervals between consecutive stamps,
+    and of the whole interval from capture to playout.
+    the real-time factor of a stage is its processing time divided by time_length.
+    aggregates are appended to path as a JSON line at each interval, then reset.
+    """
+
+    def __init__(
+            self,
+            path: Path,
+            interval: float,
+            time_length: float,
+            stamps: Sequence[str] = STAMPS,
+            bins: Sequence[float] = BINS,
+    ):
+        self.path = path
+        self.interval = interval
+        self.time_length = time_length
+        self.stamps = stamps
+        self.bins = numpy.array(list(bins) + [numpy.inf])
+
+        self.names = [f'{a}-{b}' for a, b in zip(stamps, stamps[1:])] + [f'{stamps[0]}-{stamps[-1]}']
+        self.values: Dict[str, List[float]] = {name: [] for name in self.names}
+        self._last_write = time.monotonic()
+
+    def add(self, timestamps: Dict[str, float]):
+        pairs = list(zip(self.stamps, self.stamps[1:])) + [(self.stamps[0], self.stamps[-1])]
+        for name, (a, b) in zip(self.names, pairs):
+            if a in timestamps and b in timestamps:
+                self.values[name].append(timestamps[b] - timestamps[a])
+
+        if time.monotonic() - self._last_write >= self.interval:
+            self.write()
+
+    def summary(self):
+        intervals = {}
+        for name, values in self.values.items():
+            if len(values) == 0:
+                continue
+            array = numpy.array(values)
+            intervals[name] = dict(
+                count=len(array),
+                mean=float(array.mean()),
+                p50=float(numpy.percentile(array, 50)),
+                p95=float(numpy.percentile(array, 95)),
+                max=float(array.max()),
+                histogram=numpy.histogram(array, bins=self.bins)[0].tolist(),
+            )
+
+        rtf = {}
+        for stage in ('encode', 'convert', 'decode'):
+            name = f'{stage}_get-{stage}_put'
+            if name in intervals:
+                rtf[stage] = intervals[name]['mean'] / self.time_length
+
+        return dict(
+            time=time.time(),
+            bins=self.bins[:-1].tolist(),
+            intervals=intervals,
+            rtf=rtf,
+        )
+
+    def write(self):
+        with self.path.open('a') as f:
+            f.write(json.dumps(self.summary()) + '\n')
+
+        self.values = {name: [] for name in self.names}
+        self._last_write = time.monotonic()
@@ -0,0 +1,75 @@
+import pickle
+import queue
+from multiprocessing import Queue, shared_memory
+from typing import Any, List, Optional, Tuple
+
+
+class SharedMemoryQueue(object):
+    """
+    queue copying the array data of items into shared memory slots, instead of pickling it into the pipe.
+    only the item pickled without its arrays (pickle protocol 5, out-of-band buffers) and the slot number
+    go through the underlying queue.
+    the arrays are copied into a slot on put and out of it on get, so the slot can be reused at once.
+    an item larger than a slot, or put while no slot is freed within slot_timeout seconds,
+    is passed through the underlying queue as is.
+    the shared memory is slot_size * num_slot bytes per queue.
+    """
+
+    def __init__(self, slot_size: int, num_slot: int = 8, slot_timeout: float = 0.01):
+        self.slot_size = slot_size
+        self.slot_timeout = slot_timeout
+        self.slots = [shared_memory.SharedMemory(create=True, size=slot_size) for _ in range(num_slot)]
+
+        self.queue: Queue[Tuple[Optional[int], bytes, List[int]]] = Queue()
+        self.free_slots: Queue[int] = Queue()
+        for i in range(num_slot):
+            self.free_slots.put(i)
+
+    def put(self, item: Any):
+        buffers: List[pickle.PickleBuffer] = []
+        data = pickle.dumps(item, protocol=5, buffer_callback=buffers.append)
+        raws = [b.raw() for b in buffers]
+
+        slot: Optional[int] = None
+        if sum(raw.nbytes for raw in raws) <= self.slot_size:
+            try:
+                slot = self.free_slots.get(timeout=self.slot_timeout)
+            except queue.Empty:
+                pass  # the getters fall behind, not to block the putter
+
+        if slot is None:
+            self.queue.put((None, pickle.dumps(item, protocol=5), []))
+            return
+
+        buf = self.slots[slot].buf
+        assert buf is not None
+        offset = 0
+        lengths: List[int] = []
+        for raw in raws:
+            buf[offset:offset + raw.nbytes] = raw
+            offset += raw.nbytes
+            lengths.append(raw.nbytes)
+        self.queue.put((slot, data, lengths))
+
+    def get(self, block=True, timeout: Optional[float] = None):
+        slot, data, lengths = self.queue.get(block, timeout)
+        if slot is None:
+            return pickle.loads(data)
+
+        buf = self.slots[slot].buf
+        assert buf is not None
+        offset = 0
+        buffers: List[bytearray] = []
+        for length in lengths:
+            buffers.append(bytearray(buf[offset:offset + length]))
+            offset += length
+        self.free_slots.put(slot)
+        return pickle.loads(data, buffers=buffers)
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def close(self):
+        for slot in self.slots:
+            slot.close()
+            slot.unlink()
@@ -1,6 +1,8 @@
 import logging
+import math
 import os
-from typing import Any
+import time
+from typing import Any, Optional, Dict, List
 
 
 class Item(object):
@@ -11,6 +13,71 @@ class Item(object):
     ):
         self.item = item
         self.index = index
+        self.timestamps: Dict[str, float] = {}
+
+    def stamp(self, name: str):
+        self.timestamps[name] = time.monotonic()
+
+
+def context_chunks(time_length: float, context_time: float):
+    """
+    number of following windows that one chunk reaches through the context.
+    """
+    return math.ceil(round(context_time / time_length, 6))
+
+
+class SilenceGate(object):
+    """
+    decides whether the window processed for the latest item is silent, from the items having voice.
+    an item affects the windows within context_time after it.
+    """
+
+    def __init__(self, time_length: float, context_time: float):
+        self.context = context_chunks(time_length=time_length, context_time=context_time)
+        self._last_voiced: Optional[int] = None
+
+    def update(self, index: int, voiced: bool):
+        if voiced:
+            self._last_voiced = index
+        return self._last_voiced is None or index - self._last_voiced > self.context
+
+
+class DispatchQueue(object):
+    """
+    distributes items to workers processing the windows in round-robin order, window w by worker w % N.
+    the item of index k is sent to every worker owning one of the windows k to k + context,
+    so that each worker has the context of its windows.
+    """
+
+    def __init__(self, queues: List[Any], context: int):
+        self.queues = queues
+        self.context = context
+
+    def owners(self, index: int):
+        return sorted({w % len(self.queues) for w in range(index, index + self.context + 1)})
+
+    def put(self, item: Item):
+        for owner in self.owners(item.index):
+            self.queues[owner].put(item)
+
+
+class Resequencer(object):
+    """
+    releases items in order of index.
+    """
+
+    def __init__(self):
+        self.items: Dict[int, Item] = {}
+        self.next_index = 0
+
+    def put(self, item: Item):
+        self.items[item.index] = item
+
+    def pop_ready(self):
+        while self.next_index in self.items:
+            item = self.items.pop(self.next_index)
+            self.next_index += 1
+            yield item
 
 
 def init_logger(logger=None, filename='log.txt'):
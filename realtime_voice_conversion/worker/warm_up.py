@@ -0,0 +1,48 @@
+import numpy
+import pyworld
+from yukarin.acoustic_feature import AcousticFeature
+
+from ..stream import StreamWrapper
+
+
+def synthetic_voice(sampling_rate: int, time_length: float, f0: float = 150, amplitude: float = 0.1):
+    """
+    harmonic tone with a vibrato, voiced and loud enough that every stage processes it as voice.
+    """
+    t = numpy.arange(round(sampling_rate * time_length)) / sampling_rate
+    phase = 2 * numpy.pi * numpy.cumsum(f0 * (1 + 0.05 * numpy.sin(2 * numpy.pi * 5 * t))) / sampling_rate
+
+    wave = numpy.zeros_like(t)
+    for k in range(1, int(sampling_rate / 2 / (f0 * 1.05))):
+        wave += numpy.sin(k * phase) / k
+    return (wave / numpy.abs(wave).max() * amplitude).astype(numpy.float32)
+
+
+def synthetic_feature(sampling_rate: int, time_length: float, frame_period: float):
+    """
+    WORLD parameters of the synthetic voice, in the form passed to the decode stage.
+    """
+    x = synthetic_voice(sampling_rate=sampling_rate, time_length=time_length).astype(numpy.float64)
+    f0, t = pyworld.dio(x, sampling_rate, frame_period=frame_period)
+    f0 = pyworld.stonemask(x, f0, t, sampling_rate)
+    sp = pyworld.cheaptrick(x, f0, t, sampling_rate)
+    ap = pyworld.d4c(x, f0, t, sampling_rate)
+    return AcousticFeature(
+        f0=f0[:, numpy.newaxis].astype(numpy.float32),
+        sp=sp.astype(numpy.float32),
+        ap=ap.astype(numpy.float32),
+        voiced=(f0 > 0)[:, numpy.newaxis],
+    )
+
+
+def warm_up_stream(stream_wrapper: StreamWrapper, data, time_length: float, num_chunk: int):
+    """
+    process the data chunk by chunk as the worker does, to pay for the first calls before the real chunks come.
+    the outputs are discarded, and the stream must be created again afterward.
+    """
+    stream = stream_wrapper.stream
+    length = stream.to_index(time_length)
+    for i in range(num_chunk):
+        chunk = stream.in_segment_method.pick(data, i * length, (i + 1) * length)
+        stream_wrapper.add(data=chunk, time_length=time_length)
+        stream_wrapper.process_next(time_length=time_length)
@@ -0,0 +1,90 @@
+import ctypes
+from typing import List
+
+import numpy
+
+c_double_p = ctypes.POINTER(ctypes.c_double)
+c_double_pp = ctypes.POINTER(c_double_p)
+
+
+def row_pointers(array: numpy.ndarray):
+    """
+    pointer-of-pointer view of a C-contiguous float64 2d array.
+    the returned array holds the row addresses and must live as long as the pointer is used.
+    """
+    assert array.dtype == numpy.float64 and array.flags.c_contiguous
+    return array.ctypes.data + numpy.arange(len(array), dtype=numpy.uintp) * array.strides[0]
+
+
+class ParameterBuffer(object):
+    """
+    float64 f0/sp/ap arrays and their ctypes pointers for one call of AddParameters.
+    arrays grow when a longer feature is set, which must happen only while the synthesizer does not refer to them.
+    """
+
+    def __init__(self, sp_size: int, ap_size: int):
+        self.sp_size = sp_size
+        self.ap_size = ap_size
+
+        self.length = 0
+        self._allocate(0)
+
+    def _allocate(self, capacity: int):
+        self.capacity = capacity
+        self.f0 = numpy.zeros(capacity, dtype=numpy.float64)
+        self.sp = numpy.zeros((capacity, self.sp_size), dtype=numpy.float64)
+        self.ap = numpy.zeros((capacity, self.ap_size), dtype=numpy.float64)
+
+        self._sp_rows = row_pointers(self.sp)
+        self._ap_rows = row_pointers(self.ap)
+        self.f0_pointer = self.f0.ctypes.data_as(c_double_p)
+        self.sp_pointer = self._sp_rows.ctypes.data_as(c_double_pp)
+        self.ap_pointer = self._ap_rows.ctypes.data_as(c_double_pp)
+
+    def set(self, f0: numpy.ndarray, sp: numpy.ndarray, ap: numpy.ndarray):
+        length = len(f0)
+        if length > self.capacity:
+            self._allocate(max(length, self.capacity * 2))
+
+        self.f0[:length] = f0.ravel()
+        self.sp[:length] = sp
+        self.ap[:length] = ap
+        self.length = length
+
+
+class ParameterBufferPool(object):
+    """
+    one buffer per pointer slot of the WORLD synthesizer, used in the same order as the synthesizer queue.
+    `head` follows `head_pointer` of the synthesizer and `released` follows `current_pointer2`,
+    so a buffer is handed out only when the synthesizer does not refer to its slot.
+    """
+
+    def __init__(self, number_of_pointers: int, sp_size: int, ap_size: int):
+        self.buffers: List[ParameterBuffer] = [
+            ParameterBuffer(sp_size=sp_size, ap_size=ap_size)
+            for _ in range(number_of_pointers)
+        ]
+        self.head = 0
+        self.released = 0
+
+    @property
+    def full(self):
+        return self.head - self.released >= len(self.buffers)
+
+    @property
+    def current(self):
+        assert not self.full, 'the synthesizer still refers to the buffer'
+        return self.buffers[self.head % len(self.buffers)]
+
+    def commit(self):
+        self.head += 1
+
+    def release(self, pointer: int):
+        """
+        :param pointer: `current_pointer2` of the synthesizer, the first slot it still refers to.
+        """
+        self.released = pointer
+
+    def reset(self):
+        self.head = 0
+        self.released = 0
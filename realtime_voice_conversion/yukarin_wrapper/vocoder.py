@@ -1,8 +1,7 @@
-from typing import Any, Tuple, List
+from typing import Optional
 
 import numpy
 import pyworld
-from world4py.native import structures, apidefinitions, utils
 from yukarin.acoustic_feature import AcousticFeature
 from yukarin.param import AcousticParam
 from yukarin.wave import Wave
@@ -10,6 +9,7 @@ from yukarin.wave import Wave
 from realtime_voice_conversion.config import VocodeMode
 from realtime_voice_conversion.yukarin_wrapper.acoustic_feature_wrapper import AcousticFeatureWrapper, \
     CrepeAcousticFeatureWrapper
+from realtime_voice_conversion.yukarin_wrapper.parameter_buffer import ParameterBufferPool
 
 
 class Vocoder(object):
@@ -54,8 +54,8 @@ class Vocoder(object):
         acoustic_feature = acoustic_feature.astype_only_float(numpy.float64)
         out = pyworld.synthesize(
             f0=acoustic_feature.f0.ravel(),
-            spectrogram=acoustic_feature.spectrogram,
-            aperiodicity=acoustic_feature.aperiodicity,
+            spectrogram=acoustic_feature.sp,
+            aperiodicity=acoustic_feature.ap,
             fs=self.out_sampling_rate,
             frame_period=self.acoustic_param.frame_period,
         )
@@ -67,7 +67,7 @@ class RealtimeVocoder(Vocoder):
         super().__init__(*args, **kwargs)
 
         self._synthesizer = None
-        self._before_buffer: List[Tuple[Any, Any, Any]] = []  # for holding memory
+        self._parameter_pool: Optional[ParameterBufferPool] = None
 
     def create_synthesizer(
             self,
@@ -75,33 +75,56 @@ class RealtimeVocoder(Vocoder):
             number_of_pointers: int,
     ):
         assert self._synthesizer is None
+        from world4py.native import structures, apidefinitions  # only for the realtime synthesis
 
+        fft_size = pyworld.get_cheaptrick_fft_size(self.out_sampling_rate)
         self._synthesizer = structures.WorldSynthesizer()
         apidefinitions._InitializeSynthesizer(
             self.out_sampling_rate,  # sampling rate
             self.acoustic_param.frame_period,  # frame period
-            pyworld.get_cheaptrick_fft_size(self.out_sampling_rate),  # fft size
+            fft_size,  # fft size
             buffer_size,  # buffer size
             number_of_pointers,  # number of pointers
             self._synthesizer,
         )
+        self._parameter_pool = ParameterBufferPool(
+            number_of_pointers=number_of_pointers,
+            sp_size=fft_size // 2 + 1,
+            ap_size=fft_size // 2 + 1,
+        )
 
     def decode(
             self,
             acoustic_feature: AcousticFeature,
     ):
         assert self._synthesizer is not None
+        assert self._parameter_pool is not None
+        from world4py.native import apidefinitions
 
-        length = len(acoustic_feature.f0)
-        f0_buffer = utils.cast_1d_list_to_1d_pointer(acoustic_feature.f0.flatten().tolist())
-        sp_buffer = utils.cast_2d_list_to_2d_pointer(acoustic_feature.sp.tolist())
-        ap_buffer = utils.cast_2d_list_to_2d_pointer(acoustic_feature.ap.tolist())
-        apidefinitions._AddParameters(f0_buffer, length, sp_buffer, ap_buffer, self._synthesizer)
+        # write a buffer only when the synthesizer has released its slot,
+        # since the synthesizer keeps referring to the arrays until it synthesizes them.
+        pool = self._parameter_pool
+        pool.release(self._synthesizer.current_pointer2)
 
         ys = []
-        while apidefinitions._Synthesis2(self._synthesizer) != 0:
-            y = numpy.array([self._synthesizer.buffer[i] for i in range(self._synthesizer.buffer_size)])
-            ys.append(y)
+        if pool.full:
+            ys += self._synthesize()
+            pool.release(self._synthesizer.current_pointer2)
+
+        if not pool.full:  # otherwise the feature is dropped as AddParameters would do
+            buffer = pool.current
+            buffer.set(f0=acoustic_feature.f0, sp=acoustic_feature.sp, ap=acoustic_feature.ap)
+            added = apidefinitions._AddParameters(
+                buffer.f0_pointer,
+                buffer.length,
+                buffer.sp_pointer,
+                buffer.ap_pointer,
+                self._synthesizer,
+            )
+            if added != 0:
+                pool.commit()
+
+        ys += self._synthesize()
 
         if len(ys) > 0:
             out_wave = Wave(
@@ -113,12 +136,40 @@ class RealtimeVocoder(Vocoder):
                 wave=numpy.empty(0),
                 sampling_rate=self.out_sampling_rate,
             )
-
-        self._before_buffer.append((f0_buffer, sp_buffer, ap_buffer))  # for holding memory
-        if len(self._before_buffer) > 16:
-            self._before_buffer.pop(0)
         return out_wave
 
+    def _synthesize(self):
+        from world4py.native import apidefinitions
+
+        ys = []
+        while apidefinitions._Synthesis2(self._synthesizer) != 0:
+            y = numpy.ctypeslib.as_array(self._synthesizer.buffer, shape=(self._synthesizer.buffer_size,))
+            ys.append(y.copy())
+        return ys
+
+    def reset_synthesizer(self):
+        """
+        discard the parameters and the samples left in the synthesizer.
+        """
+        assert self._synthesizer is not None
+        from world4py.native import apidefinitions
+
+        apidefinitions._RefreshSynthesizer(self._synthesizer)
+        assert self._parameter_pool is not None
+        self._parameter_pool.reset()
+
+    def destroy_synthesizer(self):
+        """
+        free the memory of the synthesizer. it can be created again afterward.
+        """
+        if self._synthesizer is None:
+            return
+        from world4py.native import apidefinitions
+
+        apidefinitions._DestroySynthesizer(self._synthesizer)
+        self._synthesizer = None
+        self._parameter_pool = None
+
     def warm_up(self, time_length: float):
         y = numpy.zeros(int(time_length * self.out_sampling_rate))
         w = Wave(wave=y, sampling_rate=self.out_sampling_rate)
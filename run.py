@@ -3,18 +3,24 @@ import logging
 import queue
 import signal
 import sys
+import time
+from functools import partial
 from multiprocessing import Process, Lock
 from multiprocessing import Queue
 from pathlib import Path
-from typing import List, Optional
+from typing import Optional, Dict, List, Union
 
 import numpy
-import pyaudio
 
-from realtime_voice_conversion.config import Config
+from realtime_voice_conversion.audio.audio_engine import AudioEngine
+from realtime_voice_conversion.audio.jitter_buffer import JitterBuffer
+from realtime_voice_conversion.codec.feature_codec import FeatureCodec
+from realtime_voice_conversion.config import Config, InferenceBackend
 from realtime_voice_conversion.converter.yukarin_converter import YukarinConverter
 from realtime_voice_conversion.worker import encode_worker, convert_worker, decode_worker
-from realtime_voice_conversion.worker.utility import init_logger, Item
+from realtime_voice_conversion.worker.latency_recorder import LatencyRecorder
+from realtime_voice_conversion.worker.shared_memory_queue import SharedMemoryQueue
+from realtime_voice_conversion.worker.utility import init_logger, Item, DispatchQueue, context_chunks
 from realtime_voice_conversion.yukarin_wrapper.vocoder import RealtimeVocoder
 
 
@@ -25,17 +31,35 @@ def run(
     init_logger(logger)
 
     logger.info('model loading...')
+    start = time.time()
 
     config = Config.from_yaml(config_path)
 
-    converter = YukarinConverter.make_yukarin_converter(
+    make_converter = partial(
+        YukarinConverter.make_yukarin_converter,
         input_statistics_path=config.input_statistics_path,
         target_statistics_path=config.target_statistics_path,
         stage1_model_path=config.stage1_model_path,
         stage1_config_path=config.stage1_config_path,
         stage2_model_path=config.stage2_model_path,
         stage2_config_path=config.stage2_config_path,
+        gpu=config.gpu,
+        inference_backend=config.inference_backend,
+        stage1_onnx_path=config.stage1_onnx_path,
+        stage2_onnx_path=config.stage2_onnx_path,
+        model_cache_path=config.model_cache_path,
     )
+    if config.model_cache_path is not None:
+        # the convert workers map the model cache by themselves, here the models are only for their parameters
+        converter = make_converter(gpu=None, inference_backend=InferenceBackend.CHAINER)
+        converter_kwargs = dict(acoustic_converter=None, super_resolution=None, make_converter=make_converter)
+    else:
+        converter = make_converter()
+        converter_kwargs = dict(
+            acoustic_converter=converter.acoustic_converter,
+            super_resolution=converter.super_resolution,
+        )
+    logger.info(f'model loaded: {time.time() - start:.2f}s')
 
     realtime_vocoder = RealtimeVocoder(
         acoustic_param=converter.acoustic_converter.config.dataset.acoustic_param,
@@ -43,15 +67,40 @@ def run(
         extract_f0_mode=config.extract_f0_mode,
     )
 
-    audio_instance = pyaudio.PyAudio()
+    def create_queue():
+        if config.shared_memory_transport:
+            # 8MB per second is enough for float64 sp and ap at 48kHz, and each queue has 8 slots
+            return SharedMemoryQueue(slot_size=round(config.buffer_time * 8 * 1024 ** 2))
+        else:
+            return Queue()
+
+    queue_input_wave: Queue[Item] = create_queue()
+    queue_input_features: List[Queue[Item]] = [create_queue() for _ in range(config.num_convert_worker)]
+    queue_output_feature: Queue[Item] = create_queue()
+    queue_output_wave: Queue[Item] = create_queue()
+
+    queue_input_feature: Union[DispatchQueue, Queue[Item]]
+    if config.num_convert_worker > 1:
+        convert_future_extra_time = config.convert_future_extra_time
+        if convert_future_extra_time is None:
+            convert_future_extra_time = config.convert_extra_time
+        queue_input_feature = DispatchQueue(
+            queues=queue_input_features,
+            context=context_chunks(
+                time_length=config.buffer_time,
+                context_time=config.convert_extra_time + convert_future_extra_time,
+            ),
+        )
+    else:
+        queue_input_feature = queue_input_features[0]
 
-    queue_input_wave: Queue[Item] = Queue()
-    queue_input_feature: Queue[Item] = Queue()
-    queue_output_feature: Queue[Item] = Queue()
-    queue_output_wave: Queue[Item] = Queue()
+    if config.feature_codec is not None:
+        feature_codec = FeatureCodec(mode=config.feature_codec, sampling_rate=config.output_rate)
+    else:
+        feature_codec = None
 
     lock_encoder = Lock()
-    lock_converter = Lock()
+    lock_converters = [Lock() for _ in range(config.num_convert_worker)]
     lock_decoder = Lock()
 
     lock_encoder.acquire()
@@ -59,30 +108,49 @@ def run(
         realtime_vocoder=realtime_vocoder,
         time_length=config.buffer_time,
         extra_time=config.encode_extra_time,
+        future_extra_time=config.encode_future_extra_time,
+        incremental=config.encode_incremental,
+        gate_threshold=config.input_gate_threshold,
+        ring_buffer_time=config.ring_buffer_time,
+        retention_time=config.retention_time,
         queue_input=queue_input_wave,
         queue_output=queue_input_feature,
         acquired_lock=lock_encoder,
     ))
     process_encoder.start()
 
-    lock_converter.acquire()
-    process_converter = Process(target=convert_worker, kwargs=dict(
-        acoustic_converter=converter.acoustic_converter,
-        super_resolution=converter.super_resolution,
-        time_length=config.buffer_time,
-        extra_time=config.convert_extra_time,
-        input_silent_threshold=config.input_silent_threshold,
-        queue_input=queue_input_feature,
-        queue_output=queue_output_feature,
-        acquired_lock=lock_converter,
-    ))
-    process_converter.start()
+    process_converters: List[Process] = []
+    for i, (queue_input, lock_converter) in enumerate(zip(queue_input_features, lock_converters)):
+        lock_converter.acquire()
+        process_converter = Process(target=convert_worker, kwargs=dict(
+            **converter_kwargs,
+            time_length=config.buffer_time,
+            extra_time=config.convert_extra_time,
+            future_extra_time=config.convert_future_extra_time,
+            auto_extra_time=config.convert_auto_extra_time,
+            ring_buffer_time=config.ring_buffer_time,
+            retention_time=config.retention_time,
+            feature_codec=feature_codec,
+            input_silent_threshold=config.input_silent_threshold,
+            queue_input=queue_input,
+            queue_output=queue_output_feature,
+            acquired_lock=lock_converter,
+            worker_id=i,
+            num_worker=config.num_convert_worker,
+            max_batch=config.convert_max_batch,
+        ))
+        process_converter.start()
+        process_converters.append(process_converter)
 
     lock_decoder.acquire()
     process_decoder = Process(target=decode_worker, kwargs=dict(
         realtime_vocoder=realtime_vocoder,
         time_length=config.buffer_time,
         extra_time=config.decode_extra_time,
+        future_extra_time=config.decode_future_extra_time,
+        ring_buffer_time=config.ring_buffer_time,
+        retention_time=config.retention_time,
+        feature_codec=feature_codec,
         vocoder_buffer_size=config.vocoder_buffer_size,
         out_audio_chunk=config.out_audio_chunk,
         output_silent_threshold=config.output_silent_threshold,
@@ -92,8 +160,14 @@ def run(
     ))
     process_decoder.start()
 
-    with lock_encoder, lock_converter, lock_decoder:
-        pass  # wait
+    # imported here, not to be imported again by the worker processes started with spawn
+    import pyaudio
+    audio_instance = pyaudio.PyAudio()
+
+    for lock in [lock_encoder, *lock_converters, lock_decoder]:
+        with lock:
+            pass  # wait
+    logger.info(f'workers ready: {time.time() - start:.2f}s')
 
     # input device
     if config.input_device_name is None:
@@ -120,83 +194,90 @@ def run(
             raise ValueError('output device not found')
 
     # audio stream
-    audio_input_stream = audio_instance.open(
-        format=pyaudio.paFloat32,
-        channels=1,
-        rate=config.input_rate,
-        frames_per_buffer=config.in_audio_chunk,
-        input=True,
+    audio_engine = AudioEngine(
+        backend=audio_instance,
+        input_rate=config.input_rate,
+        output_rate=config.output_rate,
+        input_frames=config.in_device_chunk,
+        output_frames=config.out_device_chunk,
         input_device_index=input_device_index,
-    )
-
-    audio_output_stream = audio_instance.open(
-        format=pyaudio.paFloat32,
-        channels=1,
-        rate=config.output_rate,
-        frames_per_buffer=config.out_audio_chunk,
-        output=True,
         output_device_index=output_device_index,
     )
 
     # signal
     def signal_handler(s, f):
+        audio_engine.stop()
         process_encoder.terminate()
-        process_converter.terminate()
+        for process_converter in process_converters:
+            process_converter.terminate()
         process_decoder.terminate()
+
+        for q in (queue_input_wave, *queue_input_features, queue_output_feature, queue_output_wave):
+            if isinstance(q, SharedMemoryQueue):
+                q.close()
         sys.exit(0)
 
     signal.signal(signal.SIGINT, signal_handler)
 
     logger.debug('audio loop')
+    audio_engine.start()
 
     index_input = 0
-    index_output = 0
-    popped_list: List[Item] = []
+    jitter_buffer = JitterBuffer(
+        target_delay=config.jitter_buffer_delay,
+        conceal_decay=config.jitter_buffer_conceal_decay,
+    )
+
+    if config.latency_log_path is not None:
+        latency_recorder = LatencyRecorder(
+            path=config.latency_log_path,
+            interval=config.latency_log_interval,
+            time_length=config.buffer_time,
+        )
+    else:
+        latency_recorder = None
+    pending_timestamps: Dict[int, Dict[str, float]] = {}
     while True:
         # input audio
-        in_data = audio_input_stream.read(config.in_audio_chunk)
-        in_wave = numpy.frombuffer(in_data, dtype=numpy.float32) * config.input_scale
+        in_wave = audio_engine.read(config.in_audio_chunk) * config.input_scale
 
         in_item = Item(
             item=in_wave,
             index=index_input,
         )
+        in_item.stamp('capture')
         queue_input_wave.put(in_item)
 
         logger.debug(f'input {index_input}')
         index_input += 1
 
         # output
-        out_wave: Optional[numpy.ndarray] = None
-        while True:
-            try:
-                while True:  # get all item in queue, for "cut in line"
-                    item: Item = queue_output_wave.get_nowait()
-                    popped_list.append(item)
-            except queue.Empty:
-                pass
-
-            out_item = next(filter(lambda ii: ii.index == index_output, popped_list), None)
-            if out_item is None:
-                break
-
-            popped_list.remove(out_item)
-
-            logger.debug(f'output {index_output}')
-            index_output += 1
-
-            out_wave = out_item.item
-            if out_wave is None:  # silence wave
-                continue
-
-            break
+        try:
+            while True:  # get all item in queue
+                item: Item = queue_output_wave.get_nowait()
+                item.stamp('receive')
+                jitter_buffer.put(item.index, item.item)
+                pending_timestamps[item.index] = item.timestamps
+        except queue.Empty:
+            pass
+
+        out_wave: Optional[numpy.ndarray] = jitter_buffer.pop()
+        logger.debug(f'output {jitter_buffer.next_index}: {jitter_buffer.stats}')
 
         if out_wave is None:
             out_wave = numpy.zeros(config.out_audio_chunk)
-        out_wave *= config.output_scale
-
-        b = out_wave[:config.out_audio_chunk].astype(numpy.float32).tobytes()
-        audio_output_stream.write(b)
+        out_wave = out_wave * config.output_scale
+
+        if jitter_buffer.played_index is not None and jitter_buffer.played_index in pending_timestamps:
+            # the wave starts playing after the samples already queued for the device
+            pending_timestamps[jitter_buffer.played_index]['playout'] = \
+                time.monotonic() + len(audio_engine.output_queue) / config.output_rate
+        audio_engine.write(out_wave[:config.out_audio_chunk])
+
+        for index in [i for i in pending_timestamps if i < jitter_buffer.next_index]:
+            timestamps = pending_timestamps.pop(index)
+            if latency_recorder is not None:
+                latency_recorder.add(timestamps)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,125 @@
+import argparse
+import logging
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+import chainer
+import numpy
+
+from realtime_voice_conversion.config import Config
+from realtime_voice_conversion.converter.yukarin_converter import YukarinConverter
+from realtime_voice_conversion.server.protocol import SessionInfo, send_info, receive_chunk, send_chunk
+from realtime_voice_conversion.server.session import Session
+from realtime_voice_conversion.worker.utility import init_logger
+
+
+def server(
+        config_path: Path,
+        host: str,
+        port: int,
+        unix_path: Optional[Path],
+):
+    logger = logging.getLogger('root')
+    init_logger(logger)
+
+    logger.info('model loading...')
+
+    config = Config.from_yaml(config_path)
+
+    converter = YukarinConverter.make_yukarin_converter(
+        input_statistics_path=config.input_statistics_path,
+        target_statistics_path=config.target_statistics_path,
+        stage1_model_path=config.stage1_model_path,
+        stage1_config_path=config.stage1_config_path,
+        stage2_model_path=config.stage2_model_path,
+        stage2_config_path=config.stage2_config_path,
+        gpu=config.gpu,
+        inference_backend=config.inference_backend,
+        stage1_onnx_path=config.stage1_onnx_path,
+        stage2_onnx_path=config.stage2_onnx_path,
+        model_cache_path=config.model_cache_path,
+    )
+
+    chainer.global_config.enable_backprop = False
+    chainer.global_config.train = False
+
+    model_lock = threading.Lock()
+    info = SessionInfo(
+        input_rate=config.input_rate,
+        output_rate=config.output_rate,
+        in_audio_chunk=config.in_audio_chunk,
+        out_audio_chunk=config.out_audio_chunk,
+    )
+
+    class SessionHandler(socketserver.BaseRequestHandler):
+        def setup(self):
+            if self.request.family in (socket.AF_INET, socket.AF_INET6):
+                self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def handle(self):
+            logger.info(f'session start: {self.client_address}')
+            session = Session(
+                config=config,
+                acoustic_converter=converter.acoustic_converter,
+                super_resolution=converter.super_resolution,
+                model_lock=model_lock,
+            )
+            try:
+                send_info(self.request, info)
+
+                while True:
+                    try:
+                        received = receive_chunk(self.request, chunk_length=info.in_audio_chunk)
+                    except ValueError as e:
+                        logger.warning(f'{self.client_address}: {e}')
+                        break
+                    if received is None:
+                        break
+                    index, wave = received
+                    if wave is None:
+                        wave = numpy.zeros(info.in_audio_chunk, dtype=numpy.float32)
+
+                    start = time.time()
+                    out_wave = session.process(wave)
+                    send_chunk(self.request, index, out_wave)
+                    logger.debug(f'{self.client_address} {index}: {time.time() - start}')
+            finally:
+                session.close()
+
+            logger.info(f'session end: {self.client_address}')
+
+    socket_server: Union[socketserver.ThreadingUnixStreamServer, socketserver.ThreadingTCPServer]
+    if unix_path is not None:
+        socket_server = socketserver.ThreadingUnixStreamServer(str(unix_path), SessionHandler)
+    else:
+        socket_server = socketserver.ThreadingTCPServer((host, port), SessionHandler)
+    socket_server.daemon_threads = True
+
+    logger.info(f'serving on {unix_path if unix_path is not None else (host, port)}')
+    with socket_server:
+        try:
+            socket_server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    if unix_path is not None:
+        unix_path.unlink()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--config_path', type=Path, default=Path('./config.yaml'))
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix_path', type=Path, help='listen on the unix socket instead of tcp')
+    args = parser.parse_args()
+
+    server(
+        config_path=args.config_path,
+        host=args.host,
+        port=args.port,
+        unix_path=args.unix_path,
+    )
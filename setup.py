@@ -9,6 +9,7 @@ setup(
     author_email='hihokaruta@gmail.com',
     description='Realtime Voice Conversion Library With DeepLearning Power.',
     license='MIT License',
+    python_requires='>=3.8',
     install_requires=[
         'yukarin',
         'become-yukarin',
@@ -18,7 +19,7 @@ setup(
         'https://github.com/Hiroshiba/become-yukarin/master',
     ],
     classifiers=[
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.8',
         'License :: OSI Approved :: MIT License',
     ]
 )
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 from typing import Tuple
 from unittest import TestCase
@@ -12,8 +13,11 @@ from yukarin.config import create_from_json as create_config
 from yukarin.f0_converter import F0Converter
 
 from realtime_voice_conversion.config import VocodeMode
-from realtime_voice_conversion.stream import EncodeStream, ConvertStream, DecodeStream
+from realtime_voice_conversion.converter.onnx_export import export_predictor, parity_error
+from realtime_voice_conversion.converter.onnx_predictor import OnnxPredictor, PredictorRecorder
+from realtime_voice_conversion.stream import EncodeStream, ConvertStream, DecodeStream, StreamWrapper
 from realtime_voice_conversion.stream.base_stream import BaseStream
+from realtime_voice_conversion.stream.receptive_field import receptive_field_time, context_error
 from realtime_voice_conversion.yukarin_wrapper.vocoder import Vocoder, RealtimeVocoder
 from realtime_voice_conversion.yukarin_wrapper.voice_changer import AcousticFeatureWrapper, VoiceChanger
 
@@ -212,6 +216,64 @@ class AllStreamTest(TestCase):
         target = self._convert(self._encode(waves[0]))
         self.assertTrue(equal_feature(output, target))
 
+    def test_short_hop(self):
+        hop = 0.1
+        wave = numpy.concatenate(self._load_wave_and_split()[:2])
+        length = round(hop * self.input_rate)
+
+        wrappers = [
+            StreamWrapper(stream=self.encode_stream, extra_time=0.05, future_extra_time=0.02),
+            StreamWrapper(stream=self.convert_stream, extra_time=0.2, future_extra_time=0.1),
+            StreamWrapper(stream=self.decode_stream, extra_time=0),
+        ]
+        for i in range(len(wave) // length):
+            data = wave[i * length:(i + 1) * length]
+            for wrapper in wrappers:
+                wrapper.add(data=data, time_length=hop)
+                data = wrapper.process_next(time_length=hop)
+            self.assertFalse(numpy.any(numpy.isnan(data)))
+
+        self.assertAlmostEqual(wrappers[-1].current_time, len(wave) // length * hop)
+
+    def test_receptive_field(self):
+        waves = self._load_wave_and_split()
+        convert_stream = self.convert_stream
+
+        receptive_time = receptive_field_time(convert_stream)
+        self.assertIsNotNone(receptive_time)
+
+        feature_wrapper = self._encode(numpy.concatenate(waves[:3]))
+        error = context_error(
+            convert_stream,
+            feature_wrapper,
+            time_length=0.5,
+            extra_time=receptive_time,
+            full_extra_time=1,
+        )
+        self.assertLess(error, 1e-2)
+
+    def test_onnx_parity(self):
+        waves = self._load_wave_and_split()
+        acoustic_converter, super_resolution = self.models
+
+        stage1_recorder = PredictorRecorder(acoustic_converter.model)
+        stage2_recorder = PredictorRecorder(super_resolution.model)
+        acoustic_converter.model, super_resolution.model = stage1_recorder, stage2_recorder
+        try:
+            self._convert(self._encode(waves[0]))
+            self._convert(self._encode(numpy.concatenate(waves[1:3])))  # another length
+        finally:
+            acoustic_converter.model, super_resolution.model = stage1_recorder.predictor, stage2_recorder.predictor
+
+        with tempfile.TemporaryDirectory() as directory:
+            for recorder in (stage1_recorder, stage2_recorder):
+                path = Path(directory) / 'predictor.onnx'
+                export_predictor(recorder.predictor, recorder.inputs[0], path)
+
+                onnx_predictor = OnnxPredictor(path)
+                for x in recorder.inputs:
+                    self.assertLess(parity_error(recorder.predictor, onnx_predictor, x), 1e-3)
+
     def test_all_stream(self):
         num_data = 10
         time_length = 0.3
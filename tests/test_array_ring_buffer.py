@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+import numpy
+
+from realtime_voice_conversion.buffer.array_ring_buffer import ArrayRingBuffer
+
+
+class ArrayRingBufferTest(TestCase):
+    def setUp(self):
+        self.buffer = ArrayRingBuffer(capacity=10)
+
+    def test_read(self):
+        self.buffer.write(start=0, data=numpy.arange(5))
+        numpy.testing.assert_equal(self.buffer.read(start=1, length=3), [1, 2, 3])
+
+    def test_read_view(self):
+        self.buffer.write(start=0, data=numpy.arange(5))
+        data = self.buffer.read(start=1, length=3)
+        self.assertTrue(numpy.shares_memory(data, self.buffer.buffer))
+
+    def test_read_with_padding(self):
+        self.buffer.write(start=0, data=numpy.arange(5))
+        numpy.testing.assert_equal(self.buffer.read(start=-2, length=4), [0, 0, 0, 1])
+        numpy.testing.assert_equal(self.buffer.read(start=3, length=4), [3, 4, 0, 0])
+
+    def test_read_wrap(self):
+        for i in range(3):
+            self.buffer.write(start=i * 4, data=numpy.arange(i * 4, (i + 1) * 4))
+        self.assertEqual(self.buffer.begin, 2)
+        self.assertEqual(self.buffer.end, 12)
+        numpy.testing.assert_equal(self.buffer.read(start=7, length=4), [7, 8, 9, 10])
+        numpy.testing.assert_equal(self.buffer.read(start=0, length=4), [0, 0, 2, 3])
+
+    def test_write_gap(self):
+        self.buffer.write(start=0, data=numpy.ones(4))
+        self.buffer.write(start=12, data=numpy.ones(2) * 2)
+        numpy.testing.assert_equal(self.buffer.read(start=4, length=10), [0] * 4 + [0] * 4 + [2, 2])
+
+    def test_write_longer_than_capacity(self):
+        self.buffer.write(start=0, data=numpy.arange(15))
+        self.assertEqual(self.buffer.begin, 5)
+        numpy.testing.assert_equal(self.buffer.read(start=3, length=4), [0, 0, 5, 6])
+
+    def test_shape(self):
+        buffer = ArrayRingBuffer(capacity=4, shape=(2,), fill_value=1)
+        buffer.write(start=0, data=numpy.zeros((3, 2)))
+        numpy.testing.assert_equal(buffer.read(start=2, length=2), [[0, 0], [1, 1]])
@@ -0,0 +1,101 @@
+import threading
+from unittest import TestCase
+
+import numpy
+
+from realtime_voice_conversion.audio.audio_engine import AudioEngine, SampleQueue
+
+
+class FakeStream(object):
+    def __init__(self, stream_callback, frames_per_buffer: int, input=False, output=False, **kwargs):
+        self.callback = stream_callback
+        self.frames = frames_per_buffer
+        self.input = input
+        self.output = output
+        self.active = False
+
+    def start_stream(self):
+        self.active = True
+
+    def stop_stream(self):
+        self.active = False
+
+    def close(self):
+        pass
+
+
+class FakeAudioBackend(object):
+    """
+    drives the callbacks manually instead of a device thread.
+    """
+
+    def __init__(self):
+        self.input_stream = None
+        self.output_stream = None
+
+    def open(self, **kwargs):
+        stream = FakeStream(**kwargs)
+        if stream.input:
+            self.input_stream = stream
+        else:
+            self.output_stream = stream
+        return stream
+
+    def capture(self, wave: numpy.ndarray):
+        data = wave.astype(numpy.float32).tobytes()
+        return self.input_stream.callback(data, len(wave), None, 0)
+
+    def play(self):
+        data, _ = self.output_stream.callback(None, self.output_stream.frames, None, 0)
+        return numpy.frombuffer(data, dtype=numpy.float32)
+
+
+class SampleQueueTest(TestCase):
+    def test_push_pop(self):
+        queue = SampleQueue()
+        queue.push(numpy.arange(3, dtype=numpy.float32))
+        queue.push(numpy.arange(3, 8, dtype=numpy.float32))
+        self.assertEqual(len(queue), 8)
+
+        self.assertIsNone(queue.pop(10))
+        numpy.testing.assert_equal(queue.pop(5), numpy.arange(5))
+        numpy.testing.assert_equal(queue.pop(3), numpy.arange(5, 8))
+        self.assertEqual(len(queue), 0)
+
+
+class AudioEngineTest(TestCase):
+    def setUp(self):
+        self.backend = FakeAudioBackend()
+        self.engine = AudioEngine(
+            backend=self.backend,
+            input_rate=100,
+            output_rate=100,
+            input_frames=4,
+            output_frames=4,
+        )
+        self.engine.start()
+
+    def tearDown(self):
+        self.engine.stop()
+
+    def test_read(self):
+        self.backend.capture(numpy.arange(4))
+        self.backend.capture(numpy.arange(4, 8))
+        numpy.testing.assert_equal(self.engine.read(6), numpy.arange(6))
+        self.assertIsNone(self.engine.read(6, timeout=0.01))
+
+    def test_read_waits_for_device(self):
+        timer = threading.Timer(0.05, lambda: self.backend.capture(numpy.arange(4)))
+        timer.start()
+        numpy.testing.assert_equal(self.engine.read(4, timeout=5), numpy.arange(4))
+        timer.join()
+
+    def test_write(self):
+        self.engine.write(numpy.arange(6, dtype=numpy.float64))
+        numpy.testing.assert_equal(self.backend.play(), numpy.arange(4))
+
+        numpy.testing.assert_equal(self.backend.play(), numpy.zeros(4))  # underrun
+        self.assertEqual(self.engine.underrun, 1)
+
+        self.engine.write(numpy.arange(6, 8))
+        numpy.testing.assert_equal(self.backend.play(), numpy.arange(4, 8))
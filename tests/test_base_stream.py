@@ -1,4 +1,4 @@
-from typing import Iterable
+from typing import Iterable, Optional
 from unittest import TestCase
 
 from realtime_voice_conversion.segment.segment import BaseSegmentMethod
@@ -23,7 +23,13 @@ class TestSegmentMethod(BaseSegmentMethod[str]):
 
 
 class Stream(BaseStream):
-    def process(self, start_time: float, time_length: float, extra_time: float):
+    def process(
+            self,
+            start_time: float,
+            time_length: float,
+            extra_time: float,
+            future_extra_time: Optional[float] = None,
+    ):
         raise NotImplementedError()
 
 
@@ -91,3 +97,20 @@ class BaseStreamTest(TestCase):
 
         data = self.stream.fetch(start_time=0, time_length=2, extra_time=0.3)
         self.assertEqual(data, ' ' * 3 + 'a' * self.rate + 'b' * self.rate + ' ' * 3)
+
+    def test_fetch_unordered_add(self):
+        self.stream.add(start_time=1, data='b' * self.rate)
+        self.stream.add(start_time=0, data='a' * self.rate)
+
+        data = self.stream.fetch(start_time=0.5, time_length=1, extra_time=0)
+        self.assertEqual(data, 'a' * (self.rate // 2) + 'b' * (self.rate // 2))
+
+    def test_fetch_many_segments(self):
+        for i in range(1000):
+            self.stream.add(start_time=i, data=chr(ord('a') + i % 26) * self.rate)
+
+        data = self.stream.fetch(start_time=500.5, time_length=2, extra_time=0)
+        self.assertEqual(data, 'g' * (self.rate // 2) + 'h' * self.rate + 'i' * (self.rate // 2))
+
+        self.stream.remove(end_time=500)
+        self.assertEqual(len(self.stream.stream), 500)
@@ -0,0 +1,75 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase, mock
+
+import numpy
+from become_yukarin.param import Param
+from yukarin.param import AcousticParam
+
+import batch
+from realtime_voice_conversion.config import VocodeMode
+from realtime_voice_conversion.worker.warm_up import synthetic_voice
+from realtime_voice_conversion.yukarin_wrapper.vocoder import Vocoder
+from test_convert_stream import AttrDict
+
+
+class BatchTest(TestCase):
+    def setUp(self):
+        self.sampling_rate = 24000
+        self.vocoder = Vocoder(
+            acoustic_param=AcousticParam(sampling_rate=self.sampling_rate),
+            out_sampling_rate=self.sampling_rate,
+            extract_f0_mode=VocodeMode.WORLD,
+        )
+
+        # the voice changer passes the features through, and records them
+        self.converted_f0s = []
+        voice_changer = AttrDict(
+            acoustic_converter=AttrDict(
+                config=AttrDict(
+                    dataset=AttrDict(
+                        acoustic_param=self.vocoder.acoustic_param,
+                    ),
+                ),
+            ),
+            super_resolution=AttrDict(
+                config=AttrDict(
+                    dataset=AttrDict(
+                        param=Param(),
+                    ),
+                ),
+            ),
+            output_sampling_rate=self.sampling_rate,
+            convert_from_acoustic_feature=self._convert,
+        )
+        batch._models = (self.vocoder, voice_changer)
+
+        self.waves = {
+            Path('a.wav'): synthetic_voice(sampling_rate=self.sampling_rate, time_length=1, f0=120),
+            Path('b.wav'): synthetic_voice(sampling_rate=self.sampling_rate, time_length=1, f0=240),
+        }
+
+    def tearDown(self):
+        batch._models = None
+
+    def _convert(self, feature):
+        self.converted_f0s.append(feature.f0.copy())
+        return feature
+
+    def _load(self, path: str, sr: int):
+        return self.waves[Path(path)], sr
+
+    def _convert_files(self, paths):
+        self.converted_f0s = []
+        with tempfile.TemporaryDirectory() as output_dir, mock.patch('batch.librosa.load', side_effect=self._load):
+            for path in paths:
+                batch._convert((path, Path(output_dir) / path.name))
+        return self.converted_f0s
+
+    def test_independent_files(self):
+        f0s_alone = self._convert_files([Path('b.wav')])
+        f0s_after = self._convert_files([Path('a.wav'), Path('b.wav')])
+
+        self.assertEqual(len(f0s_after), 2)
+        numpy.testing.assert_equal(f0s_after[1], f0s_alone[0])
+        self.assertFalse(numpy.array_equal(f0s_after[0], f0s_after[1]))
@@ -35,9 +35,12 @@ class ConvertStreamTest(TestCase):
             ),
             output_sampling_rate=24000,
         )
-        self.stream = ConvertStream(voice_changer=self.voice_changer)
+        self.stream = self.create_stream()
         self.stream.in_segment_method._keys = ['f0']
 
+    def create_stream(self):
+        return ConvertStream(voice_changer=self.voice_changer)
+
     @property
     def in_sampling_rate(self):
         return self.voice_changer.acoustic_converter.config.dataset.acoustic_param.sampling_rate
@@ -102,3 +105,8 @@ class ConvertStreamTest(TestCase):
         data = self.stream.fetch(start_time=0, time_length=2, extra_time=0.3)
         target = self.get_feature_wrapper_segments([0, 1, 2, 0], [0.3, 1, 1, 0.3])
         self.assertEqual(data, target)
+
+
+class ConvertStreamRingBufferTest(ConvertStreamTest):
+    def create_stream(self):
+        return ConvertStream(voice_changer=self.voice_changer, ring_buffer_time=5)
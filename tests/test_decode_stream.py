@@ -0,0 +1,29 @@
+from unittest import TestCase
+
+import numpy
+from yukarin.param import AcousticParam
+
+from realtime_voice_conversion.config import VocodeMode
+from realtime_voice_conversion.stream import DecodeStream
+from realtime_voice_conversion.worker.warm_up import synthetic_feature
+from realtime_voice_conversion.yukarin_wrapper.vocoder import Vocoder
+
+
+class DecodeStreamTest(TestCase):
+    def setUp(self):
+        self.sampling_rate = 24000
+        self.vocoder = Vocoder(
+            acoustic_param=AcousticParam(sampling_rate=self.sampling_rate),
+            out_sampling_rate=self.sampling_rate,
+            extract_f0_mode=VocodeMode.WORLD,
+        )
+        self.stream = DecodeStream(vocoder=self.vocoder)
+
+    def test_process(self):
+        feature = synthetic_feature(sampling_rate=self.sampling_rate, time_length=1, frame_period=5)
+        self.stream.add(start_time=0, data=feature)
+
+        wave = self.stream.process(start_time=0, time_length=0.5, extra_time=0.1)
+        self.assertEqual(len(wave), round((0.5 + 0.1 * 2) * self.sampling_rate))
+        self.assertFalse(numpy.any(numpy.isnan(wave)))
+        self.assertGreater(numpy.abs(wave).max(), 0)
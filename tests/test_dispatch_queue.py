@@ -0,0 +1,71 @@
+import queue
+from typing import List
+from unittest import TestCase
+
+from realtime_voice_conversion.stream.stream_wrapper import StreamWrapper
+from realtime_voice_conversion.worker.utility import DispatchQueue, Item, Resequencer, context_chunks
+from test_stream_wrapper import TestSegmentMethod, Stream
+
+
+class DispatchQueueTest(TestCase):
+    def setUp(self):
+        self.rate = 10
+        self.time_length = 1
+        self.extra_time = 1.5
+        self.future_extra_time = 0.5
+        self.datas = [chr(ord('a') + i) * self.rate for i in range(10)]
+
+    def create_wrapper(self):
+        method = TestSegmentMethod(sampling_rate=self.rate)
+        return StreamWrapper(
+            stream=Stream(in_segment_method=method, out_segment_method=method),
+            extra_time=self.extra_time,
+            future_extra_time=self.future_extra_time,
+        )
+
+    def test_owners(self):
+        dispatch_queue = DispatchQueue(queues=[None, None, None], context=1)
+        self.assertEqual(dispatch_queue.owners(0), [0, 1])
+        self.assertEqual(dispatch_queue.owners(2), [0, 2])
+
+    def test_same_as_single_worker(self):
+        wrapper = self.create_wrapper()
+        targets = []
+        for data in self.datas:
+            wrapper.add(data=data, time_length=self.time_length)
+            targets.append(wrapper.process_next(time_length=self.time_length))
+
+        num_worker = 3
+        queues: List[queue.Queue] = [queue.Queue() for _ in range(num_worker)]
+        dispatch_queue = DispatchQueue(
+            queues=queues,
+            context=context_chunks(self.time_length, self.extra_time + self.future_extra_time),
+        )
+        for i, data in enumerate(self.datas):
+            dispatch_queue.put(Item(item=data, index=i))
+
+        outputs: List[Item] = []
+        for worker_id, q in enumerate(queues):
+            wrapper = self.create_wrapper()
+            while not q.empty():
+                item: Item = q.get()
+                wrapper.add_at(position=item.index, data=item.item, time_length=self.time_length)
+                if item.index % num_worker == worker_id:
+                    outputs.append(Item(item=wrapper.process_at(item.index, self.time_length), index=item.index))
+
+        resequencer = Resequencer()
+        for item in outputs:
+            resequencer.put(item)
+        self.assertEqual([item.item for item in resequencer.pop_ready()], targets)
+
+
+class ResequencerTest(TestCase):
+    def test_pop_ready(self):
+        resequencer = Resequencer()
+        resequencer.put(Item(item=None, index=1))
+        self.assertEqual(list(resequencer.pop_ready()), [])
+
+        resequencer.put(Item(item=None, index=0))
+        resequencer.put(Item(item=None, index=3))
+        self.assertEqual([item.index for item in resequencer.pop_ready()], [0, 1])
+        self.assertEqual(resequencer.next_index, 2)
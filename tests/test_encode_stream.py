@@ -83,3 +83,27 @@ class EncodeStreamTest(TestCase):
             self.get_numpy_array(0, self.in_sampling_rate // 10 * 3),
         ])
         numpy.testing.assert_equal(data, target)
+
+    def test_fetch_with_future_extra(self):
+        self.stream.add(start_time=0, data=self.get_numpy_array(1))
+        self.stream.add(start_time=1, data=self.get_numpy_array(2))
+
+        data = self.stream.fetch(start_time=0.5, time_length=0.5, extra_time=0.3, future_extra_time=0.1)
+        target = numpy.concatenate([
+            self.get_numpy_array(1, self.in_sampling_rate // 10 * 8),
+            self.get_numpy_array(2, self.in_sampling_rate // 10),
+        ])
+        numpy.testing.assert_equal(data, target)
+
+        data = self.stream.fetch(start_time=0.5, time_length=0.5, extra_time=0, future_extra_time=0.3)
+        target = numpy.concatenate([
+            self.get_numpy_array(1, self.in_sampling_rate // 2),
+            self.get_numpy_array(2, self.in_sampling_rate // 10 * 3),
+        ])
+        numpy.testing.assert_equal(data, target)
+
+
+class EncodeStreamRingBufferTest(EncodeStreamTest):
+    def setUp(self):
+        self.vocoder: Vocoder = VocoderMock()
+        self.stream = EncodeStream(vocoder=self.vocoder, ring_buffer_time=5)
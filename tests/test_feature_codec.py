@@ -0,0 +1,52 @@
+from unittest import TestCase
+
+import numpy
+import pyworld
+from yukarin.acoustic_feature import AcousticFeature
+
+from realtime_voice_conversion.codec.feature_codec import FeatureCodec
+from realtime_voice_conversion.config import FeatureCodecMode
+
+
+def log_spectral_distance(a: numpy.ndarray, b: numpy.ndarray):
+    return numpy.sqrt(((10 * numpy.log10(a) - 10 * numpy.log10(b)) ** 2).mean(axis=1)).mean()
+
+
+class FeatureCodecTest(TestCase):
+    def setUp(self):
+        self.sampling_rate = 24000
+        t = numpy.arange(self.sampling_rate) / self.sampling_rate
+        wave = numpy.sin(2 * numpy.pi * 150 * t) * 0.3 + numpy.random.RandomState(0).randn(len(t)) * 0.01
+
+        f0, times = pyworld.harvest(wave, self.sampling_rate)
+        sp = pyworld.cheaptrick(wave, f0, times, self.sampling_rate)
+        ap = pyworld.d4c(wave, f0, times, self.sampling_rate)
+        self.feature = AcousticFeature(
+            f0=f0[:, numpy.newaxis].astype(numpy.float32),
+            sp=sp,
+            ap=ap,
+            voiced=(f0 > 0)[:, numpy.newaxis],
+        )
+
+    def check(self, mode: FeatureCodecMode, max_distance: float, max_ap_error: float, max_ratio: float):
+        codec = FeatureCodec(mode=mode, sampling_rate=self.sampling_rate)
+        encoded = codec.encode(self.feature)
+        decoded = codec.decode(encoded)
+
+        numpy.testing.assert_equal(decoded.f0, self.feature.f0)
+        numpy.testing.assert_equal(decoded.voiced, self.feature.voiced)
+        self.assertEqual(decoded.sp.shape, self.feature.sp.shape)
+        self.assertEqual(decoded.ap.shape, self.feature.ap.shape)
+
+        self.assertLess(log_spectral_distance(decoded.sp, self.feature.sp), max_distance)
+        self.assertLess(numpy.abs(decoded.ap - self.feature.ap).max(), max_ap_error)
+        self.assertLess(encoded.nbytes / (self.feature.sp.nbytes + self.feature.ap.nbytes), max_ratio)
+
+    def test_float32(self):
+        self.check(FeatureCodecMode.FLOAT32, max_distance=1e-4, max_ap_error=1e-6, max_ratio=0.51)
+
+    def test_float16(self):
+        self.check(FeatureCodecMode.FLOAT16, max_distance=0.05, max_ap_error=1e-3, max_ratio=0.26)
+
+    def test_coded(self):
+        self.check(FeatureCodecMode.CODED, max_distance=3, max_ap_error=1e-3, max_ratio=0.05)
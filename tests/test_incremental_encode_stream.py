@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+import numpy
+from yukarin.param import AcousticParam
+from yukarin.wave import Wave
+
+from realtime_voice_conversion.stream import EncodeStream, IncrementalEncodeStream
+from realtime_voice_conversion.yukarin_wrapper.voice_changer import AcousticFeatureWrapper
+
+
+class VocoderMock(object):
+    """
+    frame-local analysis, each frame is the mean of samples within one frame period around it.
+    """
+
+    def __init__(self):
+        self.acoustic_param = AcousticParam()
+
+    def encode(self, wave: Wave):
+        hop = wave.sampling_rate * self.acoustic_param.frame_period // 1000
+        length = len(wave.wave) // hop + 1
+        x = numpy.pad(wave.wave, hop)
+        f0 = numpy.array([x[i * hop:(i + 2) * hop].mean() for i in range(length)], dtype=numpy.float32)
+        return AcousticFeatureWrapper(wave=wave, f0=f0[:, numpy.newaxis])
+
+
+class IncrementalEncodeStreamTest(TestCase):
+    def setUp(self):
+        self.vocoder = VocoderMock()
+        self.rate = self.vocoder.acoustic_param.sampling_rate
+        self.time_length = 0.5
+        self.extra_time = 0.2
+
+        self.waves = [
+            numpy.random.RandomState(i).rand(round(self.rate * self.time_length)).astype(numpy.float32)
+            for i in range(6)
+        ]
+
+    def process(self, stream: EncodeStream):
+        for i, wave in enumerate(self.waves):
+            stream.add(start_time=i * self.time_length, data=wave)
+        return [
+            stream.process(start_time=i * self.time_length, time_length=self.time_length, extra_time=self.extra_time)
+            for i in range(len(self.waves))
+        ]
+
+    def test_same_as_full_window(self):
+        targets = self.process(EncodeStream(vocoder=self.vocoder))
+        outputs = self.process(IncrementalEncodeStream(vocoder=self.vocoder, margin_time=0.01))
+        for output, target in zip(outputs, targets):
+            numpy.testing.assert_allclose(output.f0, target.f0, rtol=1e-5)
+
+    def test_lookback_time(self):
+        stream = IncrementalEncodeStream(vocoder=self.vocoder, margin_time=0.01)
+        self.assertEqual(stream.lookback_time(self.extra_time), 0.01)
@@ -0,0 +1,72 @@
+from unittest import TestCase
+
+import numpy
+
+from realtime_voice_conversion.audio.jitter_buffer import JitterBuffer
+
+
+def wave(value: float):
+    return numpy.ones(4, dtype=numpy.float32) * value
+
+
+def value(w):
+    return None if w is None else float(w[0])
+
+
+class JitterBufferTest(TestCase):
+    def test_in_order(self):
+        buffer = JitterBuffer()
+        outputs = []
+        for i in range(3):
+            buffer.put(i, wave(i))
+            outputs.append(value(buffer.pop()))
+        self.assertEqual(outputs, [0, 1, 2])
+        self.assertEqual(buffer.stats['played'], 3)
+
+    def test_reorder(self):
+        buffer = JitterBuffer(target_delay=2)
+        buffer.put(1, wave(1))
+        self.assertIsNone(buffer.pop())  # not started
+        buffer.put(0, wave(0))
+        self.assertEqual([value(buffer.pop()), value(buffer.pop())], [0, 1])
+        self.assertEqual(buffer.concealed, 0)
+
+    def test_underrun(self):
+        buffer = JitterBuffer()
+        buffer.put(0, wave(0))
+        buffer.pop()
+        self.assertIsNone(buffer.pop())
+        self.assertEqual(buffer.concealed, 1)
+
+        buffer.put(1, wave(1))
+        self.assertEqual(value(buffer.pop()), 1)
+
+    def test_missing_and_late(self):
+        buffer = JitterBuffer(target_delay=1)
+        buffer.put(0, wave(0))
+        buffer.put(2, wave(2))
+        buffer.put(3, wave(3))
+        outputs = [value(buffer.pop()) for _ in range(3)]
+        self.assertEqual(outputs, [0, None, 2])
+        self.assertEqual(buffer.concealed, 1)
+
+        buffer.put(1, wave(1))
+        self.assertEqual(buffer.late, 1)
+        self.assertEqual(value(buffer.pop()), 3)
+
+    def test_skip_silent(self):
+        buffer = JitterBuffer()
+        buffer.put(0, None)
+        buffer.put(1, wave(1))
+        self.assertEqual(value(buffer.pop()), 1)
+        self.assertEqual(buffer.skipped_silent, 1)
+
+        buffer.put(2, None)
+        self.assertIsNone(buffer.pop())
+        self.assertEqual(buffer.depth, 0)
+
+    def test_conceal_decay(self):
+        buffer = JitterBuffer(conceal_decay=0.5)
+        buffer.put(0, wave(1))
+        buffer.pop()
+        self.assertEqual([value(buffer.pop()), value(buffer.pop())], [0.5, 0.25])
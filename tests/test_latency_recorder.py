@@ -0,0 +1,47 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from realtime_voice_conversion.worker.latency_recorder import LatencyRecorder
+
+
+class LatencyRecorderTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / 'latency.jsonl'
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def create(self, interval: float):
+        return LatencyRecorder(
+            path=self.path,
+            interval=interval,
+            time_length=0.5,
+            stamps=('capture', 'encode_get', 'encode_put', 'playout'),
+            bins=(0, 0.1, 1),
+        )
+
+    def test_summary(self):
+        recorder = self.create(interval=100)
+        recorder.add(dict(capture=0, encode_get=0.05, encode_put=0.3, playout=1.5))
+        recorder.add(dict(capture=1, encode_get=1.05, encode_put=1.2))  # dropped before playout
+
+        summary = recorder.summary()
+        intervals = summary['intervals']
+        self.assertEqual(intervals['capture-encode_get']['count'], 2)
+        self.assertEqual(intervals['capture-encode_get']['histogram'], [2, 0, 0])
+        self.assertEqual(intervals['encode_put-playout']['histogram'], [0, 0, 1])
+        self.assertAlmostEqual(intervals['capture-playout']['mean'], 1.5)
+        self.assertAlmostEqual(summary['rtf']['encode'], 0.2 / 0.5)
+        self.assertFalse(self.path.exists())
+
+    def test_write(self):
+        recorder = self.create(interval=0)
+        recorder.add(dict(capture=0, encode_get=0.05))
+        recorder.add(dict(capture=1, encode_get=1.2))
+
+        lines = self.path.read_text().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[1])['intervals']['capture-encode_get']['histogram'], [0, 1, 0])
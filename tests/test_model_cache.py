@@ -0,0 +1,56 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+import numpy
+
+from realtime_voice_conversion.converter.model_cache import model_cache_key, save_model_cache, load_model_cache
+
+
+class Model(object):
+    def __init__(self):
+        random = numpy.random.RandomState(0)
+        self.w = random.rand(100, 3).astype(numpy.float32)
+        self.b = random.rand(7)
+        self.name = 'model'
+
+
+class ModelCacheTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / 'model.cache'
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_save_load(self):
+        model = Model()
+        save_model_cache(self.path, key='a', obj=model)
+
+        loaded = load_model_cache(self.path, key='a')
+        numpy.testing.assert_array_equal(loaded.w, model.w)
+        numpy.testing.assert_array_equal(loaded.b, model.b)
+        self.assertEqual(loaded.name, model.name)
+        self.assertFalse(loaded.w.flags.owndata)  # view of the mapped file
+
+    def test_copy_on_write(self):
+        save_model_cache(self.path, key='a', obj=Model())
+
+        loaded = load_model_cache(self.path, key='a')
+        loaded.w[:] = 0
+        numpy.testing.assert_array_equal(load_model_cache(self.path, key='a').w, Model().w)
+
+    def test_stale(self):
+        self.assertIsNone(load_model_cache(self.path, key='a'))
+
+        save_model_cache(self.path, key='a', obj=Model())
+        self.assertIsNone(load_model_cache(self.path, key='b'))
+
+    def test_key(self):
+        source = Path(self.directory.name) / 'source'
+        source.write_bytes(b'a')
+        key = model_cache_key([source])
+        self.assertEqual(model_cache_key([source]), key)
+
+        source.write_bytes(b'ab')
+        self.assertNotEqual(model_cache_key([source]), key)
@@ -0,0 +1,72 @@
+import pickle
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+import numpy
+import onnx
+from onnx import helper, numpy_helper, TensorProto
+
+from realtime_voice_conversion.converter.onnx_export import make_time_dynamic
+from realtime_voice_conversion.converter.onnx_predictor import OnnxPredictor, PredictorRecorder
+
+
+def make_conv_model(time_length, weight: numpy.ndarray):
+    """
+    1d convolution over (batch, channel, time) with the kernel size 3 and the same padding.
+    """
+    out_channels, in_channels, _ = weight.shape
+    graph = helper.make_graph(
+        nodes=[helper.make_node('Conv', ['x', 'w'], ['y'], pads=[1, 1])],
+        name='conv',
+        inputs=[helper.make_tensor_value_info('x', TensorProto.FLOAT, [1, in_channels, time_length])],
+        outputs=[helper.make_tensor_value_info('y', TensorProto.FLOAT, [1, out_channels, time_length])],
+        initializer=[numpy_helper.from_array(weight, name='w')],
+    )
+    return helper.make_model(graph, opset_imports=[helper.make_opsetid('', 11)], ir_version=6)
+
+
+def conv(x: numpy.ndarray, weight: numpy.ndarray):
+    x = numpy.pad(x, [(0, 0), (0, 0), (1, 1)])
+    return numpy.stack([
+        numpy.einsum('oi,bit->bot', weight[:, :, k], x[:, :, k:k + x.shape[2] - 2])
+        for k in range(3)
+    ]).sum(axis=0)
+
+
+class OnnxPredictorTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / 'conv.onnx'
+        self.weight = numpy.random.RandomState(0).randn(4, 2, 3).astype(numpy.float32)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_call(self):
+        onnx.save(make_conv_model('time', self.weight), str(self.path))
+        predictor = OnnxPredictor(self.path)
+
+        for time_length in (128, 256):
+            x = numpy.random.rand(1, 2, time_length)
+            numpy.testing.assert_allclose(predictor(x).data, conv(x, self.weight), rtol=1e-4, atol=1e-5)
+
+    def test_make_time_dynamic(self):
+        onnx.save(make_time_dynamic(make_conv_model(128, self.weight)), str(self.path))
+        predictor = OnnxPredictor(self.path)
+
+        x = numpy.random.rand(1, 2, 384).astype(numpy.float32)
+        self.assertEqual(predictor(x).data.shape, (1, 4, 384))
+
+    def test_pickle(self):
+        onnx.save(make_conv_model('time', self.weight), str(self.path))
+        predictor = pickle.loads(pickle.dumps(OnnxPredictor(self.path)))
+
+        x = numpy.random.rand(1, 2, 128).astype(numpy.float32)
+        numpy.testing.assert_allclose(predictor(x).data, conv(x, self.weight), rtol=1e-4, atol=1e-5)
+
+    def test_recorder(self):
+        recorder = PredictorRecorder(lambda x: x * 2)
+        x = numpy.ones(3)
+        numpy.testing.assert_array_equal(recorder(x), x * 2)
+        self.assertEqual(len(recorder.inputs), 1)
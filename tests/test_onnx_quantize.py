@@ -0,0 +1,38 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+import numpy
+import onnx
+
+from realtime_voice_conversion.converter.onnx_predictor import OnnxPredictor
+from realtime_voice_conversion.converter.onnx_quantize import quantize_predictor, log_spectral_distance
+from test_onnx_predictor import make_conv_model
+
+
+class OnnxQuantizeTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.float_path = Path(self.directory.name) / 'conv.onnx'
+        self.quantized_path = Path(self.directory.name) / 'conv.int8.onnx'
+
+        weight = numpy.random.RandomState(0).randn(4, 2, 3).astype(numpy.float32)
+        onnx.save(make_conv_model('time', weight), str(self.float_path))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_quantize_predictor(self):
+        random = numpy.random.RandomState(1)
+        inputs = [random.rand(1, 2, time_length).astype(numpy.float32) for time_length in (128, 256, 384)]
+        quantize_predictor(self.float_path, self.quantized_path, inputs)
+
+        x = random.rand(1, 2, 256).astype(numpy.float32)
+        expected = OnnxPredictor(self.float_path)(x).data
+        actual = OnnxPredictor(self.quantized_path)(x).data
+        self.assertLess(numpy.abs(expected - actual).max(), numpy.abs(expected).max() * 0.05)
+
+    def test_log_spectral_distance(self):
+        sp = numpy.random.RandomState(0).rand(10, 513) + 0.1
+        self.assertEqual(log_spectral_distance(sp, sp), 0)
+        self.assertAlmostEqual(log_spectral_distance(sp * 10, sp), 10, places=5)
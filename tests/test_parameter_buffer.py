@@ -0,0 +1,72 @@
+from unittest import TestCase
+
+import numpy
+
+from realtime_voice_conversion.yukarin_wrapper.parameter_buffer import ParameterBuffer, ParameterBufferPool
+
+
+class ParameterBufferTest(TestCase):
+    def setUp(self):
+        self.buffer = ParameterBuffer(sp_size=5, ap_size=3)
+
+    def set_random(self, length: int):
+        random = numpy.random.RandomState(length)
+        f0 = random.rand(length, 1).astype(numpy.float32)
+        sp = random.rand(length, 5).astype(numpy.float32)
+        ap = random.rand(length, 3).astype(numpy.float32)
+        self.buffer.set(f0=f0, sp=sp, ap=ap)
+        return f0, sp, ap
+
+    def test_pointers(self):
+        f0, sp, ap = self.set_random(4)
+        self.assertEqual(self.buffer.length, 4)
+
+        numpy.testing.assert_allclose([self.buffer.f0_pointer[i] for i in range(4)], f0.ravel())
+        for i in range(4):
+            numpy.testing.assert_allclose([self.buffer.sp_pointer[i][j] for j in range(5)], sp[i])
+            numpy.testing.assert_allclose([self.buffer.ap_pointer[i][j] for j in range(3)], ap[i])
+
+    def test_grow(self):
+        self.set_random(4)
+        f0, sp, ap = self.set_random(10)
+        self.assertGreaterEqual(self.buffer.capacity, 10)
+        numpy.testing.assert_allclose([self.buffer.sp_pointer[9][j] for j in range(5)], sp[9])
+
+    def test_reuse(self):
+        self.set_random(10)
+        sp_pointer = self.buffer.sp_pointer
+        f0, sp, ap = self.set_random(4)
+        self.assertIs(self.buffer.sp_pointer, sp_pointer)
+        numpy.testing.assert_allclose([self.buffer.sp_pointer[3][j] for j in range(5)], sp[3])
+
+
+class ParameterBufferPoolTest(TestCase):
+    def test_cycle(self):
+        pool = ParameterBufferPool(number_of_pointers=3, sp_size=5, ap_size=3)
+        buffers = []
+        for i in range(4):
+            pool.release(i)
+            buffers.append(pool.current)
+            pool.commit()
+
+        self.assertEqual(len(set(map(id, buffers[:3]))), 3)
+        self.assertIs(buffers[3], buffers[0])
+
+    def test_full(self):
+        pool = ParameterBufferPool(number_of_pointers=3, sp_size=5, ap_size=3)
+        for _ in range(3):
+            self.assertFalse(pool.full)
+            pool.current
+            pool.commit()
+
+        self.assertTrue(pool.full)
+        with self.assertRaises(AssertionError):
+            pool.current
+
+        pool.release(1)
+        self.assertFalse(pool.full)
+        self.assertIs(pool.current, pool.buffers[0])
+
+    def test_not_committed(self):
+        pool = ParameterBufferPool(number_of_pointers=3, sp_size=5, ap_size=3)
+        self.assertIs(pool.current, pool.current)
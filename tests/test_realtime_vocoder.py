@@ -0,0 +1,66 @@
+from unittest import TestCase, mock
+
+import numpy
+from world4py.native import apidefinitions
+from yukarin.param import AcousticParam
+
+from realtime_voice_conversion.config import VocodeMode
+from realtime_voice_conversion.worker.warm_up import synthetic_feature
+from realtime_voice_conversion.yukarin_wrapper.vocoder import RealtimeVocoder
+
+
+class RealtimeVocoderTest(TestCase):
+    def setUp(self):
+        self.sampling_rate = 24000
+        self.number_of_pointers = 4
+        self.vocoder = RealtimeVocoder(
+            acoustic_param=AcousticParam(sampling_rate=self.sampling_rate),
+            out_sampling_rate=self.sampling_rate,
+            extract_f0_mode=VocodeMode.WORLD,
+        )
+        self.vocoder.create_synthesizer(buffer_size=1024, number_of_pointers=self.number_of_pointers)
+
+    def feature(self, time_length: float):
+        return synthetic_feature(sampling_rate=self.sampling_rate, time_length=time_length, frame_period=5)
+
+    def test_decode(self):
+        feature = self.feature(0.2)
+        length = sum(len(self.vocoder.decode(feature).wave) for _ in range(10))
+        self.assertGreater(length, 0)
+        self.assertLessEqual(length, 10 * len(feature.f0) * self.sampling_rate * 5 // 1000)
+
+    def test_queue_full(self):
+        feature = self.feature(0.1)
+        pool = self.vocoder._parameter_pool
+
+        with mock.patch.object(apidefinitions, '_Synthesis2', return_value=0):
+            for _ in range(self.number_of_pointers):
+                self.vocoder.decode(feature)
+            self.assertTrue(pool.full)
+            sp_pointers = [buffer.sp_pointer for buffer in pool.buffers]
+
+            # a longer feature would grow the buffer the synthesizer still refers to
+            with mock.patch.object(apidefinitions, '_AddParameters', return_value=0) as add_parameters:
+                self.vocoder.decode(self.feature(0.5))
+            add_parameters.assert_not_called()
+
+        self.assertEqual(self.vocoder._synthesizer.head_pointer, self.number_of_pointers)
+        self.assertEqual([buffer.sp_pointer for buffer in pool.buffers], sp_pointers)
+        for buffer in pool.buffers:
+            numpy.testing.assert_array_equal(buffer.sp[:buffer.length], feature.sp)
+
+        # the synthesizer releases slots as it synthesizes
+        wave = self.vocoder.decode(feature)
+        self.assertGreater(len(wave.wave), 0)
+        self.assertEqual(self.vocoder._synthesizer.head_pointer, self.number_of_pointers + 1)
+
+    def test_not_added(self):
+        feature = self.feature(0.1)
+        pool = self.vocoder._parameter_pool
+
+        with mock.patch.object(apidefinitions, '_AddParameters', return_value=0):
+            self.vocoder.decode(feature)
+        self.assertEqual(pool.head, 0)
+
+        self.vocoder.decode(feature)
+        self.assertEqual(pool.head, 1)
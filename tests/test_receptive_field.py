@@ -0,0 +1,73 @@
+from typing import Any
+from unittest import TestCase
+
+import numpy
+from become_yukarin.param import Param
+from yukarin import Wave
+from yukarin.acoustic_feature import AcousticFeature
+from yukarin.param import AcousticParam
+
+from realtime_voice_conversion.stream import ConvertStream
+from realtime_voice_conversion.stream.receptive_field import receptive_field_time, context_error
+from realtime_voice_conversion.yukarin_wrapper.voice_changer import AcousticFeatureWrapper
+
+
+class AttrDict(dict):
+    def __init__(self, *args, **kwargs):
+        super(AttrDict, self).__init__(*args, **kwargs)
+        self.__dict__ = self
+
+
+def smooth(x: numpy.ndarray, radius: int):
+    kernel = numpy.ones(radius * 2 + 1) / (radius * 2 + 1)
+    return numpy.apply_along_axis(lambda c: numpy.convolve(c, kernel, mode='same'), 0, x)
+
+
+class VoiceChangerMock(object):
+    def __init__(self, stage1_radius: int, stage2_radius: int):
+        self.acoustic_converter: Any = AttrDict(
+            config=AttrDict(dataset=AttrDict(acoustic_param=AcousticParam())),
+            convert=lambda f: AcousticFeature(f0=f.f0, mc=smooth(f.mc, stage1_radius)),
+        )
+        self.super_resolution: Any = AttrDict(
+            config=AttrDict(dataset=AttrDict(param=Param())),
+            convert=lambda sp: smooth(sp, stage2_radius),
+        )
+        self.output_sampling_rate = 24000
+
+    def convert_from_acoustic_feature(self, f_in: AcousticFeatureWrapper):
+        f_out = self.acoustic_converter.convert(f_in)
+        return AcousticFeature(
+            f0=f_out.f0,
+            sp=self.super_resolution.convert(numpy.exp(f_out.mc[:, :1])),
+        )
+
+
+class ReceptiveFieldTest(TestCase):
+    def setUp(self):
+        self.stream = ConvertStream(voice_changer=VoiceChangerMock(stage1_radius=3, stage2_radius=2))
+        self.rate = self.stream.in_segment_method.sampling_rate
+
+    def get_feature(self, time_length: float):
+        param = AcousticParam()
+        length = round(time_length * self.rate)
+        sizes = AcousticFeature.get_sizes(sampling_rate=param.sampling_rate, order=param.order)
+        feature = AcousticFeature.silent(length, sizes=sizes, keys=self.stream.in_segment_method.keys)
+        feature.mc = numpy.random.RandomState(0).normal(size=feature.mc.shape).astype(numpy.float32)
+        return AcousticFeatureWrapper(
+            wave=Wave(wave=numpy.zeros(round(time_length * param.sampling_rate)), sampling_rate=param.sampling_rate),
+            **feature.__dict__,
+        )
+
+    def test_receptive_field_time(self):
+        self.assertAlmostEqual(receptive_field_time(self.stream), (3 + 2) / self.rate)
+
+    def test_context_error(self):
+        feature = self.get_feature(time_length=3)
+        extra_time = receptive_field_time(self.stream)
+
+        error = context_error(self.stream, feature, time_length=1, extra_time=extra_time, full_extra_time=0.5)
+        self.assertLess(error, 1e-5)
+
+        error = context_error(self.stream, feature, time_length=1, extra_time=1 / self.rate, full_extra_time=0.5)
+        self.assertGreater(error, 1e-5)
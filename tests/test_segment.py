@@ -9,7 +9,7 @@ class DummySegmentMethod(BaseSegmentMethod[str]):
         super().__init__(sampling_rate=sampling_rate)
 
     def length(self, data: str) -> int:
-        raise NotImplementedError()
+        return len(data)
 
     def pad(self, width: int) -> str:
         raise NotImplementedError()
@@ -23,16 +23,25 @@ class DummySegmentMethod(BaseSegmentMethod[str]):
 
 class SegmentTest(TestCase):
     def setUp(self):
-        self.start_time = 1
-        self.data = ''
-        self.method = DummySegmentMethod(sampling_rate=1)
+        self.start = 10
+        self.data = 'abcde'
+        self.method = DummySegmentMethod(sampling_rate=10)
         self.segment = Segment(
-            start_time=self.start_time,
+            start=self.start,
             data=self.data,
             method=self.method,
         )
 
     def test(self):
-        self.assertEqual(self.start_time, self.segment.start_time)
+        self.assertEqual(self.start, self.segment.start)
         self.assertEqual(self.data, self.segment.data)
         self.assertEqual(self.method, self.segment.method)
+
+    def test_end(self):
+        self.assertEqual(self.segment.end, 15)
+        self.assertEqual(self.segment.length, 5)
+
+    def test_time(self):
+        self.assertEqual(self.segment.start_time, 1)
+        self.assertEqual(self.segment.end_time, 1.5)
+        self.assertEqual(self.segment.time_length, 0.5)
@@ -0,0 +1,68 @@
+from typing import Iterable
+from unittest import TestCase
+
+from realtime_voice_conversion.segment.segment import BaseSegmentMethod, Segment
+from realtime_voice_conversion.segment.segment_index import SegmentIndex
+
+
+class TestSegmentMethod(BaseSegmentMethod[str]):
+    def length(self, data: str) -> int:
+        return len(data)
+
+    def pad(self, width: int) -> str:
+        return ' ' * width
+
+    def pick(self, data: str, first: int, last: int) -> str:
+        return data[first:last]
+
+    def concat(self, datas: Iterable[str]) -> str:
+        return ''.join(datas)
+
+
+class SegmentIndexTest(TestCase):
+    def setUp(self):
+        self.method = TestSegmentMethod(sampling_rate=1)
+        self.index = SegmentIndex()
+
+    def add(self, start: int, length: int):
+        self.index.add(Segment(start=start, data='a' * length, method=self.method))
+
+    def overlap(self, start: int, end: int):
+        return [(s.start, s.end) for s in self.index.overlap(start=start, end=end)]
+
+    def test_overlap(self):
+        self.add(start=0, length=1)
+        self.add(start=1, length=1)
+        self.add(start=2, length=1)
+
+        self.assertEqual(self.overlap(0, 2), [(0, 1), (1, 2)])
+        self.assertEqual(self.overlap(1, 1), [])
+        self.assertEqual(self.overlap(3, 4), [])
+        self.assertEqual(self.overlap(-1, 0), [])
+
+    def test_overlap_nested(self):
+        self.add(start=0, length=10)
+        self.add(start=1, length=1)
+        self.add(start=5, length=1)
+
+        self.assertEqual(self.overlap(3, 4), [(0, 10)])
+        self.assertEqual(self.overlap(5, 7), [(0, 10), (5, 6)])
+
+    def test_add_unordered(self):
+        self.add(start=2, length=1)
+        self.add(start=0, length=1)
+        self.add(start=1, length=1)
+
+        self.assertEqual([s.start for s in self.index], [0, 1, 2])
+
+    def test_remove(self):
+        self.add(start=0, length=10)
+        self.add(start=1, length=1)
+        self.add(start=2, length=1)
+
+        self.index.remove(end=2)
+        self.assertEqual([(s.start, s.end) for s in self.index], [(0, 10), (2, 3)])
+        self.assertEqual(self.overlap(2, 3), [(0, 10), (2, 3)])
+
+        self.index.remove(end=10)
+        self.assertEqual(len(self.index), 0)
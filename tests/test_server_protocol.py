@@ -0,0 +1,40 @@
+import socket
+from unittest import TestCase
+
+import numpy
+
+from realtime_voice_conversion.server.protocol import SessionInfo, send_info, receive_info, send_chunk, receive_chunk
+
+
+class ProtocolTest(TestCase):
+    def setUp(self):
+        self.server, self.client = socket.socketpair()
+
+    def tearDown(self):
+        self.server.close()
+        self.client.close()
+
+    def test_info(self):
+        info = SessionInfo(input_rate=24000, output_rate=24000, in_audio_chunk=12000, out_audio_chunk=12000)
+        send_info(self.server, info)
+        self.assertEqual(receive_info(self.client), info)
+
+    def test_chunk(self):
+        wave = numpy.random.rand(12000).astype(numpy.float32)
+        send_chunk(self.client, 3, wave)
+        index, received = receive_chunk(self.server, chunk_length=12000)
+        self.assertEqual(index, 3)
+        numpy.testing.assert_array_equal(received, wave)
+
+    def test_silent_chunk(self):
+        send_chunk(self.client, 4, None)
+        self.assertEqual(receive_chunk(self.server, chunk_length=12000), (4, None))
+
+    def test_closed(self):
+        self.client.close()
+        self.assertIsNone(receive_chunk(self.server, chunk_length=12000))
+
+    def test_wrong_length(self):
+        send_chunk(self.client, 5, numpy.zeros(100, dtype=numpy.float32))
+        with self.assertRaises(ValueError):
+            receive_chunk(self.server, chunk_length=12000)
@@ -0,0 +1,53 @@
+from pathlib import Path
+from unittest import TestCase, mock
+
+import numpy
+from become_yukarin.param import Param
+from yukarin.param import AcousticParam
+
+from realtime_voice_conversion.config import Config
+from realtime_voice_conversion.server.session import Session
+from test_convert_stream import AttrDict
+
+
+class SessionTest(TestCase):
+    def setUp(self):
+        self.config = Config.from_yaml(Path('./config.yaml'))._replace(
+            buffer_time=0.25,
+            input_gate_threshold=60,
+        )
+        self.model_lock = mock.MagicMock()
+
+        # the models have no method, so a chunk reaching them fails
+        self.session = Session(
+            config=self.config,
+            acoustic_converter=AttrDict(
+                config=AttrDict(
+                    dataset=AttrDict(
+                        acoustic_param=AcousticParam(sampling_rate=self.config.input_rate),
+                    ),
+                ),
+            ),
+            super_resolution=AttrDict(
+                config=AttrDict(
+                    dataset=AttrDict(
+                        param=Param(),
+                    ),
+                ),
+            ),
+            model_lock=self.model_lock,
+        )
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_silent_input(self):
+        for _ in range(8):
+            out_wave = self.session.process(numpy.zeros(self.config.in_audio_chunk, dtype=numpy.float32))
+            self.assertIsNone(out_wave)
+        self.model_lock.__enter__.assert_not_called()
+
+    def test_close(self):
+        self.session.close()
+        self.assertIsNone(self.session.realtime_vocoder._synthesizer)
+        self.session.close()
@@ -0,0 +1,61 @@
+from multiprocessing import Process
+from unittest import TestCase
+
+import numpy
+
+from realtime_voice_conversion.worker.shared_memory_queue import SharedMemoryQueue
+from realtime_voice_conversion.worker.utility import Item
+
+
+def _double(queue_input: SharedMemoryQueue, queue_output: SharedMemoryQueue):
+    item: Item = queue_input.get()
+    item.item = item.item * 2
+    queue_output.put(item)
+
+
+class SharedMemoryQueueTest(TestCase):
+    def setUp(self):
+        self.queue = SharedMemoryQueue(slot_size=1024, num_slot=2)
+
+    def tearDown(self):
+        self.queue.close()
+
+    def test_put_get(self):
+        for i in range(5):
+            array = numpy.arange(10, dtype=numpy.float32) + i
+            self.queue.put(Item(item=dict(a=array, b=None, c=array[::2]), index=i))
+            item: Item = self.queue.get()
+
+            self.assertEqual(item.index, i)
+            numpy.testing.assert_equal(item.item['a'], array)
+            numpy.testing.assert_equal(item.item['c'], array[::2])
+            self.assertIsNone(item.item['b'])
+
+            item.item['a'][0] = -1  # writable
+
+    def test_larger_than_slot(self):
+        array = numpy.arange(1000, dtype=numpy.float64)
+        self.queue.put(Item(item=array, index=0))
+        numpy.testing.assert_equal(self.queue.get().item, array)
+
+    def test_no_free_slot(self):
+        arrays = [numpy.arange(10, dtype=numpy.float32) + i for i in range(3)]
+        for i, array in enumerate(arrays):
+            self.queue.put(Item(item=array, index=i))
+
+        for i, array in enumerate(arrays):
+            item: Item = self.queue.get(timeout=10)
+            self.assertEqual(item.index, i)
+            numpy.testing.assert_equal(item.item, array)
+
+    def test_between_processes(self):
+        queue_output = SharedMemoryQueue(slot_size=1024, num_slot=2)
+        process = Process(target=_double, kwargs=dict(queue_input=self.queue, queue_output=queue_output))
+        process.start()
+
+        array = numpy.arange(10, dtype=numpy.float32)
+        self.queue.put(Item(item=array, index=0))
+        numpy.testing.assert_equal(queue_output.get(timeout=10).item, array * 2)
+
+        process.join()
+        queue_output.close()
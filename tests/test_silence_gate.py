@@ -0,0 +1,19 @@
+from unittest import TestCase
+
+from realtime_voice_conversion.worker.utility import SilenceGate
+
+
+class SilenceGateTest(TestCase):
+    def test_no_context(self):
+        gate = SilenceGate(time_length=0.5, context_time=0)
+        silents = [gate.update(index=i, voiced=v) for i, v in enumerate([False, True, False, False])]
+        self.assertEqual(silents, [True, False, True, True])
+
+    def test_context(self):
+        gate = SilenceGate(time_length=0.5, context_time=0.6)
+        silents = [gate.update(index=i, voiced=v) for i, v in enumerate([False, True, False, False, False, False])]
+        self.assertEqual(silents, [True, False, False, False, True, True])
+
+    def test_exact_context(self):
+        gate = SilenceGate(time_length=0.1, context_time=0.3)
+        self.assertEqual(gate.context, 3)
@@ -0,0 +1,135 @@
+from typing import Iterable, Optional
+from unittest import TestCase
+
+import numpy
+
+from realtime_voice_conversion.segment.segment import BaseSegmentMethod
+from realtime_voice_conversion.segment.wave_segment import WaveSegmentMethod
+from realtime_voice_conversion.stream.base_stream import BaseStream
+from realtime_voice_conversion.stream.stream_wrapper import StreamWrapper
+
+
+class TestSegmentMethod(BaseSegmentMethod[str]):
+    def length(self, data: str) -> int:
+        return len(data)
+
+    def pad(self, width: int) -> str:
+        return ' ' * width
+
+    def pick(self, data: str, first: int, last: int) -> str:
+        return data[first:last]
+
+    def concat(self, datas: Iterable[str]) -> str:
+        return ''.join(datas)
+
+
+class Stream(BaseStream):
+    def process(
+            self,
+            start_time: float,
+            time_length: float,
+            extra_time: float,
+            future_extra_time: Optional[float] = None,
+    ):
+        return self.fetch(
+            start_time=start_time,
+            time_length=time_length,
+            extra_time=extra_time,
+            future_extra_time=future_extra_time,
+        )
+
+
+class StreamWrapperTest(TestCase):
+    def setUp(self):
+        self.rate = 10
+        self.stream = Stream(
+            in_segment_method=TestSegmentMethod(sampling_rate=self.rate),
+            out_segment_method=TestSegmentMethod(sampling_rate=self.rate),
+        )
+
+    def test_process_next(self):
+        stream_wrapper = StreamWrapper(stream=self.stream, extra_time=0)
+        stream_wrapper.add(data='a' * self.rate, time_length=1)
+        stream_wrapper.add(data='b' * self.rate, time_length=1)
+
+        self.assertEqual(stream_wrapper.process_next(time_length=1), 'a' * self.rate)
+        self.assertEqual(stream_wrapper.process_next(time_length=1), 'b' * self.rate)
+
+    def test_process_next_with_extra(self):
+        stream_wrapper = StreamWrapper(stream=self.stream, extra_time=0.2)
+        stream_wrapper.add(data='a' * self.rate, time_length=1)
+        stream_wrapper.add(data='b' * self.rate, time_length=1)
+
+        self.assertEqual(stream_wrapper.process_next(time_length=1), ' ' * 4 + 'a' * 10)
+        self.assertEqual(stream_wrapper.process_next(time_length=1), 'a' * 4 + 'b' * 10)
+
+    def test_process_next_with_past_extra(self):
+        stream_wrapper = StreamWrapper(stream=self.stream, extra_time=0.2, future_extra_time=0)
+        stream_wrapper.add(data='a' * self.rate, time_length=1)
+        self.assertEqual(stream_wrapper.process_next(time_length=1), ' ' * 2 + 'a' * 10)
+
+        stream_wrapper.add(data='b' * self.rate, time_length=1)
+        self.assertEqual(stream_wrapper.process_next(time_length=1), 'a' * 2 + 'b' * 10)
+
+    def test_process_next_with_future_extra(self):
+        stream_wrapper = StreamWrapper(stream=self.stream, extra_time=0, future_extra_time=0.2)
+        stream_wrapper.add(data='a' * self.rate, time_length=1)
+        self.assertEqual(stream_wrapper.process_next(time_length=1), ' ' * 2 + 'a' * 10)
+
+        stream_wrapper.add(data='b' * self.rate, time_length=1)
+        self.assertEqual(stream_wrapper.process_next(time_length=1), 'a' * 2 + 'b' * 10)
+
+    def test_silent_span(self):
+        stream_wrapper = StreamWrapper(stream=self.stream, extra_time=0.2)
+        stream_wrapper.add(data='a' * self.rate, time_length=1)
+        stream_wrapper.add(data=None, time_length=1)
+        stream_wrapper.add(data='c' * self.rate, time_length=1)
+
+        self.assertEqual(stream_wrapper.process_next(time_length=1), ' ' * 4 + 'a' * 10)
+        stream_wrapper.skip_next(time_length=1)
+        self.assertEqual(stream_wrapper.process_next(time_length=1), ' ' * 4 + 'c' * 10)
+
+    def test_process_span(self):
+        stream_wrapper = StreamWrapper(stream=self.stream, extra_time=0)
+        for c in 'abcd':
+            stream_wrapper.add(data=c * self.rate, time_length=1)
+
+        self.assertEqual(stream_wrapper.process_span(position=1, count=3, time_length=1), [
+            'b' * self.rate,
+            'c' * self.rate,
+            'd' * self.rate,
+        ])
+        self.assertEqual(stream_wrapper.current_time, 4)
+
+    def test_context_time(self):
+        stream_wrapper = StreamWrapper(stream=self.stream, extra_time=0.2, future_extra_time=0.1)
+        self.assertAlmostEqual(stream_wrapper.context_time, 0.3)
+
+    def test_no_drift(self):
+        stream_wrapper = StreamWrapper(stream=self.stream, extra_time=0)
+        for _ in range(100000):
+            stream_wrapper.add(data='a', time_length=0.1)
+        self.assertEqual(list(self.stream.stream)[-1].start, 99999)
+
+    def test_retention(self):
+        stream_wrapper = StreamWrapper(stream=self.stream, extra_time=0.5)
+        for _ in range(10):
+            stream_wrapper.add(data='a' * self.rate, time_length=1)
+            stream_wrapper.process_next(time_length=1)
+        self.assertEqual(len(self.stream.stream), 1)
+        self.assertEqual(self.stream.buffered_time, 1)
+
+    def test_retention_time(self):
+        stream_wrapper = StreamWrapper(stream=self.stream, extra_time=0.5, retention_time=3)
+        for _ in range(10):
+            stream_wrapper.add(data='a' * self.rate, time_length=1)
+            stream_wrapper.process_next(time_length=1)
+        self.assertEqual(len(self.stream.stream), 4)
+
+    def test_buffered_nbytes(self):
+        method = WaveSegmentMethod(sampling_rate=self.rate)
+        stream = Stream(in_segment_method=method, out_segment_method=method)
+        stream.add(start_time=0, data=numpy.zeros(self.rate, dtype=numpy.float32))
+        stream.add(start_time=1, data=numpy.zeros(self.rate, dtype=numpy.float32))
+        self.assertEqual(stream.buffered_time, 2)
+        self.assertEqual(stream.buffered_nbytes, self.rate * 2 * 4)
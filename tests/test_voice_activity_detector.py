@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+import numpy
+
+from realtime_voice_conversion.vad.voice_activity_detector import VoiceActivityDetector, STFT_POWER_OFFSET
+
+
+class VoiceActivityDetectorTest(TestCase):
+    def setUp(self):
+        self.frame_length = 100
+
+    def create(self, hangover=0):
+        return VoiceActivityDetector(threshold=-40, frame_length=self.frame_length, hysteresis=6, hangover=hangover)
+
+    def wave(self, levels):
+        """
+        constant frames with the given levels.
+        """
+        amplitudes = [10 ** ((level - STFT_POWER_OFFSET) / 20) for level in levels]
+        return numpy.repeat(amplitudes, self.frame_length).astype(numpy.float32)
+
+    def test_levels(self):
+        detector = self.create()
+        numpy.testing.assert_allclose(detector.levels(self.wave([-60, -30])), [-60, -30], atol=1e-3)
+
+    def test_silent(self):
+        detector = self.create()
+        self.assertFalse(detector.process(numpy.zeros(1000, dtype=numpy.float32)))
+
+    def test_hysteresis(self):
+        detector = self.create()
+        active = detector.activities(self.wave([-50, -30, -44, -50, -44, -30]))
+        numpy.testing.assert_equal(active, [False, True, True, False, False, True])
+
+    def test_hangover(self):
+        detector = self.create(hangover=2)
+        active = detector.activities(self.wave([-30, -60, -60, -60, -60]))
+        numpy.testing.assert_equal(active, [True, True, True, False, False])
+
+    def test_streaming(self):
+        levels = [-50, -30, -44, -60, -60, -60, -30, -60, -44, -60]
+        target = self.create(hangover=2).activities(self.wave(levels))
+
+        detector = self.create(hangover=2)
+        wave = self.wave(levels)
+        outputs = [detector.activities(wave[i:i + 150]) for i in range(0, len(wave), 150)]
+        numpy.testing.assert_equal(numpy.concatenate(outputs), target)
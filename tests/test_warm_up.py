@@ -0,0 +1,41 @@
+from unittest import TestCase
+
+import numpy
+
+from realtime_voice_conversion.stream.stream_wrapper import StreamWrapper
+from realtime_voice_conversion.vad.voice_activity_detector import VoiceActivityDetector
+from realtime_voice_conversion.worker.warm_up import synthetic_voice, synthetic_feature, warm_up_stream
+from test_stream_wrapper import TestSegmentMethod, Stream
+
+
+class RecordingStream(Stream):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.outputs = []
+
+    def process(self, *args, **kwargs):
+        data = super().process(*args, **kwargs)
+        self.outputs.append(data)
+        return data
+
+
+class WarmUpTest(TestCase):
+    def test_synthetic_voice(self):
+        wave = synthetic_voice(sampling_rate=24000, time_length=0.5)
+        self.assertEqual(len(wave), 12000)
+        self.assertAlmostEqual(numpy.abs(wave).max(), 0.1, places=5)
+        self.assertTrue(VoiceActivityDetector(threshold=-60).process(wave))
+
+    def test_synthetic_feature(self):
+        feature = synthetic_feature(sampling_rate=24000, time_length=0.5, frame_period=5)
+        self.assertGreaterEqual(len(feature.f0), 100)
+        self.assertEqual(feature.sp.shape, (len(feature.f0), 513))
+        self.assertGreater(feature.voiced.mean(), 0.9)
+
+    def test_warm_up_stream(self):
+        method = TestSegmentMethod(sampling_rate=10)
+        stream = RecordingStream(in_segment_method=method, out_segment_method=method)
+        stream_wrapper = StreamWrapper(stream=stream, extra_time=0)
+
+        warm_up_stream(stream_wrapper, 'a' * 10 + 'b' * 10 + 'c' * 10, time_length=1, num_chunk=3)
+        self.assertEqual(stream.outputs, ['a' * 10, 'b' * 10, 'c' * 10])